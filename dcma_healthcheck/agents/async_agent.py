@@ -0,0 +1,363 @@
+"""Asyncio-based OpenAI agent for interpreting many schedules concurrently."""
+import asyncio
+import random
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Tuple, Type, Union
+from openai import (
+    APIConnectionError, APIStatusError, APITimeoutError, AsyncOpenAI, InternalServerError, RateLimitError,
+)
+from ..analyzers.dcma_analyzer import DCMAAnalyzer
+from ..config.openai_config import OpenAIConfig
+from ..prompts.dcma_prompts import SYSTEM_PROMPT
+from ..prompts.prompt_builder import PromptBuilder, point_info, source_key
+from ..models.check_result import result_status
+from ..models.dcma_models import DCMAAnalysisResponse, DCMAPointAnalysis, DCMARecommendation
+from .response_cache import ResponseCache
+from .stream_parser import ResponseEvent, ResponseStreamParser, response_events
+
+# (schedule path, parsed response or {'error': message})
+Interpretation = Tuple[str, Union[DCMAAnalysisResponse, Dict[str, str]]]
+
+# Implementation steps of more urgent points come first in a merged plan
+PRIORITY_ORDER = ('HIGH', 'MEDIUM', 'LOW')
+
+# Failures worth another attempt; other API errors (bad request, auth) are final
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError, asyncio.TimeoutError)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the server asked us to wait, from a ``Retry-After`` header."""
+    if not isinstance(error, APIStatusError):
+        return None
+    value = error.response.headers.get('retry-after')
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def merge_point_analyses(analysis_results: Dict[str, Any],
+                         analyses: Mapping[int, DCMAPointAnalysis]) -> DCMAAnalysisResponse:
+    """Assemble the full response from per-point answers, without another LLM call.
+
+    ``analyses`` maps failed point numbers to their ``DCMAPointAnalysis``.
+    Counts, statuses, thresholds and values come from ``analysis_results``
+    rather than the model. A failed point without an answer gets its
+    standard guidance (see ``point_info``) at MEDIUM priority, marked as a
+    ``fallback`` and listed in the risk assessment; N/A points need no
+    action, like passed ones. Implementation steps are
+    ordered by priority, then point number.
+    """
+    summary = analysis_results['summary']
+    recommendations = []
+    steps = []
+    risks = []
+    failed_names = []
+    fallbacks = []
+    for result in analysis_results['results']:
+        point = result['point']
+        info = point_info(result)
+        facts = {
+            'point_number': point,
+            'point_name': info['name'],
+            'status': result_status(result),
+            'threshold': str(result['threshold']),
+            'actual_value': str(result['value']),
+        }
+        if result['passed'] is not False:
+            recommendations.append(DCMARecommendation(recommendation="No action required.", priority="LOW", **facts))
+            continue
+        failed_names.append(f"Point {point} ({facts['point_name']})")
+        analysis = analyses.get(point)
+        if analysis is None:
+            recommendations.append(DCMARecommendation(recommendation=info['recommendation'],
+                                                      priority="MEDIUM", fallback=True, **facts))
+            fallbacks.append(f"Point {point} ({facts['point_name']})")
+            continue
+        recommendation = analysis.recommendation.model_copy(update=dict(facts, fallback=False))
+        recommendations.append(recommendation)
+        priority = (recommendation.priority or '').upper()
+        rank = PRIORITY_ORDER.index(priority) if priority in PRIORITY_ORDER else len(PRIORITY_ORDER)
+        steps.extend((rank, point, f"Point {point}: {step}") for step in analysis.implementation_steps)
+        risks.append(f"Point {point} ({facts['point_name']}): {analysis.risk_assessment}")
+    
+    if fallbacks:
+        risks.append(f"No model answer for {', '.join(fallbacks)}; standard guidance is shown instead.")
+    
+    executive_summary = (f"{summary['passed_checks']} of {summary['total_checks']} DCMA checks passed "
+                         f"({summary['overall_pass_rate']}).")
+    if failed_names:
+        executive_summary += f" Failed: {', '.join(failed_names)}."
+    if summary.get('not_applicable_checks'):
+        executive_summary += f" Not applicable: {summary['not_applicable_checks']}."
+    return DCMAAnalysisResponse(
+        executive_summary=executive_summary,
+        overall_health_score=summary['overall_pass_rate'],
+        total_checks=summary['total_checks'],
+        passed_checks=summary['passed_checks'],
+        failed_checks=summary['failed_checks'],
+        recommendations=recommendations,
+        implementation_plan=[step for _, _, step in sorted(steps, key=lambda entry: entry[:2])],
+        risk_assessment="\n".join(risks) if risks else "No failed checks."
+    )
+
+
+class AsyncDCMAAgent:
+    """Asynchronous counterpart of ``DCMAAgent`` for portfolio runs.
+
+    All requests share one ``AsyncOpenAI`` client and so its pool of
+    keep-alive HTTP connections; at most ``max_concurrency`` schedules are analyzed and
+    interpreted at a time, and at most ``max_requests`` (default
+    ``max_concurrency``) requests are in flight, however many points
+    ``analyze_by_point`` fans out to. Each request gets ``timeout`` seconds, and
+    rate-limit, timeout, connection and server errors are retried up to
+    ``max_retries`` times with exponential backoff and full jitter, never
+    sooner than a ``Retry-After`` header asks. The endpoint comes from
+    ``OpenAIConfig`` (``OPENAI_BASE_URL``), so a local mock server can
+    stand in for the API.
+    """
+    
+    def __init__(self, analyzer: Optional[DCMAAnalyzer] = None, cache: Optional[ResponseCache] = None,
+                 max_concurrency: int = 8, timeout: float = 120.0, max_retries: int = 5,
+                 backoff: float = 1.0, max_backoff: float = 60.0,
+                 prompt_builder: Optional[PromptBuilder] = None, max_requests: Optional[int] = None):
+        """Initialize the agent with a shared async OpenAI client."""
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        if max_requests is not None and max_requests < 1:
+            raise ValueError(f"max_requests must be at least 1, got {max_requests}")
+        self.config = OpenAIConfig()
+        if not self.config.validate():
+            raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
+        
+        self.client = AsyncOpenAI(
+            api_key=self.config.get_api_key(),
+            base_url=self.config.get_base_url(),
+            max_retries=0,  # retried here, with jitter and the shared semaphore
+        )
+        self.analyzer = analyzer or DCMAAnalyzer()
+        self.cache = cache
+        self.prompt_builder = prompt_builder or PromptBuilder(self.config.prompt_tokens)
+        self.max_concurrency = max_concurrency
+        self.max_requests = max_requests or max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._semaphore: Optional[asyncio.BoundedSemaphore] = None
+        self._request_semaphore: Optional[asyncio.BoundedSemaphore] = None
+    
+    async def __aenter__(self) -> 'AsyncDCMAAgent':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self.client.close()
+    
+    def _limit(self) -> asyncio.BoundedSemaphore:
+        # Created on first use so it belongs to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.BoundedSemaphore(self.max_concurrency)
+        return self._semaphore
+    
+    def _request_limit(self) -> asyncio.BoundedSemaphore:
+        # Separate from the schedule slots, which a schedule holds across all its point requests
+        if self._request_semaphore is None:
+            self._request_semaphore = asyncio.BoundedSemaphore(self.max_requests)
+        return self._request_semaphore
+    
+    def _delay(self, attempt: int, error: Exception) -> float:
+        """Jittered exponential backoff, at least the server's ``Retry-After``."""
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        retry_after = _retry_after(error)
+        return max(delay, retry_after) if retry_after is not None else delay
+    
+    async def _request(self, messages: List[Dict[str, str]],
+                       response_format: Type[Any] = DCMAAnalysisResponse) -> Any:
+        """Send one analysis request, retrying transient failures.
+
+        Each attempt waits for one of the ``max_requests`` request slots; the
+        slot is released while backing off.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._request_limit():
+                    response = await asyncio.wait_for(self.client.beta.chat.completions.parse(
+                        model=self.config.model,
+                        messages=messages,
+                        response_format=response_format,
+                        temperature=self.config.temperature,
+                        max_tokens=self.config.max_tokens
+                    ), self.timeout)
+                return response.choices[0].message.parsed
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self._delay(attempt, e))
+                attempt += 1
+    
+    async def _prepare(self, csv_file_path: str
+                       ) -> Tuple[List[Dict[str, str]], Optional[str], Optional[DCMAAnalysisResponse]]:
+        """Messages for the LLM request, its response cache key and any cached response."""
+        prompt_key = source_key(csv_file_path, self.analyzer.computed_float)
+        prompt = self.prompt_builder.lookup(prompt_key)
+        if prompt is None:
+            loop = asyncio.get_running_loop()
+            # The checks are CPU-bound; keep them off the event loop
+            wbs_index: Dict[str, str] = {}
+            analysis_results = await loop.run_in_executor(
+                None, lambda: self.analyzer.process_csv_file(csv_file_path, wbs_index=wbs_index))
+            if "error" in analysis_results:
+                raise ValueError(f"Analysis failed: {analysis_results['error']}")
+            prompt = self.prompt_builder.build(analysis_results, wbs_index, prompt_key)
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(self.config.model, SYSTEM_PROMPT, prompt,
+                                       self.config.temperature, self.config.max_tokens)
+            cached = self.cache.load(cache_key)
+            if cached is not None:
+                return [], cache_key, cached
+        
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+        return messages, cache_key, None
+    
+    async def analyze_with_llm(self, csv_file_path: str) -> DCMAAnalysisResponse:
+        """Analyze schedule and get LLM interpretation."""
+        async with self._limit():
+            messages, cache_key, cached = await self._prepare(csv_file_path)
+            if cached is not None:
+                return cached
+            
+            try:
+                parsed = await self._request(messages)
+            except Exception as e:
+                raise RuntimeError(f"Error communicating with OpenAI: {str(e)}")
+            
+            if cache_key is not None and parsed is not None:
+                self.cache.store(cache_key, parsed)
+            return parsed
+    
+    async def stream_with_llm(self, csv_file_path: str) -> AsyncIterator[ResponseEvent]:
+        """Analyze schedule and stream the LLM interpretation while it is generated.
+
+        Yields the same ``(field, value)`` events as ``DCMAAgent.stream_with_llm``,
+        ending with ``('response', DCMAAnalysisResponse)``. Failures are
+        retried like ``analyze_with_llm`` only until the first event has been
+        yielded; ``timeout`` then bounds the wait for each chunk.
+        """
+        async with self._limit():
+            messages, cache_key, cached = await self._prepare(csv_file_path)
+            if cached is not None:
+                for event in response_events(cached):
+                    yield event
+                yield 'response', cached
+                return
+            
+            attempt = 0
+            started = False
+            while True:
+                parser = ResponseStreamParser()
+                try:
+                    async with self.client.beta.chat.completions.stream(
+                        model=self.config.model,
+                        messages=messages,
+                        response_format=DCMAAnalysisResponse,
+                        temperature=self.config.temperature,
+                        max_tokens=self.config.max_tokens,
+                        timeout=self.timeout
+                    ) as stream:
+                        async for event in stream:
+                            if event.type == 'content.delta':
+                                for parsed_event in parser.feed(event.delta):
+                                    started = True
+                                    yield parsed_event
+                        parsed = (await stream.get_final_completion()).choices[0].message.parsed
+                    break
+                except RETRYABLE_ERRORS as e:
+                    if started or attempt >= self.max_retries:
+                        raise RuntimeError(f"Error communicating with OpenAI: {str(e)}")
+                    await asyncio.sleep(self._delay(attempt, e))
+                    attempt += 1
+                except Exception as e:
+                    raise RuntimeError(f"Error communicating with OpenAI: {str(e)}")
+            
+            if cache_key is not None and parsed is not None:
+                self.cache.store(cache_key, parsed)
+            yield 'response', parsed
+    
+    async def analyze_by_point(self, csv_file_path: str) -> DCMAAnalysisResponse:
+        """Analyze schedule and interpret each failed point with its own request.
+
+        The requests for all failed points (see ``PromptBuilder.build_point``)
+        run concurrently and are combined by ``merge_point_analyses``, so the
+        wait is that of the slowest point rather than one answer covering
+        all of them. They share the schedule's ``max_concurrency`` slot and
+        queue for the agent-wide ``max_requests`` request slots. A point
+        whose request fails falls back to its standard guidance, marked as
+        ``fallback`` in the response; only if every point fails is an error
+        raised. The merged response is
+        cached under the point prompts.
+        """
+        async with self._limit():
+            loop = asyncio.get_running_loop()
+            wbs_index: Dict[str, str] = {}
+            analysis_results = await loop.run_in_executor(
+                None, lambda: self.analyzer.process_csv_file(csv_file_path, wbs_index=wbs_index))
+            if "error" in analysis_results:
+                raise ValueError(f"Analysis failed: {analysis_results['error']}")
+            
+            prompts = {result['point']: self.prompt_builder.build_point(result, wbs_index)
+                       for result in analysis_results['results'] if result['passed'] is False}
+            cache_key = None
+            if self.cache is not None and prompts:
+                cache_key = self.cache.key(self.config.model, SYSTEM_PROMPT, "\n\n".join(prompts.values()),
+                                           self.config.temperature, self.config.max_tokens)
+                cached = self.cache.load(cache_key)
+                if cached is not None:
+                    return cached
+            
+            points = list(prompts)
+            answers = await asyncio.gather(*(self._request([
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompts[point]}
+            ], DCMAPointAnalysis) for point in points), return_exceptions=True)
+            errors = [answer for answer in answers if isinstance(answer, BaseException)]
+            if errors and len(errors) == len(answers):
+                raise RuntimeError(f"Error communicating with OpenAI: {str(errors[0])}")
+            
+            analyses = {point: answer for point, answer in zip(points, answers)
+                        if isinstance(answer, DCMAPointAnalysis)}
+            parsed = merge_point_analyses(analysis_results, analyses)
+            if cache_key is not None and not errors:
+                self.cache.store(cache_key, parsed)
+            return parsed
+    
+    async def _interpret(self, path: str, by_point: bool = False) -> Interpretation:
+        try:
+            if by_point:
+                return path, await self.analyze_by_point(path)
+            return path, await self.analyze_with_llm(path)
+        except Exception as e:
+            return path, {"error": str(e)}
+    
+    async def interpret_many(self, paths: Iterable[str], by_point: bool = False) -> AsyncIterator[Interpretation]:
+        """Yield ``(path, response)`` for each schedule as soon as it completes.
+
+        A schedule that fails yields ``(path, {'error': message})`` instead,
+        without affecting the others. With ``by_point`` each schedule is
+        interpreted by ``analyze_by_point``.
+        """
+        tasks = [asyncio.ensure_future(self._interpret(path, by_point)) for path in paths]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
\ No newline at end of file
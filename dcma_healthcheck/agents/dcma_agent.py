@@ -1,17 +1,33 @@
 """OpenAI-based agent for DCMA schedule analysis."""
-from typing import Dict, Any
-from openai import OpenAI
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Tuple
 from ..analyzers.dcma_analyzer import DCMAAnalyzer
 from ..config.openai_config import OpenAIConfig
-from ..prompts.dcma_prompts import SYSTEM_PROMPT, ANALYSIS_PROMPT, INTERPRETATION_PROMPT
-from ..models.dcma_models import DCMAAnalysisResponse
+from ..prompts.dcma_prompts import SYSTEM_PROMPT, DCMA_POINTS
+from ..prompts.prompt_builder import PromptBuilder, source_key
+from .response_cache import ResponseCache
+from .stream_parser import ResponseEvent, ResponseStreamParser, response_events
+
+if TYPE_CHECKING:
+    from ..models.dcma_models import DCMAAnalysisResponse
 
 
 class DCMAAgent:
     """OpenAI agent wrapper for DCMA analysis."""
     
-    def __init__(self):
-        """Initialize the agent with OpenAI client."""
+    def __init__(self, analyzer: Optional[DCMAAnalyzer] = None, cache: Optional[ResponseCache] = None,
+                 prompt_builder: Optional[PromptBuilder] = None):
+        """Initialize the agent with OpenAI client.
+        
+        Pass an ``analyzer`` to reuse its configuration, e.g. a
+        ``DCMAAnalyzer(cache=SnapshotCache(...))`` so repeated runs on the
+        same export skip parsing. With a ``ResponseCache`` an identical
+        request (same model, prompts and sampling settings) is answered
+        from disk instead of the API. ``prompt_builder`` compacts the
+        analysis into the prompt; by default to ``OPENAI_PROMPT_TOKENS``.
+        The ``openai`` package is imported here rather than with the module.
+        """
+        from openai import OpenAI
+        
         self.config = OpenAIConfig()
         if not self.config.validate():
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
@@ -20,108 +36,61 @@ class DCMAAgent:
             api_key=self.config.get_api_key(),
             base_url=self.config.get_base_url()
         )
-        self.analyzer = DCMAAnalyzer()
+        self.analyzer = analyzer or DCMAAnalyzer()
+        self.cache = cache
+        self.prompt_builder = prompt_builder or PromptBuilder(self.config.prompt_tokens)
 
-    def analyze_schedule(self, csv_file_path: str) -> Dict[str, Any]:
+    def analyze_schedule(self, csv_file_path: str, wbs_index: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Analyze schedule from CSV file."""
         try:
-            results = self.analyzer.process_csv_file(csv_file_path)
+            results = self.analyzer.process_csv_file(csv_file_path, wbs_index=wbs_index)
             return results
         except Exception as e:
             return {"error": f"Failed to analyze schedule: {str(e)}"}
 
     def explain_dcma_point(self, point_number: int) -> Dict[str, Any]:
         """Explain a specific DCMA point."""
-        explanations = {
-            1: {
-                "name": "Logic",
-                "threshold": "≥95%",
-                "description": "Ensures most activities have predecessors and successors (no open ends)",
-                "recommendation": "Review the schedule and ensure that all activities (except start/milestone) have both predecessors and successors."
-            },
-            2: {
-                "name": "Leads (Negative Lag)",
-                "threshold": "0",
-                "description": "Lead time (negative lag) should not be used as it can hide logic flaws",
-                "recommendation": "Remove negative lags and replace with explicit task sequencing to show accurate logic."
-            },
-            3: {
-                "name": "Lags",
-                "threshold": "≤5%",
-                "description": "Excessive lag can disrupt proper sequencing and control",
-                "recommendation": "Review and eliminate lag where feasible, replacing it with additional tasks or more explicit dependencies."
-            },
-            4: {
-                "name": "Relationship Types",
-                "threshold": "≥90% FS",
-                "description": "Ensures that at least 90% of activity relationships are Finish-to-Start (FS)",
-                "recommendation": "Convert SS/FF dependencies to FS wherever practical to maintain clarity and sequencing discipline."
-            },
-            5: {
-                "name": "Start-to-Finish Relations",
-                "threshold": "0",
-                "description": "Start-to-Finish dependencies are not recommended and should be avoided entirely",
-                "recommendation": "Identify and eliminate SF dependencies, replacing them with FS or SS links as appropriate."
-            },
-            6: {
-                "name": "Hard Constraints",
-                "threshold": "≤5%",
-                "description": "Limits use of constraints like 'Must Finish On' that override logic",
-                "recommendation": "Replace hard constraints with flexible alternatives (e.g., 'As Late As Possible')."
-            },
-            7: {
-                "name": "High Float",
-                "threshold": "≤5%",
-                "description": "Highlights overly flexible activities that may indicate poor logic",
-                "recommendation": "Analyze tasks with high float for unnecessary delay or missing dependencies."
-            },
-            8: {
-                "name": "Negative Float",
-                "threshold": "0",
-                "description": "Indicates the project is behind schedule or has unrealistic deadlines",
-                "recommendation": "Re-sequence or adjust the schedule to eliminate negative float and align with project goals."
-            },
-            9: {
-                "name": "High Duration",
-                "threshold": "≤5%",
-                "description": "Flags activities that are too long (+44 day duration) to manage effectively",
-                "recommendation": "Break long-duration tasks into smaller, more manageable activities with logical dependencies."
-            },
-            10: {
-                "name": "Invalid Forecast Dates",
-                "threshold": "0",
-                "description": "No forecast dates should be earlier than the data date",
-                "recommendation": "Update planned dates to ensure no forecasted work precedes the current data date."
-            },
-            11: {
-                "name": "Invalid Actual Dates",
-                "threshold": "0",
-                "description": "No actual dates should exist in the future",
-                "recommendation": "Correct future actual dates to reflect only completed work as of the current data date."
-            }
-        }
-        
-        if point_number in explanations:
-            return explanations[point_number]
+        if point_number in DCMA_POINTS:
+            return dict(DCMA_POINTS[point_number])
         else:
-            return {"error": f"Invalid DCMA point number: {point_number}. Must be 1-11."}
+            return {"error": f"Invalid DCMA point number: {point_number}. Must be 1-14."}
 
-    def analyze_with_llm(self, csv_file_path: str) -> DCMAAnalysisResponse:
-        """Analyze schedule and get LLM interpretation."""
-        # First run the DCMA analysis
-        analysis_results = self.analyze_schedule(csv_file_path)
-        
-        if "error" in analysis_results:
-            raise ValueError(f"Analysis failed: {analysis_results['error']}")
+    def _prepare(self, csv_file_path: str) -> Tuple[List[Dict[str, str]], Optional[str], Optional['DCMAAnalysisResponse']]:
+        """Messages for the LLM request, its response cache key and any cached response."""
+        # A schedule seen before reuses its compacted prompt without re-analysis
+        prompt_key = source_key(csv_file_path, self.analyzer.computed_float)
+        prompt = self.prompt_builder.lookup(prompt_key)
+        if prompt is None:
+            # First run the DCMA analysis
+            wbs_index: Dict[str, str] = {}
+            analysis_results = self.analyze_schedule(csv_file_path, wbs_index)
+            
+            if "error" in analysis_results:
+                raise ValueError(f"Analysis failed: {analysis_results['error']}")
+            
+            # Format results for LLM within the prompt token budget
+            prompt = self.prompt_builder.build(analysis_results, wbs_index, prompt_key)
         
-        # Format results for LLM
-        report = self.analyzer.generate_report(analysis_results)
-        prompt = ANALYSIS_PROMPT.format(analysis_results=report)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(self.config.model, SYSTEM_PROMPT, prompt,
+                                       self.config.temperature, self.config.max_tokens)
+            cached = self.cache.load(cache_key)
+            if cached is not None:
+                return [], cache_key, cached
         
         messages = [
             {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ]
+        return messages, cache_key, None
+
+    def analyze_with_llm(self, csv_file_path: str) -> 'DCMAAnalysisResponse':
+        """Analyze schedule and get LLM interpretation."""
+        from ..models.dcma_models import DCMAAnalysisResponse
+        messages, cache_key, cached = self._prepare(csv_file_path)
+        if cached is not None:
+            return cached
         
         try:
             response = self.client.beta.chat.completions.parse(
@@ -132,7 +101,48 @@ class DCMAAgent:
                 max_tokens=self.config.max_tokens
             )
             
-            return response.choices[0].message.parsed
+            parsed = response.choices[0].message.parsed
             
         except Exception as e:
-            raise RuntimeError(f"Error communicating with OpenAI: {str(e)}")
\ No newline at end of file
+            raise RuntimeError(f"Error communicating with OpenAI: {str(e)}")
+        
+        if cache_key is not None and parsed is not None:
+            self.cache.store(cache_key, parsed)
+        return parsed
+
+    def stream_with_llm(self, csv_file_path: str) -> Iterator[ResponseEvent]:
+        """Analyze schedule and stream the LLM interpretation while it is generated.
+        
+        Yields ``(field, value)`` as soon as each part of the response is
+        complete: ``executive_summary`` and the other top-level fields, and
+        every ``recommendations`` item and ``implementation_plan`` step on
+        its own (see ``ResponseStreamParser``). The last event is
+        ``('response', DCMAAnalysisResponse)`` with the whole answer. A
+        cached response is replayed as the same events.
+        """
+        from ..models.dcma_models import DCMAAnalysisResponse
+        messages, cache_key, cached = self._prepare(csv_file_path)
+        if cached is not None:
+            yield from response_events(cached)
+            yield 'response', cached
+            return
+        
+        parser = ResponseStreamParser()
+        try:
+            with self.client.beta.chat.completions.stream(
+                model=self.config.model,
+                messages=messages,
+                response_format=DCMAAnalysisResponse,
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens
+            ) as stream:
+                for event in stream:
+                    if event.type == 'content.delta':
+                        yield from parser.feed(event.delta)
+                parsed = stream.get_final_completion().choices[0].message.parsed
+        except Exception as e:
+            raise RuntimeError(f"Error communicating with OpenAI: {str(e)}")
+        
+        if cache_key is not None and parsed is not None:
+            self.cache.store(cache_key, parsed)
+        yield 'response', parsed
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""On-disk cache of parsed LLM analysis responses."""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from ..models.dcma_models import DCMAAnalysisResponse
+
+# Bump whenever the request shape or the response model changes; older entries are ignored
+RESPONSE_CACHE_VERSION = 1
+
+
+class ResponseCache:
+    """Directory of ``DCMAAnalysisResponse`` objects keyed by a hash of the request.
+
+    The key covers everything that determines the answer: model, system
+    prompt, rendered user prompt, temperature and max_tokens. Entries older
+    than ``ttl`` seconds (if given) are treated as misses and removed, and
+    the least recently used entries are evicted once the directory grows
+    beyond ``max_bytes``; a hit refreshes the entry's modification time.
+    """
+    
+    def __init__(self, directory: str, max_bytes: int = 64 << 20, ttl: Optional[float] = None):
+        """Initialize cache in ``directory``, creating it if needed."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        os.makedirs(directory, exist_ok=True)
+    
+    def key(self, model: str, system_prompt: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Cache key for one chat completion request."""
+        request = json.dumps([RESPONSE_CACHE_VERSION, model, system_prompt, prompt, temperature, max_tokens])
+        return hashlib.blake2b(request.encode('utf-8'), digest_size=20).hexdigest()
+    
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.json')
+    
+    def load(self, key: str) -> Optional['DCMAAnalysisResponse']:
+        """Return the cached response for ``key``, or None if missing, expired or unreadable."""
+        from ..models.dcma_models import DCMAAnalysisResponse
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                entry = json.load(file)
+            response = DCMAAnalysisResponse.model_validate(entry['response'])
+            fresh = self.ttl is None or time.time() - entry['created'] <= self.ttl
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            response, fresh = None, False
+        
+        if not fresh:
+            self.misses += 1
+            if response is not None:
+                self.expired += 1
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            return None
+        
+        self.hits += 1
+        os.utime(path)
+        return response
+    
+    def store(self, key: str, response: 'DCMAAnalysisResponse') -> None:
+        """Write ``response`` under ``key`` and evict old entries if over budget."""
+        entry = {'created': time.time(), 'response': response.model_dump(mode='json')}
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(entry, file)
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.evict()
+    
+    def evict(self) -> None:
+        """Delete least recently used entries until under ``max_bytes``."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.unlink(os.path.join(self.directory, name))
+            total -= size
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss and expiry counters and the hit rate for this cache instance."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""Incremental parsing of a streamed ``DCMAAnalysisResponse``."""
+import json
+from typing import TYPE_CHECKING, Any, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from ..models.dcma_models import DCMAAnalysisResponse
+
+# (field name, value): a complete top-level field, or one item of a list field
+ResponseEvent = Tuple[str, Any]
+
+# List fields whose items are reported one by one
+ITEM_FIELDS = ('recommendations', 'implementation_plan')
+
+_WHITESPACE = ' \t\r\n'
+
+
+class ResponseStreamParser:
+    """Turn the JSON text of a ``DCMAAnalysisResponse``, fed in chunks, into events.
+
+    ``feed`` returns ``(field, value)`` for every top-level field whose value
+    has just been completed, e.g. ``('executive_summary', '...')``. The
+    items of ``recommendations`` (as ``DCMARecommendation``) and
+    ``implementation_plan`` are reported one at a time under their field's
+    name as soon as each is closed, while the rest of the list is still
+    being generated. Only the currently open value is buffered.
+    """
+    
+    def __init__(self):
+        """Start before the opening brace of the response object."""
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.phase = 'key'
+        self.key = None
+        self.text: List[str] = []
+    
+    def feed(self, chunk: str) -> List[ResponseEvent]:
+        """Consume the next piece of the JSON text and return the completed events."""
+        events: List[ResponseEvent] = []
+        for char in chunk:
+            if self.in_string:
+                self.text.append(char)
+                if self.escape:
+                    self.escape = False
+                elif char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+                continue
+            
+            if char in '{[':
+                self.depth += 1
+                if self.depth == 1:
+                    continue
+                if self.depth == 2 and self.phase == 'value' and char == '[' and self.key in ITEM_FIELDS \
+                        and not ''.join(self.text).strip():
+                    self.phase = 'items'
+                    continue
+            elif char in '}]':
+                self.depth -= 1
+                if self.depth == 0:
+                    self._end_member(events)
+                    continue
+                if self.depth == 1 and self.phase == 'items':
+                    self._end_item(events)
+                    self.phase = 'after'
+                    continue
+            elif char == ',':
+                if self.depth == 1:
+                    self._end_member(events)
+                    continue
+                if self.depth == 2 and self.phase == 'items':
+                    self._end_item(events)
+                    continue
+            elif char == ':' and self.depth == 1 and self.phase == 'key':
+                self.key = json.loads(''.join(self.text))
+                self.text = []
+                self.phase = 'value'
+                continue
+            elif char == '"':
+                self.in_string = True
+            elif char in _WHITESPACE and not self.text:
+                continue
+            
+            if self.depth >= 1:
+                self.text.append(char)
+        return events
+    
+    def _end_member(self, events: List[ResponseEvent]) -> None:
+        """A top-level field ended; report it unless its items were already reported."""
+        if self.phase == 'value':
+            events.append((self.key, json.loads(''.join(self.text))))
+        self.text = []
+        self.phase = 'key'
+        self.key = None
+    
+    def _end_item(self, events: List[ResponseEvent]) -> None:
+        """An item of a list field ended (or the list closed, possibly empty)."""
+        text = ''.join(self.text).strip()
+        self.text = []
+        if not text:
+            return
+        item = json.loads(text)
+        if self.key == 'recommendations':
+            from ..models.dcma_models import DCMARecommendation
+            item = DCMARecommendation.model_validate(item)
+        events.append((self.key, item))
+
+
+def response_events(response: 'DCMAAnalysisResponse') -> Iterator[ResponseEvent]:
+    """The events a stream of ``response`` produces, e.g. to replay a cached response."""
+    for field in type(response).model_fields:
+        value = getattr(response, field)
+        if field in ITEM_FIELDS:
+            for item in value:
+                yield field, item
+        else:
+            yield field, value
\ No newline at end of file
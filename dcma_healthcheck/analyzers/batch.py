@@ -0,0 +1,222 @@
+"""Parallel DCMA analysis of many schedule files."""
+import glob
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from ..models.field_parsers import FieldParser
+from ..readers.formats import COMPRESSION_SUFFIXES, EXTENSIONS
+from .dcma_analyzer import DCMAAnalyzer
+
+FileResult = Tuple[str, Dict[str, Any]]
+
+# Analyzer of the current worker process, built once by ``_init_worker``
+_worker_analyzer: Optional[DCMAAnalyzer] = None
+
+
+def _is_schedule_file(name: str) -> bool:
+    """True for file names with a known schedule extension, optionally compressed."""
+    name = name.lower()
+    for suffix in COMPRESSION_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return os.path.splitext(name)[1] in EXTENSIONS
+
+
+def expand_sources(sources: Iterable[str]) -> List[str]:
+    """Resolve files, directories (searched recursively) and glob patterns to file paths.
+
+    Directories contribute only files with a known schedule extension;
+    explicit files and glob matches are taken as given. Duplicates are
+    dropped and the order of first appearance is kept.
+    """
+    paths: Dict[str, None] = {}
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    if _is_schedule_file(name):
+                        paths.setdefault(os.path.join(root, name))
+        elif glob.has_magic(source):
+            for path in sorted(glob.glob(source, recursive=True)):
+                if os.path.isfile(path):
+                    paths.setdefault(path)
+        else:
+            paths.setdefault(source)
+    return list(paths)
+
+
+def pdf_path(pdf_dir: str, source: str) -> str:
+    """PDF report path in ``pdf_dir`` for a schedule, unique per source path.
+
+    The source's extension is kept (``plan.xml.pdf``), so exports of one
+    schedule in several formats do not overwrite each other's report.
+    """
+    name = re.sub(r'[^\w.-]+', '_', os.path.normpath(source)).strip('_.')
+    return os.path.join(pdf_dir, f"{name or 'schedule'}.pdf")
+
+
+def _build_analyzer(locale: str, date_formats: Optional[Sequence[str]],
+                    cache_dir: Optional[str], computed_float: bool = False,
+                    baseline: Optional[str] = None, plugins: bool = False,
+                    check_network: bool = False) -> DCMAAnalyzer:
+    """Create an analyzer from picklable settings."""
+    cache = None
+    if cache_dir:
+        from ..readers.snapshot_cache import SnapshotCache
+        cache = SnapshotCache(cache_dir)
+    analyzer = DCMAAnalyzer(parser=FieldParser(locale, date_formats), cache=cache, computed_float=computed_float,
+                            plugins=plugins, check_network=check_network)
+    if baseline:
+        analyzer.load_baseline(baseline)
+    return analyzer
+
+
+def _init_worker(locale: str, date_formats: Optional[Sequence[str]], cache_dir: Optional[str],
+                 computed_float: bool, baseline: Optional[str], plugins: bool, check_network: bool) -> None:
+    """Process pool initializer: one analyzer (and parser cache) per worker."""
+    global _worker_analyzer
+    _worker_analyzer = _build_analyzer(locale, date_formats, cache_dir, computed_float, baseline, plugins,
+                                       check_network)
+
+
+def _analyze_one(analyzer: DCMAAnalyzer, path: str, fmt: Optional[str], has_headers: bool,
+                 vectorized: bool, pdf_dir: Optional[str] = None) -> FileResult:
+    """Analyze one file, turning any exception into an error result.
+
+    With a ``pdf_dir`` the file's PDF report is rendered here too, and its
+    path is added to the results as ``'pdf'``.
+    """
+    try:
+        analysis = analyzer.process_file(path, fmt, has_headers, vectorized)
+        if pdf_dir is not None and 'error' not in analysis:
+            from ..reports.pdf_generator import PDFReportGenerator
+            analysis['pdf'] = PDFReportGenerator().create_pdf_output(analysis, pdf_path(pdf_dir, path), source=path)
+        return path, analysis
+    except Exception as e:
+        return path, {'error': f"{type(e).__name__}: {e}"}
+
+
+def _analyze_chunk(paths: List[str], fmt: Optional[str], has_headers: bool,
+                   vectorized: bool, pdf_dir: Optional[str]) -> List[FileResult]:
+    """Worker entry point: analyze a chunk of files with the worker's analyzer."""
+    return [_analyze_one(_worker_analyzer, path, fmt, has_headers, vectorized, pdf_dir) for path in paths]
+
+
+class BatchAnalyzer:
+    """Run the DCMA checks over many files on a pool of worker processes.
+
+    Files are sent to workers in chunks of ``chunk_size`` so per-task
+    overhead stays small for large batches of small exports; each worker
+    keeps one analyzer, and so one warm field-parser cache, for its whole
+    lifetime. Results are yielded per file as chunks complete, and a file
+    that fails to read or analyze yields an ``{'error': ...}`` result
+    instead of stopping the batch. With ``pdf_dir`` each worker also
+    renders the PDF report of the files it analyzed.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 4,
+                 fmt: Optional[str] = None, has_headers: bool = True, locale: str = 'en_US',
+                 date_formats: Optional[Sequence[str]] = None, cache_dir: Optional[str] = None,
+                 vectorized: bool = False, computed_float: bool = False, baseline: Optional[str] = None,
+                 plugins: bool = False, check_network: bool = False, pdf_dir: Optional[str] = None):
+        """Initialize batch settings.
+
+        ``max_workers`` defaults to the CPU count; with ``1`` files are
+        analyzed in the calling process. Parser settings are passed as
+        ``locale``/``date_formats`` and the snapshot cache as ``cache_dir``
+        so each worker can build its own; ``computed_float``, ``plugins``
+        and ``check_network`` are passed on to every analyzer, and the ``baseline`` file is loaded
+        by each one. ``pdf_dir`` is created if needed; reports are written
+        to ``pdf_path(pdf_dir, path)``.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.fmt = fmt
+        self.has_headers = has_headers
+        self.settings = (locale, tuple(date_formats) if date_formats else None, cache_dir, computed_float, baseline,
+                         plugins, check_network)
+        self.vectorized = vectorized
+        self.pdf_dir = pdf_dir
+    
+    def analyze(self, path: str) -> FileResult:
+        """Analyze a single file in this process with the batch settings."""
+        if self.pdf_dir is not None:
+            os.makedirs(self.pdf_dir, exist_ok=True)
+        return _analyze_one(_build_analyzer(*self.settings), path, self.fmt, self.has_headers, self.vectorized,
+                            self.pdf_dir)
+    
+    def iter_results(self, sources: Iterable[str]) -> Iterator[FileResult]:
+        """Yield ``(path, analysis_results)`` for each file, in completion order."""
+        paths = expand_sources(sources)
+        if not paths:
+            return
+        if self.pdf_dir is not None:
+            os.makedirs(self.pdf_dir, exist_ok=True)
+        
+        if self.max_workers == 1 or len(paths) == 1:
+            analyzer = _build_analyzer(*self.settings)
+            for path in paths:
+                yield _analyze_one(analyzer, path, self.fmt, self.has_headers, self.vectorized, self.pdf_dir)
+            return
+        
+        # Imported here so that single-file runs never load multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from concurrent.futures.process import BrokenProcessPool
+        
+        chunks = [paths[i:i + self.chunk_size] for i in range(0, len(paths), self.chunk_size)]
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(chunks)),
+                                 initializer=_init_worker, initargs=self.settings) as executor:
+            futures = {
+                executor.submit(_analyze_chunk, chunk, self.fmt, self.has_headers, self.vectorized, self.pdf_dir): chunk
+                for chunk in chunks
+            }
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except BrokenProcessPool as e:
+                    # A worker died (e.g. out of memory); only its chunk is lost
+                    results = [(path, {'error': f"Worker process failed: {e}"}) for path in futures[future]]
+                yield from results
+    
+    def run(self, sources: Iterable[str]) -> Dict[str, Any]:
+        """Analyze every file and return the combined summary."""
+        return summarize_batch(self.iter_results(sources))
+
+
+def summarize_batch(results: Iterable[FileResult]) -> Dict[str, Any]:
+    """Combine per-file results into portfolio totals.
+
+    Per-file entries keep only each file's summary (or error) and its
+    failed points, sorted by path; per-point totals count the files each
+    point passed, failed or was N/A in.
+    """
+    files: List[Dict[str, Any]] = []
+    points: Dict[int, Dict[str, Any]] = {}
+    for path, analysis in results:
+        if 'error' in analysis:
+            files.append({'file': path, 'error': analysis['error']})
+            continue
+        files.append({
+            'file': path,
+            'summary': analysis['summary'],
+            'failed_points': [r['point'] for r in analysis['results'] if r['passed'] is False],
+        })
+        for result in analysis['results']:
+            totals = points.setdefault(result['point'], {
+                'point': result['point'], 'description': result['description'], 'passed': 0, 'failed': 0,
+                'not_applicable': 0,
+            })
+            totals['not_applicable' if result['passed'] is None else 'passed' if result['passed'] else 'failed'] += 1
+    
+    files.sort(key=lambda entry: entry['file'])
+    analyzed = sum(1 for entry in files if 'error' not in entry)
+    return {
+        'files': len(files),
+        'analyzed': analyzed,
+        'errors': len(files) - analyzed,
+        'points': [points[point] for point in sorted(points)],
+        'results': files,
+    }
\ No newline at end of file
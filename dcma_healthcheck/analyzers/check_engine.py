@@ -0,0 +1,89 @@
+"""Single-pass evaluation of all DCMA checks."""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from ..base_checker import ROW_FILTERS, BaseChecker, CheckAccumulator, RowFilter
+from ..models.schedule_data import ScheduleLine
+
+Step = Tuple[Callable[[CheckAccumulator, ScheduleLine], None], CheckAccumulator]
+
+
+def supports_accumulate(checker: BaseChecker) -> bool:
+    """True if ``checker`` overrides both ``accumulate`` and ``finalize``."""
+    checker_class = type(checker)
+    return (checker_class.accumulate is not BaseChecker.accumulate
+            and checker_class.finalize is not BaseChecker.finalize)
+
+
+class CheckEngine:
+    """Run every checker over the schedule in one pass.
+
+    Checkers are grouped by their ``row_filter`` so each shared filter is
+    evaluated once per row, and each checker folds matching rows into its
+    own ``CheckAccumulator``. Checkers without ``accumulate`` get the rows
+    collected into a list and are run with ``check`` afterwards, so results
+    are always the same as running the checkers one by one.
+    """
+    
+    def __init__(self, checkers: Sequence[BaseChecker]):
+        """Initialize engine for ``checkers``, kept in result order."""
+        for checker in checkers:
+            if checker.row_filter is not None and checker.row_filter not in ROW_FILTERS:
+                raise ValueError(f"Unknown row filter for point {checker.point_number}: {checker.row_filter}")
+        self.checkers = list(checkers)
+    
+    def start(self) -> List[Optional[CheckAccumulator]]:
+        """Fresh accumulators, one per checker (None for unfused checkers)."""
+        return [checker.new_accumulator() if supports_accumulate(checker) else None
+                for checker in self.checkers]
+    
+    def _plan(self, accumulators: List[Optional[CheckAccumulator]]) -> List[Tuple[Optional[RowFilter], List[Step]]]:
+        """Group bound ``accumulate`` methods by the filter that gates them."""
+        groups: Dict[Optional[str], List[Step]] = {}
+        for checker, acc in zip(self.checkers, accumulators):
+            if acc is not None:
+                groups.setdefault(checker.row_filter, []).append((checker.accumulate, acc))
+        return [(ROW_FILTERS.get(name), steps) for name, steps in groups.items()]
+    
+    def feed(self, accumulators: List[Optional[CheckAccumulator]],
+             schedule_lines: Iterable[ScheduleLine]) -> List[ScheduleLine]:
+        """Fold ``schedule_lines`` into ``accumulators``.
+
+        Returns the rows themselves only if some checker needs ``check``;
+        otherwise the rows are not retained.
+        """
+        plan = self._plan(accumulators)
+        keep = any(acc is None for acc in accumulators)
+        kept: List[ScheduleLine] = []
+        
+        for line in schedule_lines:
+            for row_filter, steps in plan:
+                if row_filter is None or row_filter(line):
+                    for accumulate, acc in steps:
+                        accumulate(acc, line)
+            if keep:
+                kept.append(line)
+        return kept
+    
+    def merge(self, accumulators: List[CheckAccumulator], other: List[CheckAccumulator],
+              max_failed: Optional[int] = None) -> List[CheckAccumulator]:
+        """Merge the accumulators of a following shard into ``accumulators``.
+        
+        With ``max_failed`` only the first failures of each point are kept;
+        counts, and so values and pass/fail, are unaffected.
+        """
+        for checker, acc, part in zip(self.checkers, accumulators, other):
+            checker.merge(acc, part)
+            if max_failed is not None:
+                del acc.failed[max_failed:]
+        return accumulators
+    
+    def finish(self, accumulators: List[Optional[CheckAccumulator]],
+               schedule_lines: List[ScheduleLine]) -> List[Dict[str, Any]]:
+        """Finalize every point's result, in checker order."""
+        return [checker.finalize(acc) if acc is not None else checker.check(schedule_lines)
+                for checker, acc in zip(self.checkers, accumulators)]
+    
+    def run(self, schedule_lines: Iterable[ScheduleLine]) -> List[Dict[str, Any]]:
+        """Evaluate all checkers over a list or stream of lines."""
+        accumulators = self.start()
+        kept = self.feed(accumulators, schedule_lines)
+        return self.finish(accumulators, kept)
\ No newline at end of file
@@ -0,0 +1,469 @@
+"""Critical path method (CPM) scheduling of the activity network."""
+import dataclasses
+import math
+from array import array
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from ..models.relationships import LagUnit, RelationType, parse_relationship
+from ..models.schedule_data import ScheduleLine
+
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+# Whether the predecessor / successor end of a link is its finish (else its start)
+FROM_FINISH = {RelationType.FS: True, RelationType.FF: True, RelationType.SS: False, RelationType.SF: False}
+TO_FINISH = {RelationType.FS: False, RelationType.FF: True, RelationType.SS: False, RelationType.SF: True}
+
+# (predecessor end is its finish, successor end is its finish, lag in days, lag as
+# a fraction of the predecessor duration); a None first item means a malformed token
+LinkKind = Tuple[Optional[bool], bool, float, float]
+
+# Constraint type -> (bounds the early dates, bounds the late dates, applies to the finish)
+CONSTRAINT_BOUNDS = {
+    'Start No Earlier Than': (True, False, False),
+    'Finish No Earlier Than': (True, False, True),
+    'Start No Later Than': (False, True, False),
+    'Finish No Later Than': (False, True, True),
+    'Must Start On': (True, True, False),
+    'Must Finish On': (True, True, True),
+    'Start On': (True, True, False),
+    'Finish On': (True, True, True),
+}
+
+# Computed float is rounded to this many decimals, hiding binary noise from fractional lags
+FLOAT_DECIMALS = 6
+
+# (unique_id, duration, unique-ID predecessor tokens, constraint type, constraint date) of one row
+CPMRow = Tuple[str, float, Sequence[str], str, Optional[datetime]]
+
+
+def working_days(start: date, end: date) -> int:
+    """Number of Monday-to-Friday days in ``[start, end)``; negative if ``end`` is earlier."""
+    if end < start:
+        return -working_days(end, start)
+    weeks, rest = divmod((end - start).days, 7)
+    weekday = start.weekday()
+    return weeks * 5 + sum(1 for day in range(rest) if (weekday + day) % 7 < 5)
+
+
+def add_working_days(start: date, days: float) -> date:
+    """The working day ``days`` (rounded down) working days after ``start``."""
+    while start.weekday() >= 5:
+        start += timedelta(days=1)
+    weeks, rest = divmod(math.floor(days), 5)
+    current = start + timedelta(weeks=weeks)
+    while rest:
+        current += timedelta(days=1)
+        if current.weekday() < 5:
+            rest -= 1
+    return current
+
+
+def _link_kind(suffix: str) -> LinkKind:
+    """How a link with type-and-lag text ``suffix`` (e.g. ``SS+2 days``) constrains its successor."""
+    link = parse_relationship('0' + suffix)
+    if link.predecessor_id != '0':
+        # Not a well-formed link: the whole token is taken as a plain FS predecessor ID
+        return None, False, 0.0, 0.0
+    if link.lag_unit in (LagUnit.PERCENT, LagUnit.ELAPSED_PERCENT):
+        return FROM_FINISH[link.type], TO_FINISH[link.type], 0.0, link.lag / 100
+    return FROM_FINISH[link.type], TO_FINISH[link.type], link.lag_days(), 0.0
+
+
+def _as_date(value: Optional[datetime]) -> Optional[date]:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _schedule(count: int, durations: List[float], sources: array, destinations: array, shifts: array,
+              early_bounds: Dict[int, Tuple[float, bool]],
+              late_bounds: Dict[int, float]) -> Tuple[List[array], List[int], float]:
+    """Forward and backward passes over the links ``sources[i] -> destinations[i]``.
+    
+    Each link requires start(destination) >= start(source) + shift. Returns
+    the early start, early finish, late start, late finish, total float and
+    free float of every node (NaN where unscheduled), the unscheduled nodes
+    and the project finish. Vectorized with NumPy when it is installed,
+    processing a whole level of the topological order at a time; otherwise
+    the nodes are visited one by one.
+    """
+    try:
+        import numpy as np
+    except ImportError:  # optional, see the ``fast`` extra
+        return _schedule_nodes(count, durations, sources, destinations, shifts, early_bounds, late_bounds)
+    
+    duration = np.array(durations, dtype=np.float64)
+    
+    # Edges grouped by source node, in compressed sparse row form
+    source = np.frombuffer(sources, dtype=np.int64)
+    by_source = np.argsort(source, kind='stable')
+    tails = source[by_source]
+    heads = np.frombuffer(destinations, dtype=np.int64)[by_source]
+    edge_shifts = np.frombuffer(shifts, dtype=np.float64)[by_source]
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(source, minlength=count), out=offsets[1:])
+    
+    def edges_from(nodes):
+        starts = offsets[nodes]
+        counts = offsets[nodes + 1] - starts
+        ends = np.cumsum(counts)
+        return np.repeat(starts - ends + counts, counts) + np.arange(ends[-1] if len(ends) else 0)
+    
+    # Topological levels (Kahn, a whole frontier at a time) with the edges leaving each;
+    # nodes never released sit in or behind a loop
+    indegree = np.bincount(heads, minlength=count)
+    frontier = np.flatnonzero(indegree == 0)
+    levels = []
+    while len(frontier):
+        edges = edges_from(frontier)
+        reached = heads[edges]
+        np.subtract.at(indegree, reached, 1)
+        levels.append((frontier, edges))
+        frontier = np.unique(reached[indegree[reached] == 0])
+    scheduled = indegree == 0
+    
+    earliest = np.full(count, -np.inf)
+    fixed = np.zeros(count, dtype=bool)
+    latest = np.full(count, np.inf)
+    if early_bounds:
+        nodes = np.fromiter(early_bounds, dtype=np.int64, count=len(early_bounds))
+        earliest[nodes], fixed[nodes] = zip(*early_bounds.values())
+    if late_bounds:
+        latest[np.fromiter(late_bounds, dtype=np.int64, count=len(late_bounds))] = list(late_bounds.values())
+    
+    # Forward pass: a level's starts are final once every earlier level has pushed its links
+    early = np.zeros(count)
+    for nodes, edges in levels:
+        early[nodes] = np.where(fixed[nodes], earliest[nodes], np.maximum(early[nodes], earliest[nodes]))
+        np.maximum.at(early, heads[edges], early[tails[edges]] + edge_shifts[edges])
+    finish = float((early + duration)[scheduled].max()) if scheduled.any() else 0.0
+    
+    # Backward pass, and free float against each successor's early start
+    late = finish - duration
+    slack = np.full(count, np.inf)
+    for nodes, edges in reversed(levels):
+        edges = edges[scheduled[heads[edges]]]
+        predecessors, successors, shift = tails[edges], heads[edges], edge_shifts[edges]
+        np.minimum.at(late, predecessors, late[successors] - shift)
+        np.minimum.at(slack, predecessors, early[successors] - shift - early[predecessors])
+        late[nodes] = np.minimum(late[nodes], latest[nodes])
+    # Without successors, free float runs to the project finish
+    free = np.where(slack == np.inf, finish - duration - early, slack)
+    
+    times = [early, early + duration, late, late + duration,
+             np.round(late - early, FLOAT_DECIMALS), np.round(free, FLOAT_DECIMALS)]
+    times = [array('d', np.where(scheduled, values, np.nan).tobytes()) for values in times]
+    return times, np.flatnonzero(~scheduled).tolist(), finish
+
+
+def _schedule_nodes(count: int, durations: List[float], sources: array, destinations: array, shifts: array,
+                    early_bounds: Dict[int, Tuple[float, bool]],
+                    late_bounds: Dict[int, float]) -> Tuple[List[array], List[int], float]:
+    """``_schedule`` without NumPy, visiting the nodes in topological order."""
+    # Successor lists in compressed sparse row form, by counting sort
+    offsets = [0] * (count + 1)
+    for source in sources:
+        offsets[source + 1] += 1
+    for node in range(count):
+        offsets[node + 1] += offsets[node]
+    targets = [0] * len(sources)
+    edge_shifts = [0.0] * len(sources)
+    fill = offsets[:-1]
+    for source, destination, shift in zip(sources, destinations, shifts):
+        slot = fill[source]
+        targets[slot] = destination
+        edge_shifts[slot] = shift
+        fill[source] = slot + 1
+    
+    # Topological order (Kahn); nodes left out sit in or behind a loop
+    indegree = [0] * count
+    for destination in destinations:
+        indegree[destination] += 1
+    order = [node for node in range(count) if not indegree[node]]
+    for node in order:
+        for edge in range(offsets[node], offsets[node + 1]):
+            successor = targets[edge]
+            indegree[successor] -= 1
+            if not indegree[successor]:
+                order.append(successor)
+    
+    scheduled = bytearray(count)
+    for node in order:
+        scheduled[node] = 1
+    
+    # Forward pass
+    early = [0.0] * count
+    for node in order:
+        start = early[node]
+        bound = early_bounds.get(node)
+        if bound is not None:
+            start = bound[0] if bound[1] else max(start, bound[0])
+            early[node] = start
+        for edge in range(offsets[node], offsets[node + 1]):
+            candidate = start + edge_shifts[edge]
+            successor = targets[edge]
+            if candidate > early[successor]:
+                early[successor] = candidate
+    finish = max((early[node] + durations[node] for node in order), default=0.0)
+    
+    # Backward pass, and free float against each successor's early start
+    late = [0.0] * count
+    free = [0.0] * count
+    for node in reversed(order):
+        start = early[node]
+        latest = finish - durations[node]
+        slack = math.inf
+        for edge in range(offsets[node], offsets[node + 1]):
+            successor = targets[edge]
+            if not scheduled[successor]:
+                continue
+            shift = edge_shifts[edge]
+            if late[successor] - shift < latest:
+                latest = late[successor] - shift
+            if early[successor] - shift - start < slack:
+                slack = early[successor] - shift - start
+        bound = late_bounds.get(node)
+        if bound is not None and bound < latest:
+            latest = bound
+        late[node] = latest
+        # Without successors, free float runs to the project finish
+        free[node] = slack if slack != math.inf else finish - durations[node] - start
+    
+    times = [array('d', [math.nan]) * count for _ in range(6)]
+    early_start, early_finish, late_start, late_finish, total_float, free_float = times
+    for node in order:
+        duration = durations[node]
+        early_start[node] = early[node]
+        early_finish[node] = early[node] + duration
+        late_start[node] = late[node]
+        late_finish[node] = late[node] + duration
+        total_float[node] = round(late[node] - early[node], FLOAT_DECIMALS)
+        free_float[node] = round(free[node], FLOAT_DECIMALS)
+    return times, [node for node in range(count) if not scheduled[node]], finish
+
+
+class CriticalPath:
+    """Early and late dates and float of every activity, from a CPM pass.
+
+    Times are working-day offsets from the project start: an activity
+    occupies ``[early_start, early_finish)``. Links are read from the
+    unique-ID predecessor column with their type (FS/SS/FF/SF) and lag;
+    percentage lags scale the predecessor's duration. Constraint dates are
+    honoured when the project start is known (by default the earliest
+    start in the schedule): no-earlier-than and must-on constraints bound
+    the forward pass, no-later-than and must-on constraints the backward
+    pass, which is what produces negative float.
+
+    Activities in, or driven by, a logic loop cannot be ordered; they are
+    listed in ``unscheduled`` and their values are NaN.
+    """
+    
+    def __init__(self, ids: List[str], row_nodes: array, duration: array, early_start: array,
+                 early_finish: array, late_start: array, late_finish: array, total_float: array,
+                 free_float: array, project_start: Optional[date], project_finish: float,
+                 unscheduled: List[str]):
+        self.ids = ids
+        self.index = {unique_id: node for node, unique_id in enumerate(ids)}
+        self.row_nodes = row_nodes
+        self.duration = duration
+        self.early_start = early_start
+        self.early_finish = early_finish
+        self.late_start = late_start
+        self.late_finish = late_finish
+        self.total_float = total_float
+        self.free_float = free_float
+        self.project_start = project_start
+        self.project_finish = project_finish
+        self.unscheduled = unscheduled
+    
+    @classmethod
+    def compute(cls, rows: Iterable[CPMRow], project_start: Optional[date] = None) -> 'CriticalPath':
+        """Run the forward and backward passes in O(V + E).
+        
+        The links are resolved in one pass over the rows; the passes are
+        vectorized level by level of the topological order (see
+        ``_schedule``).
+        """
+        rows = list(rows)
+        nodes: Dict[str, int] = {}
+        ids: List[str] = []
+        durations: List[float] = []
+        row_nodes = array('l')
+        for unique_id, duration, _, _, _ in rows:
+            node = nodes.get(unique_id)
+            if node is None:
+                node = nodes[unique_id] = len(ids)
+                ids.append(unique_id)
+                durations.append(duration)
+            row_nodes.append(node)
+        count = len(ids)
+        
+        # Every link becomes start(successor) >= start(predecessor) + shift
+        sources = array('q')
+        destinations = array('q')
+        shifts = array('d')
+        add_source, add_destination, add_shift = sources.append, destinations.append, shifts.append
+        lookup = nodes.get
+        kinds: Dict[str, LinkKind] = {}
+        for (_, _, tokens, _, _), node in zip(rows, row_nodes):
+            for token in tokens:
+                if token.isdigit():
+                    other = lookup(token)
+                    if other is not None:
+                        add_source(other)
+                        add_destination(node)
+                        add_shift(durations[other])
+                    continue
+                # Type and lag text repeat across links, so parse each distinct suffix once
+                suffix = token.lstrip('0123456789')
+                kind = kinds.get(suffix)
+                if kind is None:
+                    kind = kinds[suffix] = _link_kind(suffix)
+                from_finish, to_finish, lag, percent = kind
+                if from_finish is None:
+                    other = lookup(token)
+                    from_finish = True
+                else:
+                    other = lookup(token[:len(token) - len(suffix)])
+                if other is None:
+                    continue
+                shift = lag + durations[other] * percent
+                if from_finish:
+                    shift += durations[other]
+                if to_finish:
+                    shift -= durations[node]
+                add_source(other)
+                add_destination(node)
+                add_shift(shift)
+        
+        early_bounds, late_bounds = cls._constraint_bounds(rows, row_nodes, durations, project_start)
+        times, unscheduled, finish = _schedule(count, durations, sources, destinations, shifts,
+                                               early_bounds, late_bounds)
+        return cls(ids, row_nodes, array('d', durations), *times, project_start, finish,
+                   [ids[node] for node in unscheduled])
+    
+    @staticmethod
+    def _constraint_bounds(rows: List[CPMRow], row_nodes: array, durations: List[float],
+                           project_start: Optional[date]) -> Tuple[Dict[int, Tuple[float, bool]], Dict[int, float]]:
+        """Start-offset bounds from constraint dates.
+        
+        Returns ``{node: (earliest start, fixed)}`` for the forward pass, where
+        ``fixed`` (must-on constraints) overrides the logic, and
+        ``{node: latest start}`` for the backward pass.
+        """
+        early: Dict[int, Tuple[float, bool]] = {}
+        late: Dict[int, float] = {}
+        if project_start is None:
+            return early, late
+        for (_, _, _, constraint_type, constraint_date), node in zip(rows, row_nodes):
+            bounds = CONSTRAINT_BOUNDS.get(constraint_type)
+            if bounds is None or constraint_date is None:
+                continue
+            bounds_early, bounds_late, on_finish = bounds
+            # Start constraints hold from the start of their day, finish constraints to its end
+            offset = float(working_days(project_start, _as_date(constraint_date)))
+            if on_finish:
+                offset += 1 - durations[node]
+            if bounds_early:
+                early[node] = (offset, bounds_late)
+            if bounds_late:
+                late[node] = min(offset, late.get(node, offset))
+        return early, late
+    
+    @classmethod
+    def from_lines(cls, schedule_lines: Iterable[ScheduleLine],
+                   project_start: Optional[date] = None) -> 'CriticalPath':
+        """Schedule a list of lines; the project start defaults to their earliest start."""
+        schedule_lines = list(schedule_lines)
+        if project_start is None:
+            project_start = min((_as_date(line.start_date) for line in schedule_lines if line.start_date),
+                                default=None)
+        return cls.compute(((line.unique_id, line.duration, line.unique_id_predecessors,
+                             line.constraint_type, line.constraint_date) for line in schedule_lines),
+                           project_start)
+    
+    @classmethod
+    def from_table(cls, table: 'ScheduleTable', project_start: Optional[date] = None) -> 'CriticalPath':
+        """Schedule a ``ScheduleTable``; the project start defaults to its earliest start."""
+        if project_start is None:
+            starts = table.start_date[table.present('start_date')]
+            project_start = starts.min().astype(object) if len(starts) else None
+        predecessors = table.unique_id_predecessors
+        constrained = table.constraint_type.isin(CONSTRAINT_BOUNDS)
+        durations = table.duration.tolist()
+        return cls.compute(((table.unique_id[row], durations[row], predecessors.row(row),
+                             table.constraint_type[row],
+                             table.date('constraint_date', row) if constrained[row] else None)
+                            for row in range(len(table))), project_start)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    @property
+    def critical(self) -> List[str]:
+        """Unique IDs of the activities with zero or negative total float."""
+        return [self.ids[node] for node, value in enumerate(self.total_float) if value <= 0]
+    
+    def summary(self) -> Dict[str, Any]:
+        """Overview in the shape used by the analysis results."""
+        return {
+            'project_start': self.project_start.isoformat() if self.project_start else None,
+            'project_finish': self.date(self.project_finish, finish=True).isoformat() if self.project_start else None,
+            'duration': round(self.project_finish, FLOAT_DECIMALS),
+            'critical': len(self.critical),
+            'unscheduled': self.unscheduled,
+        }
+    
+    def activity(self, unique_id: str) -> Dict[str, Any]:
+        """Offsets, float and (with a known project start) dates of one activity."""
+        node = self.index[unique_id]
+        result = {
+            'early_start': self.early_start[node],
+            'early_finish': self.early_finish[node],
+            'late_start': self.late_start[node],
+            'late_finish': self.late_finish[node],
+            'total_float': self.total_float[node],
+            'free_float': self.free_float[node],
+        }
+        if self.project_start is not None and not math.isnan(self.early_start[node]):
+            result.update(
+                early_start_date=self.date(self.early_start[node]),
+                early_finish_date=self.date(self.early_finish[node], finish=True),
+                late_start_date=self.date(self.late_start[node]),
+                late_finish_date=self.date(self.late_finish[node], finish=True),
+            )
+        return result
+    
+    def date(self, offset: float, finish: bool = False) -> date:
+        """Calendar day of a working-day offset; with ``finish``, the last day worked before it."""
+        if finish:
+            offset = math.ceil(offset) - 1
+        return add_working_days(self.project_start, offset)
+    
+    def apply(self, schedule_lines: Iterable[ScheduleLine]) -> List[ScheduleLine]:
+        """Copies of the scheduled lines with computed total and free float and critical flag.
+        
+        ``schedule_lines`` must be the rows this result was computed from, in
+        the same order. Unscheduled activities keep their exported float.
+        """
+        total_float, free_float = self.total_float, self.free_float
+        lines = []
+        for line, node in zip(schedule_lines, self.row_nodes):
+            if math.isnan(total_float[node]):
+                lines.append(line)
+            else:
+                lines.append(dataclasses.replace(line, total_slack=total_float[node],
+                                                 free_slack=free_float[node], critical=total_float[node] <= 0))
+        return lines
+    
+    def apply_table(self, table: 'ScheduleTable') -> 'ScheduleTable':
+        """A copy of the scheduled table with computed total and free float and critical flag."""
+        import numpy as np
+        nodes = np.frombuffer(self.row_nodes, dtype=self.row_nodes.typecode)
+        total_float = np.frombuffer(self.total_float, dtype=np.float64)[nodes]
+        free_float = np.frombuffer(self.free_float, dtype=np.float64)[nodes]
+        unscheduled = np.isnan(total_float)
+        columns = dict(table.columns)
+        columns['total_slack'] = np.where(unscheduled, table.total_slack, total_float)
+        columns['free_slack'] = np.where(unscheduled, table.free_slack, free_float)
+        columns['critical'] = np.where(unscheduled, table.critical, total_float <= 0)
+        return type(table)(columns)
\ No newline at end of file
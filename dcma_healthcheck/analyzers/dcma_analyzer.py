@@ -1,124 +1,241 @@
 """Main DCMA analyzer that runs all checks."""
-from typing import List, Dict, Any
+import io
+import os
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Dict, Any, Optional, TextIO
+from ..models.field_parsers import DEFAULT_PARSER, FieldParser
 from ..models.schedule_data import ScheduleLine
-from ..checkers.point_01_logic import Point01Logic
-from ..checkers.point_02_leads import Point02Leads
-from ..checkers.point_03_lags import Point03Lags
-from ..checkers.point_04_relationship_types import Point04RelationshipTypes
-from ..checkers.point_05_start_to_finish import Point05StartToFinish
-from ..checkers.point_06_hard_constraints import Point06HardConstraints
-from ..checkers.point_07_high_float import Point07HighFloat
-from ..checkers.point_08_negative_float import Point08NegativeFloat
-from ..checkers.point_09_high_duration import Point09HighDuration
-from ..checkers.point_10_invalid_forecast_dates import Point10InvalidForecastDates
-from ..checkers.point_11_invalid_actual_dates import Point11InvalidActualDates
+from ..models.schedule_network import ScheduleNetwork, network_row
+from ..readers.csv_reader import ScheduleSource
+from ..readers.formats import detect_format, read_schedule_file
+from ..reports.report_writer import FailureCap, ReportWriter
+from .check_engine import CheckEngine
+from .critical_path import CriticalPath
+from ..checkers.registry import plugin_registry, registry
+
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+    from ..readers.snapshot_cache import SnapshotCache
+    from .incremental import IncrementalSession
+
+
+def _index_wbs(lines: Iterable[ScheduleLine], wbs_index: Dict[str, str]) -> Iterator[ScheduleLine]:
+    """Pass ``lines`` through, recording each one's WBS code by unique ID."""
+    for line in lines:
+        wbs_index[line.unique_id] = line.wbs
+        yield line
 
 
 class DCMAAnalyzer:
     """Main analyzer that orchestrates all DCMA checks."""
     
-    def __init__(self):
-        """Initialize all checkers."""
-        self.checkers = [
-            Point01Logic(),
-            Point02Leads(),
-            Point03Lags(),
-            Point04RelationshipTypes(),
-            Point05StartToFinish(),
-            Point06HardConstraints(),
-            Point07HighFloat(),
-            Point08NegativeFloat(),
-            Point09HighDuration(),
-            Point10InvalidForecastDates(),
-            Point11InvalidActualDates(),
-        ]
+    def __init__(self, parser: Optional[FieldParser] = None, cache: Optional['SnapshotCache'] = None,
+                 computed_float: bool = False, baseline: Optional[Iterable[ScheduleLine]] = None,
+                 plugins: bool = False, check_network: bool = False):
+        """Initialize all checkers.
+        
+        ``parser`` controls how exported text fields are read, e.g.
+        ``FieldParser(locale='en_GB')`` for day-first dates. With a
+        ``SnapshotCache``, files are parsed once and later runs on the same
+        content load the cached table instead. With ``computed_float`` the
+        total and free float are recalculated by a ``CriticalPath`` pass
+        instead of trusting the exported slack columns. ``baseline`` is the
+        baseline schedule point 14 compares against (see ``load_baseline``);
+        without one, point 14 reports N/A. The checkers come from
+        ``checkers.registry``; with ``plugins`` those registered by other
+        installed packages are discovered and run as well (see
+        ``plugin_registry``). With ``check_network`` the activity network is
+        built as well and its integrity findings are reported (see
+        ``summarize``); this costs about as much as the checks themselves on
+        large schedules, so it is off by default.
+        """
+        self.parser = parser
+        self.cache = cache
+        self.computed_float = computed_float
+        self.check_network = check_network
+        self.checkers = (plugin_registry() if plugins else registry).create()
+        if baseline is not None:
+            self.set_baseline(baseline)
+    
+    def load_baseline(self, file_path: ScheduleSource, fmt: Optional[str] = None,
+                      has_headers: bool = True) -> None:
+        """Read a baseline schedule in any supported format for point 14."""
+        fmt = fmt or detect_format(file_path)
+        self.set_baseline(read_schedule_file(file_path, fmt, has_headers, self.parser))
+    
+    def set_baseline(self, schedule_lines: Optional[Iterable[ScheduleLine]]) -> None:
+        """Use ``schedule_lines`` as the baseline of point 14; None removes it."""
+        for checker in self.checkers:
+            set_baseline = getattr(checker, 'set_baseline', None)
+            if set_baseline is not None:
+                set_baseline(schedule_lines)
     
-    def analyze_schedule(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
-        """Run all DCMA checks on the schedule."""
+    def analyze_schedule(self, schedule_lines: Iterable[ScheduleLine], fused: bool = True) -> Dict[str, Any]:
+        """Run all DCMA checks on the schedule.
+        
+        Accepts a list or any iterable of lines, e.g. the generator returned by
+        ``read_schedule``; iterables are consumed exactly once. By default all
+        checks are evaluated together in a single pass over the lines (see
+        ``CheckEngine``), and a stream is only materialised as a list for
+        checkers that cannot accumulate or when float is computed, which
+        needs the whole network first. With ``fused=False`` the lines are
+        collected and each checker is run with ``check`` in turn.
+        """
+        critical_path = None
+        if self.computed_float:
+            schedule_lines = list(schedule_lines)
+            critical_path = CriticalPath.from_lines(schedule_lines)
+            schedule_lines = critical_path.apply(schedule_lines)
+        
+        if fused:
+            if not self.check_network:
+                return self.summarize(CheckEngine(self.checkers).run(schedule_lines), None, critical_path)
+            rows = []
+            
+            def observed(lines):
+                # Keep only what the network needs while the engine streams the rows
+                for line in lines:
+                    rows.append(network_row(line))
+                    yield line
+            
+            results = CheckEngine(self.checkers).run(observed(schedule_lines))
+            return self.summarize(results, ScheduleNetwork.build(rows), critical_path)
+        
+        if not isinstance(schedule_lines, list):
+            schedule_lines = list(schedule_lines)
+        
         results = []
         
         for checker in self.checkers:
             result = checker.check(schedule_lines)
             results.append(result)
         
+        network = ScheduleNetwork.from_lines(schedule_lines) if self.check_network else None
+        return self.summarize(results, network, critical_path)
+    
+    def start_session(self, schedule_lines: Iterable[ScheduleLine] = ()) -> 'IncrementalSession':
+        """Analyze a schedule in an ``IncrementalSession`` that can absorb later changes."""
+        from .incremental import IncrementalSession
+        return IncrementalSession(self, schedule_lines)
+    
+    def analyze_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Run all DCMA checks on a columnar ``ScheduleTable``.
+        
+        Uses each checker's vectorized ``check_table``; results match
+        ``analyze_schedule`` on the same rows.
+        """
+        critical_path = None
+        if self.computed_float:
+            critical_path = CriticalPath.from_table(table)
+            table = critical_path.apply_table(table)
+        network = ScheduleNetwork.from_table(table) if self.check_network else None
+        return self.summarize([checker.check_table(table) for checker in self.checkers], network, critical_path)
+    
+    def summarize(self, results: List[Dict[str, Any]], network: Optional[ScheduleNetwork] = None,
+                  critical_path: Optional[CriticalPath] = None) -> Dict[str, Any]:
+        """Wrap per-point results with the pass/fail summary.
+        
+        With a ``network``, its integrity findings (loops, links to missing
+        activities, one-sided links) are added under ``'network'``; they do
+        not count towards the 14-point summary. Likewise a ``critical_path``
+        adds its overview under ``'critical_path'``. Points that could not
+        be measured (N/A) are counted apart from the passed and failed ones.
+        """
         # Calculate summary
-        total_checks = len(results)
+        total_checks = sum(1 for r in results if r['passed'] is not None)
         passed_checks = sum(1 for r in results if r['passed'])
         
-        return {
+        analysis = {
             'summary': {
                 'total_checks': total_checks,
                 'passed_checks': passed_checks,
                 'failed_checks': total_checks - passed_checks,
+                'not_applicable_checks': len(results) - total_checks,
                 'overall_pass_rate': f"{(passed_checks / total_checks) * 100:.1f}%" if total_checks > 0 else "0%"
             },
             'results': results
         }
+        if network is not None:
+            analysis['network'] = network.summary()
+        if critical_path is not None:
+            analysis['critical_path'] = critical_path.summary()
+        return analysis
+    
+    def process_csv_file(self, file_path: ScheduleSource, has_headers: bool = True,
+                         vectorized: bool = False, fused: bool = True,
+                         wbs_index: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Process a CSV file and analyze it.
+        
+        ``file_path`` may be a path, ``'-'`` for stdin, or a file object;
+        gzip, bz2 and xz compressed exports are read transparently. Rows are
+        parsed lazily as the analysis consumes them.
+        """
+        return self.process_file(file_path, 'tsv', has_headers, vectorized, fused, wbs_index)
     
-    def process_csv_file(self, file_path: str, has_headers: bool = True) -> Dict[str, Any]:
-        """Process a CSV file and analyze it."""
-        schedule_lines = []
+    def process_file(self, file_path: ScheduleSource, fmt: Optional[str] = None,
+                     has_headers: bool = True, vectorized: bool = False,
+                     fused: bool = True, wbs_index: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Read a schedule in any supported format and analyze it.
         
+        ``fmt`` is ``'tsv'``, ``'mspdi'``, ``'xer'`` or ``'xlsx'``; by default
+        it is inferred from the file name. With ``vectorized`` the rows are
+        loaded into a ``ScheduleTable`` (requires NumPy) and checked
+        column-wise; this is implied when the analyzer has a snapshot cache
+        and ``file_path`` names a file. Otherwise the rows are streamed
+        through the single-pass row engine, or collected into a list first
+        with ``fused=False`` (see ``analyze_schedule``). A ``wbs_index`` dict is filled with the WBS
+        code of every activity by unique ID while the rows are read, e.g.
+        for ``PromptBuilder`` to group failures by WBS branch.
+        """
+        fmt = fmt or detect_format(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-                
-                if has_headers and lines:
-                    # Parse with headers
-                    headers = [h.strip() for h in lines[0].split('\t')]
-                    
-                    for line_num, line in enumerate(lines[1:], 2):
-                        if line.strip():
-                            try:
-                                values = [v.strip() for v in line.split('\t')]
-                                # Create dictionary from headers and values
-                                data_dict = dict(zip(headers, values))
-                                schedule_line = ScheduleLine.from_csv_with_headers(data_dict)
-                                schedule_lines.append(schedule_line)
-                            except Exception as e:
-                                print(f"Error parsing line {line_num}: {e}")
-                else:
-                    # Parse without headers (old method)
-                    for line_num, line in enumerate(lines, 1):
-                        if line.strip():
-                            try:
-                                schedule_line = ScheduleLine.from_csv_line(line)
-                                schedule_lines.append(schedule_line)
-                            except Exception as e:
-                                print(f"Error parsing line {line_num}: {e}")
-                                
+            lines = read_schedule_file(file_path, fmt, has_headers, self.parser)
+            if wbs_index is not None:
+                lines = _index_wbs(lines, wbs_index)
+            if self.cache is not None and isinstance(file_path, (str, os.PathLike)) and file_path != '-':
+                from ..models.schedule_table import ScheduleTable
+                parser = self.parser or DEFAULT_PARSER
+                variant = f"{fmt}:{has_headers}:{parser.date_formats}"
+                table = self.cache.get_or_build(file_path, lambda: ScheduleTable.from_lines(lines), variant)
+                if wbs_index is not None:
+                    wbs_index.update(zip(table.unique_id, table.wbs))
+                return self.analyze_table(table)
+            if vectorized:
+                from ..models.schedule_table import ScheduleTable
+                return self.analyze_table(ScheduleTable.from_lines(lines))
+            return self.analyze_schedule(lines, fused)
         except FileNotFoundError:
             return {'error': f"File not found: {file_path}"}
-        
-        return self.analyze_schedule(schedule_lines)
     
-    def generate_report(self, analysis_results: Dict[str, Any]) -> str:
-        """Generate a formatted report."""
-        if 'error' in analysis_results:
-            return f"Error: {analysis_results['error']}"
-        
-        report = []
-        report.append("DCMA 11-Point Schedule Quality Check Report")
-        report.append("=" * 50)
-        
-        # Summary
-        summary = analysis_results['summary']
-        report.append(f"Overall Results: {summary['passed_checks']}/{summary['total_checks']} checks passed ({summary['overall_pass_rate']})")
-        report.append("")
+    def process_csv_file_sharded(self, file_path: ScheduleSource, has_headers: bool = True,
+                                 workers: Optional[int] = None,
+                                 max_failed: Optional[int] = None) -> Dict[str, Any]:
+        """Process a large CSV file on several cores.
         
-        # Individual results
-        for result in analysis_results['results']:
-            status = "PASS" if result['passed'] else "FAIL"
-            report.append(f"Point {result['point']}: {result['description']} - {status}")
-            report.append(f"  Threshold: {result['threshold']}")
-            report.append(f"  Actual: {result['value']}")
-            
-            if not result['passed']:
-                report.append(f"  Recommendation: {result['recommendation']}")
-                if result['failed_tasks']:
-                    report.append("  Failed Tasks:")
-                    for task in result['failed_tasks']:
-                        report.append(f"    - {task}")
-            report.append("")
+        The file is split into byte-range shards that worker processes parse
+        and check independently; their partial counts are merged into the
+        same result ``process_csv_file`` gives. ``max_failed`` caps the failed
+        tasks listed per point. Compressed files and streams cannot be split,
+        and computed float needs the whole network; these are analyzed in a
+        single fused pass instead.
+        """
+        from .sharded import analyze_sharded, is_shardable
+        if not is_shardable(file_path) or self.computed_float:
+            return self.process_csv_file(file_path, has_headers)
+        results, network = analyze_sharded(self.checkers, file_path, workers, has_headers,
+                                           self.parser, max_failed=max_failed, network=self.check_network)
+        return self.summarize(results, network)
+    
+    def generate_report(self, analysis_results: Dict[str, Any], max_failed: FailureCap = None) -> str:
+        """Generate a formatted report.
         
-        return "\n".join(report)
\ No newline at end of file
+        With ``max_failed`` each failed point lists only its most severe
+        failures (see ``FailedTasks.top``) followed by a count of the rest.
+        """
+        buffer = io.StringIO()
+        self.write_report(analysis_results, buffer, max_failed)
+        return buffer.getvalue()[:-1]
+    
+    def write_report(self, analysis_results: Dict[str, Any], sink: TextIO, max_failed: FailureCap = None,
+                     summary_first: bool = True) -> None:
+        """Stream the report of ``generate_report`` to a text sink, section by section."""
+        ReportWriter(sink, max_failed, summary_first).write(analysis_results)
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""Incremental re-analysis of a schedule between updates."""
+import dataclasses
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from ..base_checker import CheckAccumulator
+from ..models.schedule_data import ScheduleLine
+from ..models.schedule_network import ScheduleNetwork
+from .check_engine import ROW_FILTERS, supports_accumulate
+from .dcma_analyzer import DCMAAnalyzer
+
+# (total, hits) of a row that a checker's row filter excludes
+NO_CONTRIBUTION = (0, 0)
+
+
+class PositionIndex:
+    """Values keyed by row position that iterate in position order.
+
+    Positions are kept in a sorted list as they are added, so reading the
+    values back never sorts; rows appended at the end cost O(log n).
+    """
+    
+    def __init__(self):
+        self._order: List[int] = []
+        self._values: Dict[int, Any] = {}
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    def __setitem__(self, position: int, value: Any) -> None:
+        if position not in self._values:
+            insort(self._order, position)
+        self._values[position] = value
+    
+    def discard(self, position: int) -> None:
+        """Remove the value at ``position``, if any."""
+        if self._values.pop(position, None) is not None:
+            del self._order[bisect_left(self._order, position)]
+    
+    def renumber(self, positions: Dict[int, int]) -> None:
+        """Move every value from its old position to ``positions[old]``."""
+        self._values = {positions[position]: value for position, value in self._values.items()}
+        self._order = sorted(self._values)
+    
+    def values(self) -> Iterator[Any]:
+        """Values in position order."""
+        values = self._values
+        return (values[position] for position in self._order)
+
+
+class IncrementalSession:
+    """Keep DCMA results current as rows of a schedule change.
+
+    Each row's contribution to every point (its counts, failed-task entries
+    and any kept row facts) is stored by ``unique_id``, so inserting, updating or deleting
+    a row only re-evaluates that row and adjusts the running totals.
+    ``results`` returns the same output ``analyze_schedule`` would give for
+    the current rows in their current order. Rows must have unique
+    ``unique_id`` values.
+
+    The data date used by the date-based points is fixed when the session
+    starts; call ``refresh`` to re-evaluate everything against a new day.
+    Computed float is not supported, since one changed link can move the
+    float of every activity.
+    """
+    
+    def __init__(self, analyzer: DCMAAnalyzer, schedule_lines: Iterable[ScheduleLine] = ()):
+        """Initialize session with ``analyzer``'s checkers and load an initial schedule."""
+        if analyzer.computed_float:
+            raise ValueError("Incremental sessions use exported float; computed float needs a full analysis")
+        for checker in analyzer.checkers:
+            if not supports_accumulate(checker):
+                raise ValueError(f"Point {checker.point_number} does not support incremental evaluation")
+        self.analyzer = analyzer
+        self.checkers = list(analyzer.checkers)
+        self._filters = [ROW_FILTERS[c.row_filter] if c.row_filter else None for c in self.checkers]
+        self._lines: Dict[str, ScheduleLine] = {}
+        self._positions: Dict[str, int] = {}
+        self.refresh()
+        self.apply(schedule_lines)
+    
+    def refresh(self) -> None:
+        """Re-evaluate every row from scratch with fresh accumulators."""
+        self._templates = [checker.new_accumulator() for checker in self.checkers]
+        lines = sorted(self._lines.values(), key=lambda line: self._positions[line.unique_id])
+        self._lines = {}
+        self._positions = {}
+        self._contributions: Dict[str, Tuple[Tuple[int, int], ...]] = {}
+        self._totals = [0] * len(self.checkers)
+        self._hits = [0] * len(self.checkers)
+        self._failed = [PositionIndex() for _ in self.checkers]
+        self._kept = [PositionIndex() for _ in self.checkers]
+        self._next_position = 0
+        self._network: Optional[ScheduleNetwork] = None
+        self.upsert(lines)
+    
+    def __len__(self) -> int:
+        return len(self._lines)
+    
+    def _remove(self, unique_id: str) -> None:
+        """Subtract a row's stored contribution."""
+        position = self._positions[unique_id]
+        for i, (total, hits) in enumerate(self._contributions.pop(unique_id)):
+            self._totals[i] -= total
+            self._hits[i] -= hits
+            self._failed[i].discard(position)
+            self._kept[i].discard(position)
+        del self._lines[unique_id]
+        self._network = None
+    
+    def _add(self, line: ScheduleLine) -> None:
+        """Evaluate a row with every checker and add its contribution."""
+        counts = []
+        position = self._positions[line.unique_id]
+        for i, (checker, row_filter, template) in enumerate(zip(self.checkers, self._filters, self._templates)):
+            if row_filter is not None and not row_filter(line):
+                counts.append(NO_CONTRIBUTION)
+                continue
+            acc = CheckAccumulator(data_date=template.data_date)
+            checker.accumulate(acc, line)
+            self._totals[i] += acc.total
+            self._hits[i] += acc.hits
+            if acc.failed:
+                self._failed[i][position] = acc.failed
+            if acc.rows:
+                self._kept[i][position] = acc.rows
+            counts.append((acc.total, acc.hits))
+        self._contributions[line.unique_id] = tuple(counts)
+        self._lines[line.unique_id] = line
+        self._network = None
+    
+    def upsert(self, schedule_lines: Iterable[ScheduleLine]) -> int:
+        """Insert new rows and replace changed ones; returns the number re-evaluated.
+
+        Updated rows keep their position; new rows are placed after all
+        existing ones.
+        """
+        changed = 0
+        for line in schedule_lines:
+            previous = self._lines.get(line.unique_id)
+            if previous is not None:
+                if previous == line:
+                    continue
+                self._remove(line.unique_id)
+            else:
+                self._positions[line.unique_id] = self._next_position
+                self._next_position += 1
+            self._add(line)
+            changed += 1
+        return changed
+    
+    def delete(self, unique_ids: Iterable[str]) -> int:
+        """Remove rows by ``unique_id``; returns the number removed."""
+        removed = 0
+        for unique_id in unique_ids:
+            if unique_id in self._lines:
+                self._remove(unique_id)
+                del self._positions[unique_id]
+                removed += 1
+        return removed
+    
+    def apply(self, schedule_lines: Iterable[ScheduleLine]) -> Dict[str, int]:
+        """Bring the session in line with a complete new export.
+
+        Only inserted and changed rows are re-evaluated; rows missing from
+        the export are deleted and row order follows the export. An export
+        with a duplicate Unique ID raises ``ValueError`` and leaves the
+        session unchanged.
+        """
+        schedule_lines = list(schedule_lines)
+        seen: Dict[str, None] = {}
+        for line in schedule_lines:
+            if line.unique_id in seen:
+                raise ValueError(f"Duplicate Unique ID in schedule: {line.unique_id}")
+            seen[line.unique_id] = None
+        
+        inserted = updated = 0
+        for line in schedule_lines:
+            is_new = line.unique_id not in self._lines
+            if self.upsert([line]):
+                if is_new:
+                    inserted += 1
+                else:
+                    updated += 1
+        
+        deleted = self.delete([unique_id for unique_id in self._lines if unique_id not in seen])
+        positions = {unique_id: position for position, unique_id in enumerate(seen)}
+        if positions != self._positions:
+            renumbered = {self._positions[unique_id]: position for unique_id, position in positions.items()}
+            for index in (*self._failed, *self._kept):
+                index.renumber(renumbered)
+            self._network = None
+        self._positions = positions
+        self._next_position = len(seen)
+        return {'inserted': inserted, 'updated': updated, 'deleted': deleted,
+                'unchanged': len(seen) - inserted - updated}
+    
+    def results(self) -> Dict[str, Any]:
+        """Current analysis, shaped and ordered exactly as ``analyze_schedule`` returns it.
+
+        Failed tasks and kept rows are already held in row order, so the
+        counting points cost O(failures) plus their ``finalize``. The
+        critical path test and the CPLI keep row facts rather than counts
+        (every row, and every finish candidate), so they are re-evaluated
+        over all of them, in O(n). With the analyzer's ``check_network``
+        the network is rebuilt only after rows changed since the last call.
+        """
+        results = []
+        for i, (checker, template) in enumerate(zip(self.checkers, self._templates)):
+            acc = dataclasses.replace(template, total=self._totals[i], hits=self._hits[i],
+                                      failed=[text for texts in self._failed[i].values() for text in texts],
+                                      rows=[row for rows in self._kept[i].values() for row in rows])
+            results.append(checker.finalize(acc))
+        if self.analyzer.check_network and self._network is None:
+            # Loops and link checks are not local to a row, so the network is rebuilt in full
+            lines = sorted(self._lines.values(), key=lambda line: self._positions[line.unique_id])
+            self._network = ScheduleNetwork.from_lines(lines)
+        return self.analyzer.summarize(results, self._network if self.analyzer.check_network else None)
+    
+    def line(self, unique_id: str) -> Optional[ScheduleLine]:
+        """Current row with ``unique_id``, if any."""
+        return self._lines.get(unique_id)
\ No newline at end of file
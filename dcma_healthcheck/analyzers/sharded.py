@@ -0,0 +1,159 @@
+"""Parallel evaluation of one large schedule split into row shards."""
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from ..base_checker import BaseChecker, CheckAccumulator
+from ..models.field_parsers import DEFAULT_PARSER, FieldParser
+from ..models.schedule_data import ScheduleLine
+from ..models.schedule_network import NetworkRow, ScheduleNetwork, network_row
+from ..readers.csv_reader import COMPRESSION_MAGIC, ScheduleSource
+from .check_engine import CheckEngine, supports_accumulate
+
+# Below this many bytes per shard, process start-up outweighs the parallel gain
+MIN_SHARD_BYTES = 1 << 20
+
+# Checkers and parser of the current worker process, set by ``_init_worker``
+_worker_engine: Optional[CheckEngine] = None
+_worker_parser: Optional[FieldParser] = None
+
+
+def is_shardable(source: ScheduleSource) -> bool:
+    """True for an uncompressed file on disk, whose rows can be reached by seeking."""
+    if not isinstance(source, (str, os.PathLike)) or os.fspath(source) == '-':
+        return False
+    if not os.path.isfile(source):
+        return False
+    with open(source, 'rb') as file:
+        head = file.read(6)
+    return not any(head.startswith(magic) for magic, _ in COMPRESSION_MAGIC)
+
+
+def plan_shards(path: str, shards: int, has_headers: bool = True,
+                encoding: str = 'utf-8') -> Tuple[Optional[List[str]], List[Tuple[int, int]]]:
+    """Split a tab-separated file into byte ranges of roughly equal size.
+
+    Returns the header names (None without headers) and ``(start, end)``
+    ranges; a row belongs to the range its first byte falls in, so ranges
+    need not be aligned to line breaks.
+    """
+    headers = None
+    data_start = 0
+    if has_headers:
+        with open(path, 'rb') as file:
+            header_line = file.readline()
+            data_start = file.tell()
+        headers = [h.strip() for h in header_line.decode(encoding).split('\t')]
+    
+    size = os.path.getsize(path)
+    step = max(-(-(size - data_start) // max(shards, 1)), 1)
+    ranges = [(start, min(start + step, size)) for start in range(data_start, size, step)]
+    return headers, ranges
+
+
+def iter_shard_lines(path: str, start: int, end: int, headers: Optional[List[str]],
+                     parser: FieldParser, encoding: str = 'utf-8'):
+    """Parse the rows whose first byte lies in ``[start, end)``."""
+    with open(path, 'rb') as file:
+        position = start
+        if start > 0:
+            # Skip the tail of a row that began in the previous shard
+            file.seek(start - 1)
+            position = start - 1 + len(file.readline())
+        
+        for raw in file:
+            if position >= end:
+                break
+            offset = position
+            position += len(raw)
+            line = raw.decode(encoding)
+            if not line.strip():
+                continue
+            try:
+                if headers is None:
+                    yield ScheduleLine.from_csv_line(line, parser)
+                else:
+                    values = [v.strip() for v in line.split('\t')]
+                    yield ScheduleLine.from_csv_with_headers(dict(zip(headers, values)), parser)
+            except Exception as e:
+                print(f"Error parsing line at byte {offset}: {e}")
+
+
+def _init_worker(checkers: Sequence[BaseChecker], locale: str, date_formats: Tuple[str, ...]) -> None:
+    """Process pool initializer: build the engine and parser once per worker."""
+    global _worker_engine, _worker_parser
+    _worker_engine = CheckEngine(checkers)
+    _worker_parser = FieldParser(locale, date_formats)
+
+
+def _observe(schedule_lines: Iterable[ScheduleLine], rows: List[NetworkRow]) -> Iterator[ScheduleLine]:
+    """Pass lines through, keeping the fields the schedule network needs."""
+    for line in schedule_lines:
+        rows.append(network_row(line))
+        yield line
+
+
+def _check_shard(path: str, start: int, end: int, headers: Optional[List[str]], encoding: str,
+                 accumulators: List[CheckAccumulator],
+                 max_failed: Optional[int],
+                 network: bool) -> Tuple[List[CheckAccumulator], Optional[List[NetworkRow]]]:
+    """Worker entry point: fold one shard into the accumulators it was given."""
+    rows: Optional[List[NetworkRow]] = [] if network else None
+    lines = iter_shard_lines(path, start, end, headers, _worker_parser, encoding)
+    _worker_engine.feed(accumulators, _observe(lines, rows) if network else lines)
+    if max_failed is not None:
+        for acc in accumulators:
+            del acc.failed[max_failed:]
+    return accumulators, rows
+
+
+def analyze_sharded(checkers: Sequence[BaseChecker], path: str, workers: Optional[int] = None,
+                    has_headers: bool = True, parser: Optional[FieldParser] = None,
+                    encoding: str = 'utf-8',
+                    max_failed: Optional[int] = None,
+                    network: bool = False) -> Tuple[List[Dict[str, Any]], Optional[ScheduleNetwork]]:
+    """Run every checker over a tab-separated file split across worker processes.
+
+    Each worker parses and checks one byte range of the file with the fused
+    engine, starting from accumulators created here (so date-based points
+    share one data date). Partial accumulators are merged in file order, so
+    the results equal a serial run; ``max_failed`` optionally caps the
+    failed-task samples kept per point. With ``network`` workers also send
+    back each row's ID and links, from which the whole-schedule network is
+    built here; otherwise None is returned in its place.
+    """
+    engine = CheckEngine(checkers)
+    parser = parser or DEFAULT_PARSER
+    if not all(supports_accumulate(checker) for checker in checkers):
+        raise ValueError("Sharded analysis needs every checker to implement accumulate/finalize")
+    
+    workers = workers or os.cpu_count() or 1
+    shards = max(1, min(workers, os.path.getsize(path) // MIN_SHARD_BYTES))
+    headers, ranges = plan_shards(path, shards, has_headers, encoding)
+    
+    # Every shard starts from a copy of the same fresh state, e.g. one data date
+    template = engine.start()
+    accumulators = copy.deepcopy(template)
+    rows: List[NetworkRow] = []
+    if len(ranges) <= 1:
+        lines = (line for start, end in ranges
+                 for line in iter_shard_lines(path, start, end, headers, parser, encoding))
+        engine.feed(accumulators, _observe(lines, rows) if network else lines)
+    else:
+        with ProcessPoolExecutor(max_workers=len(ranges), initializer=_init_worker,
+                                 initargs=(list(checkers), parser.locale, parser.date_formats)) as executor:
+            futures = [
+                executor.submit(_check_shard, path, start, end, headers, encoding, copy.deepcopy(template),
+                                max_failed, network)
+                for start, end in ranges
+            ]
+            for future in futures:
+                part, shard_rows = future.result()
+                engine.merge(accumulators, part, max_failed)
+                if shard_rows is not None:
+                    rows.extend(shard_rows)
+    
+    if max_failed is not None:
+        for acc in accumulators:
+            del acc.failed[max_failed:]
+    return engine.finish(accumulators, []), ScheduleNetwork.build(rows) if network else None
\ No newline at end of file
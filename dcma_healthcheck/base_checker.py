@@ -1,12 +1,53 @@
 """Base class for all DCMA checkers."""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Callable, Iterable, List, Dict, Any, Optional, Sequence
+from .models.check_result import NOT_APPLICABLE, CheckResult, FailedTasks, Severity
 from .models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    from .models.schedule_table import ScheduleTable
+
+# WBS STD codes of start, finish and milestone rows, which several points exclude
+MILESTONE_WBS = ('START', 'CMPLT', 'MLSTN')
+
+RowFilter = Callable[[ScheduleLine], bool]
+
+# Pre-filters shared between checkers, named by ``BaseChecker.row_filter``
+ROW_FILTERS: Dict[str, RowFilter] = {
+    'activity': lambda line: line.wbs_std not in MILESTONE_WBS,
+    'has_duration': lambda line: line.duration > 0,
+    'activity_with_duration': lambda line: line.wbs_std not in MILESTONE_WBS and line.duration > 0,
+}
+
+
+@dataclass
+class CheckAccumulator:
+    """Running state of one checker during a single pass over the schedule."""
+    total: int = 0
+    hits: int = 0
+    # Raw failure entries, formatted only when read (see ``FailedTasks``)
+    failed: List[Any] = field(default_factory=list)
+    data_date: Optional[date] = None
+    # Per-row facts kept by checkers that finish with a whole-schedule pass
+    rows: List[Any] = field(default_factory=list)
+
 
 class BaseChecker(ABC):
     """Base class for all DCMA point checkers."""
     
+    # Name of a shared pre-filter (see ``ROW_FILTERS``) rows must
+    # pass before ``accumulate`` sees them; None means every row
+    row_filter: Optional[str] = None
+    
+    # ``str.format`` template turning a failure entry tuple into its text; None
+    # when the checker reports ready-made strings
+    failed_template: Optional[str] = None
+    
+    # Entry field and direction ``FailedTasks.top`` ranks failures by
+    severity: Optional[Severity] = None
+    
     def __init__(self, point_number: int, description: str, threshold: str, 
                  recommendation: str):
         """Initialize checker with point details."""
@@ -14,24 +55,94 @@ class BaseChecker(ABC):
         self.description = description
         self.threshold = threshold
         self.recommendation = recommendation
-        
+    
     @abstractmethod
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
         """Check the schedule against this DCMA point.
         
         Returns:
-            Dict with 'passed', 'value', 'threshold', 'failed_tasks', 'recommendation'
+            ``CheckResult`` with 'passed', 'value', 'threshold', 'failed_tasks', 'recommendation'
         """
         pass
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Check a columnar ``ScheduleTable`` against this DCMA point.
         
-    def format_result(self, passed: bool, value: Any, failed_tasks: List[str] = None) -> Dict[str, Any]:
-        """Format the check result consistently."""
-        return {
-            'point': self.point_number,
-            'description': self.description,
-            'threshold': self.threshold,
-            'value': value,
-            'passed': passed,
-            'failed_tasks': failed_tasks or [],
-            'recommendation': self.recommendation if not passed else None
-        }
\ No newline at end of file
+        Checkers override this with a vectorized implementation. The default
+        materialises the rows and falls back to ``check``.
+        """
+        return self.check(list(table.iter_lines()))
+    
+    def fold(self, schedule_lines: Iterable[ScheduleLine]) -> Dict[str, Any]:
+        """Run the rows that pass ``row_filter`` through ``accumulate`` and ``finalize``.
+        
+        Checkers with both hooks implement ``check`` with this, so the
+        row-wise, fused and incremental paths share one rule.
+        """
+        acc = self.new_accumulator()
+        row_filter = ROW_FILTERS[self.row_filter] if self.row_filter else None
+        for line in schedule_lines:
+            if row_filter is None or row_filter(line):
+                self.accumulate(acc, line)
+        return self.finalize(acc)
+    
+    def new_accumulator(self) -> CheckAccumulator:
+        """Fresh state for a single-pass evaluation."""
+        return CheckAccumulator()
+    
+    def accumulate(self, acc: CheckAccumulator, line: ScheduleLine) -> None:
+        """Fold one row that passed ``row_filter`` into ``acc``.
+        
+        Checkers that support fused evaluation override this together with
+        ``finalize``; the engines only call the hooks of checkers that
+        override both (see ``check_engine.supports_accumulate``) and fall
+        back to ``check`` for the others.
+        """
+        raise NotImplementedError
+    
+    def merge(self, acc: CheckAccumulator, other: CheckAccumulator) -> CheckAccumulator:
+        """Combine the state of two consecutive runs of rows into ``acc``.
+        
+        Counts add up and ``other``'s failures follow ``acc``'s, so merging
+        shards in order gives the same result as a single pass.
+        """
+        acc.total += other.total
+        acc.hits += other.hits
+        acc.failed.extend(other.failed)
+        acc.rows.extend(other.rows)
+        return acc
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """Turn accumulated state into the same result ``check`` returns (see ``accumulate``)."""
+        raise NotImplementedError
+    
+    def failed(self, entries: Optional[List[Any]] = None, columns: Optional[tuple] = None) -> FailedTasks:
+        """Wrap failure entries (or aligned columns of them) with this checker's template and severity."""
+        return FailedTasks(self.failed_template, entries, self.severity, columns)
+    
+    def format_result(self, passed: Optional[bool], value: Any,
+                      failed_tasks: Optional[Sequence[Any]] = None) -> CheckResult:
+        """Format the check result consistently.
+        
+        ``failed_tasks`` is a ``FailedTasks`` or a list of entries in this
+        checker's ``failed_template`` layout. ``passed`` is None for a point
+        that could not be measured (see ``not_applicable``).
+        """
+        if not isinstance(failed_tasks, FailedTasks):
+            failed_tasks = self.failed(list(failed_tasks or []))
+        return CheckResult(
+            point=self.point_number,
+            description=self.description,
+            threshold=self.threshold,
+            value=value,
+            passed=passed,
+            failed_tasks=failed_tasks,
+            recommendation=self.recommendation if passed is False else None
+        )
+    
+    def not_applicable(self) -> CheckResult:
+        """Result of a point that cannot be measured on this schedule, e.g. BEI without a baseline.
+
+        It is neither passed nor failed, and is left out of the summary counts.
+        """
+        return self.format_result(None, NOT_APPLICABLE)
\ No newline at end of file
@@ -1,12 +1,26 @@
 """DCMA Point 1: Logic checker."""
-from typing import List, Dict, Any
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any, Sequence
+from ..base_checker import MILESTONE_WBS, BaseChecker, CheckAccumulator
 from ..models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+# Lowest share of activities with both predecessors and successors that passes, in percent
+MIN_LOGIC_PERCENT = 95.0
+
+
+def has_links(links: Sequence[str]) -> bool:
+    """True if a predecessor or successor list names at least one activity."""
+    return bool(links and links != [''])
+
 
 class Point01Logic(BaseChecker):
     """Check that ≥95% of activities have predecessors and successors."""
     
+    row_filter = 'activity'
+    failed_template = "{0}: {1}"
+    
     def __init__(self):
         super().__init__(
             point_number=1,
@@ -16,33 +30,36 @@ class Point01Logic(BaseChecker):
         )
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
-        """Check logic connectivity."""
-        if not schedule_lines:
-            return self.format_result(True, "100%", [])
-            
-        # Filter out start and milestone tasks
-        regular_tasks = [
-            line for line in schedule_lines 
-            if line.wbs_std not in ['START', 'CMPLT', 'MLSTN']
-        ]
-        
-        if not regular_tasks:
-            return self.format_result(True, "100%", [])
-            
-        # Count tasks with proper logic
-        tasks_with_logic = 0
-        failed_tasks = []
+        """Check logic connectivity of the activities (start and milestone tasks excluded)."""
+        return self.fold(schedule_lines)
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Count one activity towards the logic percentage."""
+        acc.total += 1
+        if has_links(task.predecessors) and has_links(task.successors):
+            acc.hits += 1
+        else:
+            acc.failed.append((task.unique_id, task.task_name))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """Logic result from accumulated counts."""
+        return self._result(acc.hits, acc.total, acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized logic connectivity check."""
+        regular = ~table.wbs_std.isin(MILESTONE_WBS)
+        total = int(regular.sum())
         
-        for task in regular_tasks:
-            has_predecessors = bool(task.predecessors and task.predecessors != [''])
-            has_successors = bool(task.successors and task.successors != [''])
-            
-            if has_predecessors and has_successors:
-                tasks_with_logic += 1
-            else:
-                failed_tasks.append(f"{task.unique_id}: {task.task_name}")
+        has_logic = (table.predecessors.counts > 0) & (table.successors.counts > 0)
+        rows = (regular & ~has_logic).nonzero()[0]
+        failed_tasks = self.failed(columns=(table.unique_id[rows], table.task_name[rows]))
         
-        percentage = (tasks_with_logic / len(regular_tasks)) * 100
-        passed = percentage >= 95.0
+        return self._result(total - len(failed_tasks), total, failed_tasks)
+    
+    def _result(self, with_logic: int, total: int, failed_tasks) -> Dict[str, Any]:
+        """Logic result from the number of activities with logic out of ``total``."""
+        if not total:
+            return self.format_result(True, "100%", [])
         
-        return self.format_result(passed, f"{percentage:.1f}%", failed_tasks)
\ No newline at end of file
+        percentage = (with_logic / total) * 100
+        return self.format_result(percentage >= MIN_LOGIC_PERCENT, f"{percentage:.1f}%", failed_tasks)
\ No newline at end of file
@@ -1,12 +1,23 @@
 """DCMA Point 2: Leads (Negative Lag) checker."""
-from typing import List, Dict, Any
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any
+from ..base_checker import BaseChecker, CheckAccumulator
 from ..models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+
+def is_lead(lag):
+    """True where a link's lag is negative (e.g., "76FS-5 days"); works on scalars and arrays."""
+    return lag < 0
+
 
 class Point02Leads(BaseChecker):
     """Check that there are no negative lag values (leads)."""
     
+    failed_template = "{0}: {1} (predecessor: {2})"
+    severity = (3, -1)
+    
     def __init__(self):
         super().__init__(
             point_number=2,
@@ -17,15 +28,27 @@ class Point02Leads(BaseChecker):
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
         """Check for negative lag values in predecessor relationships."""
-        failed_tasks = []
-        negative_lag_count = 0
+        return self.fold(schedule_lines)
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Record the negative-lag links of one task."""
+        for link in task.predecessor_links:
+            if is_lead(link.lag):
+                acc.hits += 1
+                acc.failed.append((task.unique_id, task.task_name, link.token, link.lag))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """Leads result from accumulated counts."""
+        return self.format_result(acc.hits == 0, str(acc.hits), acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized check for negative lag values."""
+        links = table.predecessors
+        negative = is_lead(table.link_lags)
         
-        for task in schedule_lines:
-            # Check predecessors for lag indicators (e.g., "76FS-5 days")
-            for pred in task.predecessors:
-                if 'FS-' in pred or 'SS-' in pred or 'FF-' in pred or 'SF-' in pred:
-                    negative_lag_count += 1
-                    failed_tasks.append(f"{task.unique_id}: {task.task_name} (predecessor: {pred})")
+        owners = links.owners[negative]
+        failed_tasks = self.failed(columns=(table.unique_id[owners], table.task_name[owners],
+                                            links.values[negative], table.link_lags[negative]))
         
-        passed = negative_lag_count == 0
-        return self.format_result(passed, str(negative_lag_count), failed_tasks)
\ No newline at end of file
+        passed = not failed_tasks
+        return self.format_result(passed, str(len(failed_tasks)), failed_tasks)
\ No newline at end of file
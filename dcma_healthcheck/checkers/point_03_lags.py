@@ -1,12 +1,26 @@
 """DCMA Point 3: Lags checker."""
-from typing import List, Dict, Any
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any
+from ..base_checker import BaseChecker, CheckAccumulator
 from ..models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+# Highest share of relationships with positive lag that passes, in percent
+MAX_LAG_PERCENT = 5.0
+
+
+def is_lag(lag):
+    """True where a link's lag is positive (e.g., "76FS+5 days"); works on scalars and arrays."""
+    return lag > 0
+
 
 class Point03Lags(BaseChecker):
     """Check that ≤5% of dependencies have positive lag."""
     
+    failed_template = "{0}: {1} (predecessor: {2})"
+    severity = (3, 1)
+    
     def __init__(self):
         super().__init__(
             point_number=3,
@@ -17,27 +31,35 @@ class Point03Lags(BaseChecker):
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
         """Check for excessive positive lag (>5% of relationships)."""
-        if not schedule_lines:
-            return self.format_result(True, "0%", [])
-        
-        total_relationships = 0
-        positive_lag_count = 0
-        failed_tasks = []
+        return self.fold(schedule_lines)
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Count one task's links and record those with positive lag."""
+        acc.total += len(task.predecessor_links)
+        for link in task.predecessor_links:
+            if is_lag(link.lag):
+                acc.hits += 1
+                acc.failed.append((task.unique_id, task.task_name, link.token, link.lag))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """Lags result from accumulated counts."""
+        return self._result(acc.hits, acc.total, acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized check for excessive positive lag."""
+        links = table.predecessors
+        positive = is_lag(table.link_lags)
         
-        for task in schedule_lines:
-            # Count all predecessor relationships
-            total_relationships += len(task.predecessors)
-            
-            # Check for positive lag indicators (e.g., "76FS+5 days")
-            for pred in task.predecessors:
-                if '+' in pred and ('FS+' in pred or 'SS+' in pred or 'FF+' in pred or 'SF+' in pred):
-                    positive_lag_count += 1
-                    failed_tasks.append(f"{task.unique_id}: {task.task_name} (predecessor: {pred})")
+        owners = links.owners[positive]
+        failed_tasks = self.failed(columns=(table.unique_id[owners], table.task_name[owners],
+                                            links.values[positive], table.link_lags[positive]))
         
-        if total_relationships == 0:
+        return self._result(len(failed_tasks), len(links.values), failed_tasks)
+    
+    def _result(self, lagged: int, total: int, failed_tasks) -> Dict[str, Any]:
+        """Lags result from the number of lagged relationships out of ``total``."""
+        if not total:
             return self.format_result(True, "0%", [])
         
-        percentage = (positive_lag_count / total_relationships) * 100
-        passed = percentage <= 5.0
-        
-        return self.format_result(passed, f"{percentage:.1f}%", failed_tasks)
\ No newline at end of file
+        percentage = (lagged / total) * 100
+        return self.format_result(percentage <= MAX_LAG_PERCENT, f"{percentage:.1f}%", failed_tasks)
\ No newline at end of file
@@ -1,12 +1,29 @@
 """DCMA Point 4: Relationship Types checker."""
-from typing import List, Dict, Any
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any
+from ..base_checker import BaseChecker, CheckAccumulator
+from ..models.relationships import RelationType
 from ..models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+# Lowest share of Finish-to-Start relationships that passes, in percent
+MIN_FS_PERCENT = 90.0
+
+
+def is_finish_to_start(relation_type):
+    """True where a link is Finish-to-Start; works on ``RelationType`` values and arrays of their codes.
+
+    Links without an explicit type are parsed as FS.
+    """
+    return relation_type == RelationType.FS
+
 
 class Point04RelationshipTypes(BaseChecker):
     """Check that ≥90% of relationships are Finish-to-Start (FS)."""
     
+    failed_template = "{0}: {1} ({2} with {3})"
+    
     def __init__(self):
         super().__init__(
             point_number=4,
@@ -17,30 +34,39 @@ class Point04RelationshipTypes(BaseChecker):
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
         """Check that ≥90% of relationships are Finish-to-Start (FS)."""
-        if not schedule_lines:
-            return self.format_result(True, "100% FS", [])
-        
-        total_relationships = 0
-        fs_relationships = 0
-        non_fs_tasks = []
+        return self.fold(schedule_lines)
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Count one task's links and record the non-FS ones."""
+        for link in task.predecessor_links:
+            acc.total += 1
+            if is_finish_to_start(link.type):
+                acc.hits += 1
+            else:
+                acc.failed.append((task.unique_id, task.task_name, link.type.name, link.token))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """Relationship type result from accumulated counts."""
+        return self._result(acc.hits, acc.total, acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized check of the Finish-to-Start share."""
+        links = table.predecessors
+        total_relationships = len(links.values)
         
-        for task in schedule_lines:
-            for pred in task.predecessors:
-                total_relationships += 1
-                
-                # Check relationship type in predecessor string
-                if 'SS' in pred or 'FF' in pred or 'SF' in pred:
-                    # Non-FS relationship found
-                    relationship_type = 'SS' if 'SS' in pred else 'FF' if 'FF' in pred else 'SF'
-                    non_fs_tasks.append(f"{task.unique_id}: {task.task_name} ({relationship_type} with {pred})")
-                else:
-                    # Assume FS if no other type specified
-                    fs_relationships += 1
+        non_fs = ~is_finish_to_start(table.link_types)
+        type_names = {relation_type.value: relation_type.name for relation_type in RelationType}
+        owners = links.owners[non_fs]
+        non_fs_tasks = self.failed(columns=(table.unique_id[owners], table.task_name[owners],
+                                            [type_names[code] for code in table.link_types[non_fs].tolist()],
+                                            links.values[non_fs]))
         
-        if total_relationships == 0:
+        return self._result(total_relationships - len(non_fs_tasks), total_relationships, non_fs_tasks)
+    
+    def _result(self, finish_to_start: int, total: int, non_fs_tasks) -> Dict[str, Any]:
+        """Relationship type result from the number of FS relationships out of ``total``."""
+        if not total:
             return self.format_result(True, "100% FS", [])
         
-        fs_percentage = (fs_relationships / total_relationships) * 100
-        passed = fs_percentage >= 90.0
-        
-        return self.format_result(passed, f"{fs_percentage:.1f}% FS", non_fs_tasks)
\ No newline at end of file
+        fs_percentage = (finish_to_start / total) * 100
+        return self.format_result(fs_percentage >= MIN_FS_PERCENT, f"{fs_percentage:.1f}% FS", non_fs_tasks)
\ No newline at end of file
@@ -1,12 +1,23 @@
 """DCMA Point 5: Start-to-Finish Relations checker."""
-from typing import List, Dict, Any
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any
+from ..base_checker import BaseChecker, CheckAccumulator
+from ..models.relationships import RelationType
 from ..models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+
+def is_start_to_finish(relation_type):
+    """True where a link is Start-to-Finish; works on ``RelationType`` values and arrays of their codes."""
+    return relation_type == RelationType.SF
+
 
 class Point05StartToFinish(BaseChecker):
     """Check that there are no Start-to-Finish dependencies."""
     
+    failed_template = "{0}: {1} (SF with {2})"
+    
     def __init__(self):
         super().__init__(
             point_number=5,
@@ -17,14 +28,26 @@ class Point05StartToFinish(BaseChecker):
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
         """Check for Start-to-Finish relationships."""
-        sf_count = 0
-        failed_tasks = []
+        return self.fold(schedule_lines)
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Record the SF links of one task."""
+        for link in task.predecessor_links:
+            if is_start_to_finish(link.type):
+                acc.hits += 1
+                acc.failed.append((task.unique_id, task.task_name, link.token))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """SF result from accumulated counts."""
+        return self.format_result(acc.hits == 0, str(acc.hits), acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized check for Start-to-Finish relationships."""
+        links = table.predecessors
+        sf = is_start_to_finish(table.link_types)
         
-        for task in schedule_lines:
-            for pred in task.predecessors:
-                if 'SF' in pred:
-                    sf_count += 1
-                    failed_tasks.append(f"{task.unique_id}: {task.task_name} (SF with {pred})")
+        owners = links.owners[sf]
+        failed_tasks = self.failed(columns=(table.unique_id[owners], table.task_name[owners], links.values[sf]))
         
-        passed = sf_count == 0
-        return self.format_result(passed, str(sf_count), failed_tasks)
\ No newline at end of file
+        passed = not failed_tasks
+        return self.format_result(passed, str(len(failed_tasks)), failed_tasks)
\ No newline at end of file
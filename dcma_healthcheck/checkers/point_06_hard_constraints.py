@@ -1,12 +1,24 @@
 """DCMA Point 6: Hard Constraints checker."""
-from typing import List, Dict, Any
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any
+from ..base_checker import MILESTONE_WBS, BaseChecker, CheckAccumulator
 from ..models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+# Constraint types that fix an activity's dates regardless of its logic
+HARD_CONSTRAINTS = ('Must Start On', 'Must Finish On', 'Start On', 'Finish On')
+
+# Highest share of hard-constrained activities that passes, in percent
+MAX_CONSTRAINED_PERCENT = 5.0
+
 
 class Point06HardConstraints(BaseChecker):
     """Check that ≤5% of activities have hard constraints."""
     
+    row_filter = 'activity'
+    failed_template = "{0}: {1} ({2})"
+    
     def __init__(self):
         super().__init__(
             point_number=6,
@@ -16,36 +28,34 @@ class Point06HardConstraints(BaseChecker):
         )
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
-        """Check for hard constraints (≤5% of activities)."""
-        if not schedule_lines:
-            return self.format_result(True, "0%", [])
+        """Check for hard constraints (≤5% of activities, milestones excluded)."""
+        return self.fold(schedule_lines)
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Count one activity and record it if hard constrained."""
+        acc.total += 1
+        if task.constraint_type in HARD_CONSTRAINTS:
+            acc.hits += 1
+            acc.failed.append((task.unique_id, task.task_name, task.constraint_type))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """Hard constraint result from accumulated counts."""
+        return self._result(acc.hits, acc.total, acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized check for hard constraints."""
+        regular = ~table.wbs_std.isin(MILESTONE_WBS)
         
-        # Filter out milestone tasks for this check
-        regular_tasks = [
-            task for task in schedule_lines 
-            if task.wbs_std not in ['START', 'CMPLT', 'MLSTN']
-        ]
+        rows = (regular & table.constraint_type.isin(HARD_CONSTRAINTS)).nonzero()[0]
+        failed_tasks = self.failed(columns=(table.unique_id[rows], table.task_name[rows],
+                                            [table.constraint_type[i] for i in rows]))
         
-        if not regular_tasks:
+        return self._result(len(failed_tasks), int(regular.sum()), failed_tasks)
+    
+    def _result(self, constrained: int, total: int, failed_tasks) -> Dict[str, Any]:
+        """Hard constraint result from the number of constrained activities out of ``total``."""
+        if not total:
             return self.format_result(True, "0%", [])
         
-        hard_constraint_count = 0
-        failed_tasks = []
-        
-        # Check for hard constraints
-        hard_constraint_types = [
-            'Must Start On',
-            'Must Finish On',
-            'Start On',
-            'Finish On'
-        ]
-        
-        for task in regular_tasks:
-            if task.constraint_type in hard_constraint_types:
-                hard_constraint_count += 1
-                failed_tasks.append(f"{task.unique_id}: {task.task_name} ({task.constraint_type})")
-        
-        percentage = (hard_constraint_count / len(regular_tasks)) * 100
-        passed = percentage <= 5.0
-        
-        return self.format_result(passed, f"{percentage:.1f}%", failed_tasks)
\ No newline at end of file
+        percentage = (constrained / total) * 100
+        return self.format_result(percentage <= MAX_CONSTRAINED_PERCENT, f"{percentage:.1f}%", failed_tasks)
\ No newline at end of file
@@ -1,12 +1,30 @@
 """DCMA Point 7: High Float checker."""
-from typing import List, Dict, Any
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any
+from ..base_checker import MILESTONE_WBS, BaseChecker, CheckAccumulator
 from ..models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+# Total float above which an activity counts as high float, in days
+HIGH_FLOAT_DAYS = 44
+
+# Highest share of high float activities that passes, in percent
+MAX_HIGH_FLOAT_PERCENT = 5.0
+
+
+def is_high_float(total_slack):
+    """True where total float exceeds ``HIGH_FLOAT_DAYS``; works on scalars and arrays."""
+    return total_slack > HIGH_FLOAT_DAYS
+
 
 class Point07HighFloat(BaseChecker):
     """Check that ≤5% of activities have float >44 days."""
     
+    row_filter = 'activity_with_duration'
+    failed_template = "{0}: {1} ({2} days float)"
+    severity = (2, 1)
+    
     def __init__(self):
         super().__init__(
             point_number=7,
@@ -16,28 +34,34 @@ class Point07HighFloat(BaseChecker):
         )
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
-        """Check for high float values (>44 days)."""
-        if not schedule_lines:
-            return self.format_result(True, "0%", [])
+        """Check for high float values (>44 days) of activities with duration."""
+        return self.fold(schedule_lines)
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Count one activity and record it if its float is high."""
+        acc.total += 1
+        if is_high_float(task.total_slack):
+            acc.hits += 1
+            acc.failed.append((task.unique_id, task.task_name, task.total_slack))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """High float result from accumulated counts."""
+        return self._result(acc.hits, acc.total, acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized check for high float values."""
+        regular = ~table.wbs_std.isin(MILESTONE_WBS) & (table.duration > 0)
         
-        # Filter out milestone and completed tasks
-        regular_tasks = [
-            task for task in schedule_lines 
-            if task.wbs_std not in ['START', 'CMPLT', 'MLSTN'] and task.duration > 0
-        ]
+        rows = (regular & is_high_float(table.total_slack)).nonzero()[0]
+        failed_tasks = self.failed(columns=(table.unique_id[rows], table.task_name[rows],
+                                            table.total_slack[rows].tolist()))
         
-        if not regular_tasks:
+        return self._result(len(failed_tasks), int(regular.sum()), failed_tasks)
+    
+    def _result(self, high_float: int, total: int, failed_tasks) -> Dict[str, Any]:
+        """High float result from the number of high float activities out of ``total``."""
+        if not total:
             return self.format_result(True, "0%", [])
         
-        high_float_count = 0
-        failed_tasks = []
-        
-        for task in regular_tasks:
-            if task.total_slack > 44:
-                high_float_count += 1
-                failed_tasks.append(f"{task.unique_id}: {task.task_name} ({task.total_slack} days float)")
-        
-        percentage = (high_float_count / len(regular_tasks)) * 100
-        passed = percentage <= 5.0
-        
-        return self.format_result(passed, f"{percentage:.1f}%", failed_tasks)
\ No newline at end of file
+        percentage = (high_float / total) * 100
+        return self.format_result(percentage <= MAX_HIGH_FLOAT_PERCENT, f"{percentage:.1f}%", failed_tasks)
\ No newline at end of file
@@ -1,12 +1,23 @@
 """DCMA Point 8: Negative Float checker."""
-from typing import List, Dict, Any
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any
+from ..base_checker import BaseChecker, CheckAccumulator
 from ..models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+
+def is_negative_float(total_slack):
+    """True where total float is negative; works on scalars and arrays."""
+    return total_slack < 0
+
 
 class Point08NegativeFloat(BaseChecker):
     """Check that there is no negative float."""
     
+    failed_template = "{0}: {1} ({2} days)"
+    severity = (2, -1)
+    
     def __init__(self):
         super().__init__(
             point_number=8,
@@ -17,13 +28,23 @@ class Point08NegativeFloat(BaseChecker):
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
         """Check for negative float values."""
-        negative_float_count = 0
-        failed_tasks = []
-        
-        for task in schedule_lines:
-            if task.total_slack < 0:
-                negative_float_count += 1
-                failed_tasks.append(f"{task.unique_id}: {task.task_name} ({task.total_slack} days)")
+        return self.fold(schedule_lines)
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Record one task if its float is negative."""
+        if is_negative_float(task.total_slack):
+            acc.hits += 1
+            acc.failed.append((task.unique_id, task.task_name, task.total_slack))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """Negative float result from accumulated counts."""
+        return self.format_result(acc.hits == 0, str(acc.hits), acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized check for negative float values."""
+        rows = is_negative_float(table.total_slack).nonzero()[0]
+        failed_tasks = self.failed(columns=(table.unique_id[rows], table.task_name[rows],
+                                            table.total_slack[rows].tolist()))
         
-        passed = negative_float_count == 0
-        return self.format_result(passed, str(negative_float_count), failed_tasks)
\ No newline at end of file
+        passed = not failed_tasks
+        return self.format_result(passed, str(len(failed_tasks)), failed_tasks)
\ No newline at end of file
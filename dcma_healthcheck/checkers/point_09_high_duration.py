@@ -1,12 +1,30 @@
 """DCMA Point 9: High Duration checker."""
-from typing import List, Dict, Any
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any
+from ..base_checker import BaseChecker, CheckAccumulator
 from ..models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+# Duration above which an activity counts as too long, in days
+HIGH_DURATION_DAYS = 44
+
+# Highest share of long activities that passes, in percent
+MAX_HIGH_DURATION_PERCENT = 5.0
+
+
+def is_high_duration(duration):
+    """True where a duration exceeds ``HIGH_DURATION_DAYS``; works on scalars and arrays."""
+    return duration > HIGH_DURATION_DAYS
+
 
 class Point09HighDuration(BaseChecker):
     """Check that ≤5% of activities have duration >44 days."""
     
+    row_filter = 'has_duration'
+    failed_template = "{0}: {1} ({2} days)"
+    severity = (2, 1)
+    
     def __init__(self):
         super().__init__(
             point_number=9,
@@ -16,29 +34,32 @@ class Point09HighDuration(BaseChecker):
         )
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
-        """Check for high duration activities."""
-        if not schedule_lines:
-            return self.format_result(True, "0%", [])
-            
-        # Filter out milestone tasks (duration = 0)
-        regular_tasks = [
-            line for line in schedule_lines 
-            if line.duration > 0
-        ]
+        """Check for high duration activities (milestones, with duration 0, excluded)."""
+        return self.fold(schedule_lines)
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Count one task with duration and record it if too long."""
+        acc.total += 1
+        if is_high_duration(task.duration):
+            acc.hits += 1
+            acc.failed.append((task.unique_id, task.task_name, task.duration))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """High duration result from accumulated counts."""
+        return self._result(acc.hits, acc.total, acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized check for high duration activities."""
+        rows = is_high_duration(table.duration).nonzero()[0]
+        failed_tasks = self.failed(columns=(table.unique_id[rows], table.task_name[rows],
+                                            table.duration[rows].tolist()))
         
-        if not regular_tasks:
+        return self._result(len(failed_tasks), int((table.duration > 0).sum()), failed_tasks)
+    
+    def _result(self, too_long: int, total: int, failed_tasks) -> Dict[str, Any]:
+        """High duration result from the number of long activities out of ``total``."""
+        if not total:
             return self.format_result(True, "0%", [])
-            
-        # Count tasks with high duration
-        high_duration_tasks = 0
-        failed_tasks = []
-        
-        for task in regular_tasks:
-            if task.duration > 44:
-                high_duration_tasks += 1
-                failed_tasks.append(f"{task.unique_id}: {task.task_name} ({task.duration} days)")
-        
-        percentage = (high_duration_tasks / len(regular_tasks)) * 100
-        passed = percentage <= 5.0
         
-        return self.format_result(passed, f"{percentage:.1f}%", failed_tasks)
\ No newline at end of file
+        percentage = (too_long / total) * 100
+        return self.format_result(percentage <= MAX_HIGH_DURATION_PERCENT, f"{percentage:.1f}%", failed_tasks)
\ No newline at end of file
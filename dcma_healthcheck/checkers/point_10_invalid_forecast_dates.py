@@ -1,13 +1,45 @@
 """DCMA Point 10: Invalid Forecast Dates checker."""
-from typing import List, Dict, Any
-from datetime import datetime
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
+from datetime import date, datetime
+from ..base_checker import BaseChecker, CheckAccumulator
 from ..models.schedule_data import ScheduleLine
 
+if TYPE_CHECKING:
+    import numpy as np
+    from ..models.schedule_table import ScheduleTable
+
+# Statuses of finished work, whose planned dates are not forecasts
+COMPLETE_STATUSES = ('Complete', 'Completed')
+
+
+def is_overdue(planned: Optional[datetime], actual: Optional[datetime], data_date: date) -> bool:
+    """True if a planned date lies before the data date without the matching actual date."""
+    return bool(planned) and planned.date() < data_date and not actual
+
+
+def start_finish_columns(table: 'ScheduleTable', bad_start: 'np.ndarray', bad_finish: 'np.ndarray',
+                         start: str, finish: str) -> tuple:
+    """Failure columns (unique_id, task_name, 'start' or 'finish', date) of the
+    flagged dates of columns ``start`` and ``finish``; by row, and a row's
+    start before its finish, as the row-wise checks list them.
+    """
+    import numpy as np
+    
+    rows = np.concatenate([bad_start.nonzero()[0], bad_finish.nonzero()[0]])
+    is_finish = np.repeat([False, True], [int(bad_start.sum()), int(bad_finish.sum())])
+    order = np.lexsort((is_finish, rows))
+    rows, is_finish = rows[order], is_finish[order]
+    dates = np.where(is_finish, table.columns[finish][rows], table.columns[start][rows])
+    return (table.unique_id[rows], table.task_name[rows], np.where(is_finish, 'finish', 'start').astype(object),
+            dates.astype(object))
+
 
 class Point10InvalidForecastDates(BaseChecker):
     """Check that no forecast dates are earlier than data date."""
     
+    failed_template = "{0}: {1} (planned {2}: {3:%m/%d/%y})"
+    severity = (3, -1)
+    
     def __init__(self):
         super().__init__(
             point_number=10,
@@ -18,25 +50,36 @@ class Point10InvalidForecastDates(BaseChecker):
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
         """Check for invalid forecast dates (planned dates before data date for incomplete work)."""
-        # Using current date as data date
-        data_date = datetime.now().date()
-        failed_tasks = []
-        invalid_count = 0
+        return self.fold(schedule_lines)
+    
+    def new_accumulator(self) -> CheckAccumulator:
+        """Fresh state, fixing the data date for the whole pass."""
+        return CheckAccumulator(data_date=datetime.now().date())
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Record planned dates of unfinished work that lie in the past."""
+        if task.status in COMPLETE_STATUSES:
+            return
+        if is_overdue(task.start_date, task.actual_start, acc.data_date):
+            acc.hits += 1
+            acc.failed.append((task.unique_id, task.task_name, 'start', task.start_date))
+        if is_overdue(task.finish_date, task.actual_finish, acc.data_date):
+            acc.hits += 1
+            acc.failed.append((task.unique_id, task.task_name, 'finish', task.finish_date))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """Invalid forecast result from accumulated counts."""
+        return self.format_result(acc.hits == 0, str(acc.hits), acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized check for invalid forecast dates."""
+        data_date = table.as_date(datetime.now())
+        incomplete = ~table.status.isin(COMPLETE_STATUSES)
         
-        for task in schedule_lines:
-            # Check incomplete tasks with planned dates in the past
-            if task.status not in ['Complete', 'Completed']:
-                # Check planned start date
-                if (task.start_date and task.start_date.date() < data_date and 
-                    not task.actual_start):
-                    invalid_count += 1
-                    failed_tasks.append(f"{task.unique_id}: {task.task_name} (planned start: {task.start_date.strftime('%m/%d/%y')})")
-                
-                # Check planned finish date
-                if (task.finish_date and task.finish_date.date() < data_date and 
-                    not task.actual_finish):
-                    invalid_count += 1
-                    failed_tasks.append(f"{task.unique_id}: {task.task_name} (planned finish: {task.finish_date.strftime('%m/%d/%y')})")
+        bad_start = incomplete & (table.start_date < data_date) & ~table.present('actual_start')
+        bad_finish = incomplete & (table.finish_date < data_date) & ~table.present('actual_finish')
+        failed_tasks = self.failed(columns=start_finish_columns(table, bad_start, bad_finish,
+                                                                'start_date', 'finish_date'))
         
-        passed = invalid_count == 0
-        return self.format_result(passed, str(invalid_count), failed_tasks)
\ No newline at end of file
+        passed = not failed_tasks
+        return self.format_result(passed, str(len(failed_tasks)), failed_tasks)
\ No newline at end of file
@@ -1,13 +1,25 @@
 """DCMA Point 11: Invalid Actual Dates checker."""
-from typing import List, Dict, Any
-from datetime import datetime
-from ..base_checker import BaseChecker
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
+from datetime import date, datetime
+from ..base_checker import BaseChecker, CheckAccumulator
 from ..models.schedule_data import ScheduleLine
+from .point_10_invalid_forecast_dates import start_finish_columns
+
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+
+def is_future(actual: Optional[datetime], data_date: date) -> bool:
+    """True if an actual date lies after the data date."""
+    return bool(actual) and actual.date() > data_date
 
 
 class Point11InvalidActualDates(BaseChecker):
     """Check that no actual dates are in the future."""
     
+    failed_template = "{0}: {1} (actual {2}: {3:%m/%d/%y})"
+    severity = (3, 1)
+    
     def __init__(self):
         super().__init__(
             point_number=11,
@@ -18,21 +30,33 @@ class Point11InvalidActualDates(BaseChecker):
     
     def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
         """Check for invalid actual dates (actual dates in the future)."""
-        # Using current date as data date
-        data_date = datetime.now().date()
-        failed_tasks = []
-        invalid_count = 0
+        return self.fold(schedule_lines)
+    
+    def new_accumulator(self) -> CheckAccumulator:
+        """Fresh state, fixing the data date for the whole pass."""
+        return CheckAccumulator(data_date=datetime.now().date())
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Record actual dates that lie in the future."""
+        if is_future(task.actual_start, acc.data_date):
+            acc.hits += 1
+            acc.failed.append((task.unique_id, task.task_name, 'start', task.actual_start))
+        if is_future(task.actual_finish, acc.data_date):
+            acc.hits += 1
+            acc.failed.append((task.unique_id, task.task_name, 'finish', task.actual_finish))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """Invalid actuals result from accumulated counts."""
+        return self.format_result(acc.hits == 0, str(acc.hits), acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized check for actual dates in the future."""
+        data_date = table.as_date(datetime.now())
         
-        for task in schedule_lines:
-            # Check actual start date
-            if task.actual_start and task.actual_start.date() > data_date:
-                invalid_count += 1
-                failed_tasks.append(f"{task.unique_id}: {task.task_name} (actual start: {task.actual_start.strftime('%m/%d/%y')})")
-            
-            # Check actual finish date
-            if task.actual_finish and task.actual_finish.date() > data_date:
-                invalid_count += 1
-                failed_tasks.append(f"{task.unique_id}: {task.task_name} (actual finish: {task.actual_finish.strftime('%m/%d/%y')})")
+        bad_start = table.actual_start > data_date
+        bad_finish = table.actual_finish > data_date
+        failed_tasks = self.failed(columns=start_finish_columns(table, bad_start, bad_finish,
+                                                                'actual_start', 'actual_finish'))
         
-        passed = invalid_count == 0
-        return self.format_result(passed, str(invalid_count), failed_tasks)
\ No newline at end of file
+        passed = not failed_tasks
+        return self.format_result(passed, str(len(failed_tasks)), failed_tasks)
\ No newline at end of file
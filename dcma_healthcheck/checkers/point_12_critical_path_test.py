@@ -0,0 +1,159 @@
+"""DCMA Point 12: Critical Path Test checker."""
+from datetime import datetime
+from itertools import repeat
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Sequence, Tuple
+from ..base_checker import BaseChecker, CheckAccumulator
+from ..models.schedule_data import ScheduleLine
+from ..models.schedule_network import link_id
+
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+# (unique_id, task_name, unique-ID predecessor tokens, critical, finish date, is a completion milestone)
+PathRow = Tuple[str, str, Sequence[str], bool, Optional[datetime], bool]
+
+# Failure texts, from the activity's unique_id and task_name
+FINISH_NOT_CRITICAL = "{}: {} (project finish is not critical)"
+PATH_BREAK = "{}: {} (no critical predecessor)"
+
+
+def project_finish(table: 'ScheduleTable') -> Optional[int]:
+    """Row of the project finish: the latest completion milestone (``CMPLT``),
+    or the latest finish without one; the last such row on ties. None when no
+    row has a finish date.
+    """
+    import numpy as np
+    
+    present = table.present('finish_date')
+    if not present.any():
+        return None
+    candidates = present & table.wbs_std.isin(['CMPLT'])
+    if not candidates.any():
+        candidates = present
+    finish = np.where(candidates, table.finish_date.view(np.int64), np.iinfo(np.int64).min)
+    return int(np.flatnonzero(finish == finish.max())[-1])
+
+
+class Point12CriticalPathTest(BaseChecker):
+    """Check that the critical path runs unbroken from the project start to its finish."""
+    
+    def __init__(self):
+        super().__init__(
+            point_number=12,
+            description="Critical Path Test",
+            threshold="Continuous",
+            recommendation="Repair the logic of activities where the critical path breaks so that a continuous driving path links the project start to its finish."
+        )
+    
+    @staticmethod
+    def path_row(task: ScheduleLine) -> PathRow:
+        """The fields the path trace needs from one line."""
+        return (task.unique_id, task.task_name, task.unique_id_predecessors, task.critical,
+                task.finish_date, task.wbs_std == 'CMPLT')
+    
+    def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
+        """Trace the critical path back from the project finish."""
+        return self.trace([self.path_row(task) for task in schedule_lines])
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Keep the row for the trace in ``finalize``."""
+        acc.rows.append(self.path_row(task))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """Critical path result from the kept rows."""
+        return self.trace(acc.rows)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Trace the critical path over the table's unique-ID predecessor links.
+
+        Only critical rows can be reached from the (critical) finish, so
+        only their links are resolved to rows, in bulk. The rows reached
+        through critical predecessors are then found with a depth-first walk
+        over the resulting compressed sparse rows.
+        """
+        import numpy as np
+        
+        finish = project_finish(table)
+        if finish is None:
+            return self.not_applicable()
+        if not table.critical[finish]:
+            return self.format_result(False, "Broken", [
+                FINISH_NOT_CRITICAL.format(table.unique_id[finish], table.task_name[finish])])
+        
+        # Row of each critical row's predecessor links (the first with its unique ID), -1 when missing
+        count = len(table)
+        predecessors = table.unique_id_predecessors
+        owners = predecessors.owners
+        kept = table.critical[owners]
+        owners = owners[kept]
+        tokens = predecessors.values[kept].tolist()
+        first_row = dict(zip(table.unique_id[::-1].tolist(), range(count - 1, -1, -1)))
+        targets = np.fromiter(map(first_row.get, map(link_id, tokens), repeat(-1)), dtype=np.int64, count=len(tokens))
+        linked = targets >= 0
+        driving = linked.copy()
+        driving[linked] = table.critical[targets[linked]]
+        has_linked = np.bincount(owners[linked], minlength=count) > 0
+        driving_counts = np.bincount(owners[driving], minlength=count)
+        
+        # Driving links grouped by row (owners are in row order), walked as plain lists
+        offsets = [0] + np.cumsum(driving_counts).tolist()
+        driving_targets = targets[driving].tolist()
+        reached = bytearray(count)
+        reached[finish] = True
+        stack = [finish]
+        while stack:
+            row = stack.pop()
+            for other in driving_targets[offsets[row]:offsets[row + 1]]:
+                if not reached[other]:
+                    reached[other] = True
+                    stack.append(other)
+        
+        breaks = np.flatnonzero(np.frombuffer(reached, dtype=bool) & has_linked & (driving_counts == 0))
+        failed_tasks = [PATH_BREAK.format(unique_id, task_name)
+                        for unique_id, task_name in zip(table.unique_id[breaks], table.task_name[breaks])]
+        passed = not failed_tasks
+        return self.format_result(passed, "Continuous" if passed else "Broken", failed_tasks)
+    
+    def trace(self, rows: Sequence[PathRow]) -> Dict[str, Any]:
+        """Follow critical predecessors back from the project finish.
+
+        The finish is the latest completion milestone (``CMPLT``), or the
+        latest-finishing activity without one. Every critical activity
+        reached must either have a critical predecessor or no predecessors
+        at all (the project start); others are where the path breaks.
+        """
+        index: Dict[str, int] = {}
+        finish: Optional[int] = None
+        for position, (unique_id, _, _, _, finish_date, is_completion) in enumerate(rows):
+            index.setdefault(unique_id, position)
+            if finish_date is None:
+                continue
+            if finish is None or (is_completion, finish_date) >= (rows[finish][5], rows[finish][4]):
+                finish = position
+        
+        if finish is None:
+            return self.not_applicable()
+        
+        unique_id, task_name, _, critical, _, _ = rows[finish]
+        if not critical:
+            return self.format_result(False, "Broken", [FINISH_NOT_CRITICAL.format(unique_id, task_name)])
+        
+        seen = {finish}
+        stack = [finish]
+        breaks = []
+        while stack:
+            position = stack.pop()
+            linked = [index[target] for target in map(link_id, rows[position][2]) if target in index]
+            if not linked:
+                continue
+            driving = [other for other in linked if rows[other][3]]
+            if not driving:
+                breaks.append(position)
+            for other in driving:
+                if other not in seen:
+                    seen.add(other)
+                    stack.append(other)
+        
+        failed_tasks = [PATH_BREAK.format(rows[position][0], rows[position][1]) for position in sorted(breaks)]
+        passed = not failed_tasks
+        return self.format_result(passed, "Continuous" if passed else "Broken", failed_tasks)
\ No newline at end of file
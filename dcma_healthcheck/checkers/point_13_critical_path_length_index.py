@@ -0,0 +1,87 @@
+"""DCMA Point 13: Critical Path Length Index checker."""
+from datetime import date, datetime
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Sequence, Tuple
+from ..analyzers.critical_path import working_days
+from ..base_checker import BaseChecker, CheckAccumulator
+from ..models.schedule_data import ScheduleLine
+from .point_12_critical_path_test import project_finish
+
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+# (is a completion milestone, finish date, unique_id, task_name, total slack); the first
+# two items rank candidates for the project finish
+FinishRow = Tuple[bool, datetime, str, str, float]
+
+
+class Point13CriticalPathLengthIndex(BaseChecker):
+    """Check that CPLI = (critical path length + total float) / critical path length is ≥ 0.95."""
+    
+    def __init__(self):
+        super().__init__(
+            point_number=13,
+            description="Critical Path Length Index",
+            threshold="≥ 0.95",
+            recommendation="Recover the negative float on the critical path, e.g. by re-sequencing or adding resources, so the project can still finish on time."
+        )
+    
+    def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
+        """Compute the CPLI of the project finish."""
+        acc = self.new_accumulator()
+        for task in schedule_lines:
+            self.accumulate(acc, task)
+        return self.finalize(acc)
+    
+    def new_accumulator(self) -> CheckAccumulator:
+        """Fresh state, fixing the data date for the whole pass."""
+        return CheckAccumulator(data_date=datetime.now().date())
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Keep the best project finish candidate seen so far."""
+        if not task.finish_date:
+            return
+        is_completion = task.wbs_std == 'CMPLT'
+        if acc.rows:
+            best = acc.rows[-1]
+            if (is_completion, task.finish_date) < (best[0], best[1]):
+                return
+            acc.rows.pop()
+        acc.rows.append((is_completion, task.finish_date, task.unique_id, task.task_name, task.total_slack))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """CPLI result from the kept finish candidates (one per merged run of rows)."""
+        return self.index(acc.rows, acc.data_date)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Compute the CPLI of the finish row picked from the table's columns."""
+        finish = project_finish(table)
+        rows = [] if finish is None else [
+            (table.wbs_std[finish] == 'CMPLT', table.date('finish_date', finish), table.unique_id[finish],
+             table.task_name[finish], float(table.total_slack[finish]))
+        ]
+        return self.index(rows, datetime.now().date())
+    
+    def index(self, rows: Sequence[FinishRow], data_date: date) -> Dict[str, Any]:
+        """CPLI of the project finish: the latest completion milestone, or the latest finish.
+
+        The critical path length is counted in working days from the data
+        date; a finish on or before the data date has no remaining path and
+        gives N/A.
+        """
+        finish: Optional[FinishRow] = None
+        for row in rows:
+            if finish is None or (row[0], row[1]) >= (finish[0], finish[1]):
+                finish = row
+        if finish is None:
+            return self.not_applicable()
+        
+        _, finish_date, unique_id, task_name, total_slack = finish
+        length = working_days(data_date, finish_date.date())
+        if length <= 0:
+            return self.not_applicable()
+        
+        cpli = (length + total_slack) / length
+        passed = cpli >= 0.95
+        failed_tasks = [] if passed else [
+            f"{unique_id}: {task_name} ({total_slack} days float over {length} working days)"]
+        return self.format_result(passed, f"{cpli:.2f}", failed_tasks)
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""DCMA Point 14: Baseline Execution Index checker."""
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Iterable, List, Dict, Any, Optional
+from ..base_checker import BaseChecker, CheckAccumulator
+from ..models.schedule_data import ScheduleLine
+
+if TYPE_CHECKING:
+    from ..models.schedule_table import ScheduleTable
+
+
+class Point14BaselineExecutionIndex(BaseChecker):
+    """Check that BEI = tasks completed / tasks baselined to finish by the data date is ≥ 0.95."""
+    
+    failed_template = "{0}: {1} (baseline finish: {2:%m/%d/%y})"
+    severity = (2, -1)
+    
+    def __init__(self, baseline: Optional[Iterable[ScheduleLine]] = None):
+        """Initialize checker, optionally with the baseline schedule to compare against."""
+        super().__init__(
+            point_number=14,
+            description="Baseline Execution Index",
+            threshold="≥ 0.95",
+            recommendation="Finish the overdue baseline work and review whether the remaining plan is still achievable."
+        )
+        self.set_baseline(baseline)
+    
+    def set_baseline(self, baseline: Optional[Iterable[ScheduleLine]]) -> None:
+        """Index the baseline finish date of every task by unique ID; None removes the baseline."""
+        self.baseline_finish: Optional[Dict[str, date]] = None
+        if baseline is not None:
+            self.baseline_finish = {task.unique_id: task.finish_date.date()
+                                    for task in baseline if task.finish_date}
+    
+    def check(self, schedule_lines: List[ScheduleLine]) -> Dict[str, Any]:
+        """Compare completed tasks with the tasks the baseline has finished by now."""
+        acc = self.new_accumulator()
+        for task in schedule_lines:
+            self.accumulate(acc, task)
+        return self.finalize(acc)
+    
+    def new_accumulator(self) -> CheckAccumulator:
+        """Fresh state, fixing the data date for the whole pass."""
+        return CheckAccumulator(data_date=datetime.now().date())
+    
+    def accumulate(self, acc: CheckAccumulator, task: ScheduleLine) -> None:
+        """Count a task as completed and/or as due per the baseline."""
+        if self.baseline_finish is None:
+            return
+        completed = bool(task.actual_finish) and task.actual_finish.date() <= acc.data_date
+        if completed:
+            acc.hits += 1
+        baseline_finish = self.baseline_finish.get(task.unique_id)
+        if baseline_finish is not None and baseline_finish <= acc.data_date:
+            acc.total += 1
+            if not completed:
+                acc.failed.append((task.unique_id, task.task_name, baseline_finish))
+    
+    def finalize(self, acc: CheckAccumulator) -> Dict[str, Any]:
+        """BEI result from accumulated counts; N/A without a baseline or due tasks."""
+        if self.baseline_finish is None or not acc.total:
+            return self.not_applicable()
+        
+        bei = acc.hits / acc.total
+        return self.format_result(bei >= 0.95, f"{bei:.2f}", acc.failed)
+    
+    def check_table(self, table: 'ScheduleTable') -> Dict[str, Any]:
+        """Vectorized BEI with the baseline joined through its unique-ID index."""
+        if self.baseline_finish is None:
+            return self.not_applicable()
+        import numpy as np
+        
+        data_date = table.as_date(datetime.now())
+        lookup = self.baseline_finish.get
+        baseline = np.array([lookup(unique_id) for unique_id in table.unique_id], dtype='datetime64[D]')
+        completed = table.present('actual_finish') & (table.actual_finish <= data_date)
+        due = ~np.isnat(baseline) & (baseline <= data_date)
+        total = int(due.sum())
+        
+        if not total:
+            return self.not_applicable()
+        
+        rows = (due & ~completed).nonzero()[0]
+        failed_tasks = self.failed(columns=(table.unique_id[rows], table.task_name[rows],
+                                            baseline[rows].astype(object)))
+        
+        bei = int(completed.sum()) / total
+        return self.format_result(bei >= 0.95, f"{bei:.2f}", failed_tasks)
\ No newline at end of file
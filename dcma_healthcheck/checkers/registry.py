@@ -0,0 +1,108 @@
+"""Registry of DCMA checkers, imported only when an analyzer needs them."""
+import importlib
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Type, Union
+from ..base_checker import BaseChecker
+
+# Entry point group of checkers provided by other packages; the entry point
+# is named after its point number, e.g. ``15 = my_checks:Point15Resources``
+ENTRY_POINT_GROUP = 'dcma_healthcheck.checkers'
+
+# The 14 DCMA points as ``module:class`` references
+BUILTIN_CHECKERS = {
+    1: 'dcma_healthcheck.checkers.point_01_logic:Point01Logic',
+    2: 'dcma_healthcheck.checkers.point_02_leads:Point02Leads',
+    3: 'dcma_healthcheck.checkers.point_03_lags:Point03Lags',
+    4: 'dcma_healthcheck.checkers.point_04_relationship_types:Point04RelationshipTypes',
+    5: 'dcma_healthcheck.checkers.point_05_start_to_finish:Point05StartToFinish',
+    6: 'dcma_healthcheck.checkers.point_06_hard_constraints:Point06HardConstraints',
+    7: 'dcma_healthcheck.checkers.point_07_high_float:Point07HighFloat',
+    8: 'dcma_healthcheck.checkers.point_08_negative_float:Point08NegativeFloat',
+    9: 'dcma_healthcheck.checkers.point_09_high_duration:Point09HighDuration',
+    10: 'dcma_healthcheck.checkers.point_10_invalid_forecast_dates:Point10InvalidForecastDates',
+    11: 'dcma_healthcheck.checkers.point_11_invalid_actual_dates:Point11InvalidActualDates',
+    12: 'dcma_healthcheck.checkers.point_12_critical_path_test:Point12CriticalPathTest',
+    13: 'dcma_healthcheck.checkers.point_13_critical_path_length_index:Point13CriticalPathLengthIndex',
+    14: 'dcma_healthcheck.checkers.point_14_baseline_execution_index:Point14BaselineExecutionIndex',
+}
+
+# A ``module:class`` reference or the checker class itself
+CheckerSpec = Union[str, Type[BaseChecker]]
+
+
+class CheckerRegistry:
+    """Point numbers mapped to checker classes that are imported on first use.
+
+    ``discover`` adds the checkers installed packages register under
+    ``ENTRY_POINT_GROUP``; one named after a built-in point replaces it.
+    Discovery reads the metadata of every installed distribution, which
+    costs more than importing all the built-in checkers, so it only runs
+    when asked for.
+    """
+    
+    def __init__(self, specs: Optional[Mapping[int, CheckerSpec]] = None):
+        """Initialize the registry with ``specs``, by default the built-in points."""
+        self._specs: Dict[int, CheckerSpec] = dict(BUILTIN_CHECKERS if specs is None else specs)
+        self._classes: Dict[int, Type[BaseChecker]] = {}
+        self.discovered = False
+    
+    def register(self, point: int, spec: CheckerSpec) -> None:
+        """Use ``spec`` as the checker of ``point``, replacing any registered before."""
+        self._specs[point] = spec
+        self._classes.pop(point, None)
+    
+    def discover(self) -> None:
+        """Register the checkers of installed packages' entry points (once)."""
+        if self.discovered:
+            return
+        from importlib.metadata import entry_points
+        try:
+            found = entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:  # Python < 3.10
+            found = entry_points().get(ENTRY_POINT_GROUP, ())
+        for entry_point in found:
+            try:
+                point = int(entry_point.name)
+            except ValueError:
+                raise ValueError(f"Checker entry point {entry_point.name!r} must be named after its point number")
+            self.register(point, entry_point.value)
+        self.discovered = True
+    
+    def points(self) -> List[int]:
+        """Registered point numbers in ascending order."""
+        return sorted(self._specs)
+    
+    def load(self, point: int) -> Type[BaseChecker]:
+        """Checker class of ``point``, importing its module if needed."""
+        checker_class = self._classes.get(point)
+        if checker_class is not None:
+            return checker_class
+        if point not in self._specs:
+            raise ValueError(f"No checker registered for DCMA point {point}")
+        
+        spec = self._specs[point]
+        if isinstance(spec, str):
+            module_name, _, class_name = spec.partition(':')
+            checker_class = getattr(importlib.import_module(module_name), class_name)
+        else:
+            checker_class = spec
+        if not (isinstance(checker_class, type) and issubclass(checker_class, BaseChecker)):
+            raise TypeError(f"Checker of DCMA point {point} is not a BaseChecker: {spec!r}")
+        self._classes[point] = checker_class
+        return checker_class
+    
+    def create(self, points: Optional[Iterable[int]] = None) -> List[BaseChecker]:
+        """New instances of the checkers of ``points`` (default: all), in that order."""
+        return [self.load(point)() for point in (self.points() if points is None else points)]
+
+
+# Registry ``DCMAAnalyzer`` takes its checkers from
+registry = CheckerRegistry()
+
+
+@lru_cache(maxsize=None)
+def plugin_registry() -> CheckerRegistry:
+    """Built-in checkers plus those of installed packages, discovered once per process."""
+    plugins = CheckerRegistry()
+    plugins.discover()
+    return plugins
\ No newline at end of file
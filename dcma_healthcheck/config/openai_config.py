@@ -13,6 +13,8 @@ class OpenAIConfig:
         self.model = os.getenv('OPENAI_MODEL', 'gpt-4')
         self.temperature = float(os.getenv('OPENAI_TEMPERATURE', '0.1'))
         self.max_tokens = int(os.getenv('OPENAI_MAX_TOKENS', '2000'))
+        # Budget for the analysis embedded in the prompt (see ``PromptBuilder``)
+        self.prompt_tokens = int(os.getenv('OPENAI_PROMPT_TOKENS', '6000'))
     
     def get_api_key(self) -> Optional[str]:
         """Get API key from environment or return None."""
@@ -0,0 +1,127 @@
+"""Run the DCMA 14-point schedule quality checks on a sample schedule or on many files."""
+import argparse
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Dict
+from .models.field_parsers import DATE_LOCALES
+from .readers.formats import FORMATS
+from .reports.exporters import EXPORTERS, open_exporter
+
+if TYPE_CHECKING:
+    from .analyzers.batch import BatchAnalyzer
+
+# Sample schedule next to the package in the source tree, analyzed when no file is given
+SAMPLE_SCHEDULE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sample_with_headers.csv')
+
+
+def build_batch(args: argparse.Namespace) -> 'BatchAnalyzer':
+    """Batch analyzer with the reading, checking and PDF settings of the command line."""
+    from .analyzers.batch import BatchAnalyzer
+    
+    return BatchAnalyzer(
+        max_workers=args.workers,
+        chunk_size=args.chunk_size,
+        fmt=args.format,
+        has_headers=not args.no_headers,
+        locale=args.locale,
+        cache_dir=args.cache_dir,
+        vectorized=args.vectorized,
+        computed_float=args.computed_float,
+        baseline=args.baseline,
+        plugins=args.plugins,
+        check_network=args.network,
+        pdf_dir=args.pdf_dir,
+    )
+
+
+def write_summary(path: str, combined: Dict[str, Any]) -> None:
+    """Write a ``summarize_batch`` summary as JSON."""
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(combined, file, indent=2, default=str)
+
+
+def run_single(args: argparse.Namespace, path: str) -> int:
+    """Analyze one file with the batch settings and stream its full report to stdout."""
+    from .analyzers.batch import summarize_batch
+    from .reports.report_writer import ReportWriter
+    
+    path, results = build_batch(args).analyze(path)
+    ReportWriter(sys.stdout, args.max_failed).write(results)
+    if args.export:
+        with open_exporter(args.export) as exporter:
+            exporter.write(results, path)
+    if args.summary:
+        write_summary(args.summary, summarize_batch([(path, results)]))
+    return 1 if 'error' in results else 0
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Analyze every file named by ``args.sources`` on a process pool."""
+    from .analyzers.batch import summarize_batch
+    
+    batch = build_batch(args)
+    exporter = open_exporter(args.export) if args.export else None
+    
+    def report(results):
+        # Print each file's outcome as it arrives; only the summary keeps anything
+        for path, analysis in results:
+            if exporter is not None:
+                exporter.write(analysis, path)
+            if 'error' in analysis:
+                print(f"{path}: ERROR {analysis['error']}", flush=True)
+            else:
+                summary = analysis['summary']
+                print(f"{path}: {summary['passed_checks']}/{summary['total_checks']} checks passed "
+                      f"({summary['overall_pass_rate']})", flush=True)
+            yield path, analysis
+    
+    try:
+        combined = summarize_batch(report(batch.iter_results(args.sources)))
+    finally:
+        if exporter is not None:
+            exporter.close()
+    print(f"Analyzed {combined['analyzed']}/{combined['files']} files ({combined['errors']} errors)")
+    if args.summary:
+        write_summary(args.summary, combined)
+    return 1 if combined['errors'] else 0
+
+
+def main():
+    """Run DCMA analysis on sample schedule, or on many files in batch mode."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('sources', nargs='*',
+                        help="schedule files, directories or glob patterns (default: the sample schedule)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=4, help="files sent to a worker at a time")
+    parser.add_argument('--format', choices=FORMATS, default=None, help="input format (default: from file name)")
+    parser.add_argument('--no-headers', action='store_true', help="tab-separated input has no header row")
+    parser.add_argument('--locale', choices=sorted(DATE_LOCALES), default='en_US', help="date layout of exports")
+    parser.add_argument('--cache-dir', default=None, help="directory for parsed schedule snapshots")
+    parser.add_argument('--vectorized', action='store_true', help="run column-wise checks (requires NumPy)")
+    parser.add_argument('--computed-float', action='store_true',
+                        help="recompute float with a CPM pass instead of using exported slack")
+    parser.add_argument('--baseline', default=None, help="baseline schedule for the Baseline Execution Index")
+    parser.add_argument('--plugins', action='store_true',
+                        help="also run checkers that installed packages register as entry points")
+    parser.add_argument('--network', action='store_true',
+                        help="also check the activity network for loops and broken or one-sided links")
+    parser.add_argument('--max-failed', type=int, default=None,
+                        help="list at most this many (most severe) failed tasks per point")
+    parser.add_argument('--export', default=None,
+                        help=f"also export per-point and failed-task records ({', '.join(EXPORTERS)} by extension)")
+    parser.add_argument('--pdf-dir', default=None, help="also write a PDF report per schedule to this directory")
+    parser.add_argument('--summary', default=None, help="write the combined summary as JSON to this path")
+    args = parser.parse_args()
+    
+    if args.sources:
+        sys.exit(run_batch(args))
+    
+    # The sample is only part of the source tree, not of installed packages
+    if not os.path.isfile(SAMPLE_SCHEDULE):
+        parser.error("no schedule files given (the sample schedule is only available in the source tree)")
+    sys.exit(run_single(args, SAMPLE_SCHEDULE))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""Result objects returned by the DCMA checkers."""
+import heapq
+from collections.abc import Mapping, Sequence
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# (entry field to rank by, 1 if larger values are worse or -1 if smaller ones are)
+Severity = Tuple[int, int]
+
+# Value and status of a point that could not be measured; its ``passed`` is None
+NOT_APPLICABLE = "N/A"
+
+
+def _magnitude(value: Any) -> float:
+    """Numeric form of a severity field; dates rank by their day number."""
+    if isinstance(value, date):
+        return value.toordinal()
+    return float(value)
+
+
+class FailedTasks(Sequence):
+    """Offending activities of one point, kept compact and formatted on access.
+
+    Each entry is a tuple of the raw values of one failure, e.g.
+    ``(unique_id, task_name, total_slack)``, and reads as
+    ``template.format(*entry)``; without a template the entries are
+    already strings. Entries are either a list of tuples or, for the
+    vectorized checks, aligned ``columns`` (typically NumPy arrays holding
+    only the failing rows). ``severity`` names the field ``top`` ranks by.
+    """
+    
+    __slots__ = ('template', 'entries', 'columns', 'severity')
+    
+    def __init__(self, template: Optional[str] = None, entries: Optional[List[Any]] = None,
+                 severity: Optional[Severity] = None, columns: Optional[Tuple[Any, ...]] = None):
+        self.template = template
+        self.entries = entries if entries is not None or columns is not None else []
+        self.columns = columns
+        self.severity = severity
+    
+    def __len__(self) -> int:
+        if self.columns is not None:
+            return len(self.columns[0]) if self.columns else 0
+        return len(self.entries)
+    
+    def entry(self, index: int) -> Any:
+        """Raw values of one failure."""
+        if self.columns is not None:
+            return tuple(column[index] for column in self.columns)
+        return self.entries[index]
+    
+    def _format(self, entry: Any) -> str:
+        return self.template.format(*entry) if self.template is not None else entry
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._format(self.entry(i)) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("failed task index out of range")
+        return self._format(self.entry(index))
+    
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self._format(self.entry(i))
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+    
+    def __repr__(self) -> str:
+        return f"FailedTasks({len(self)} entries)"
+    
+    def unique_ids(self) -> Iterator[str]:
+        """Unique ID of each failure, without formatting the entries.
+
+        Every layout starts with the activity's unique ID (``'<id>: ...'``).
+        """
+        if self.columns is not None:
+            return iter(self.columns[0]) if self.columns else iter(())
+        if self.template is not None:
+            return (entry[0] for entry in self.entries)
+        return (entry.partition(': ')[0] for entry in self.entries)
+    
+    def top(self, n: int) -> List[str]:
+        """The ``n`` most severe failures, most severe first; ties keep schedule order.
+
+        Uses a bounded heap, so only the selected entries are formatted.
+        Without a severity the first ``n`` entries are returned.
+        """
+        if self.severity is None:
+            return self[:n]
+        field, sign = self.severity
+        ranked = heapq.nlargest(n, range(len(self)),
+                                key=lambda i: (sign * _magnitude(self.entry(i)[field]), -i))
+        return [self._format(self.entry(i)) for i in ranked]
+    
+    def page(self, number: int, size: int = 50) -> List[str]:
+        """Entries of page ``number`` (counting from 0) in pages of ``size``."""
+        return self[number * size:(number + 1) * size]
+    
+    def page_count(self, size: int = 50) -> int:
+        """Number of pages of ``size`` entries."""
+        return -(-len(self) // size)
+
+
+def result_status(result: Mapping) -> str:
+    """``PASS``, ``FAIL`` or ``N/A`` of a point result (a ``CheckResult`` or its ``to_dict``)."""
+    passed = result['passed']
+    return NOT_APPLICABLE if passed is None else "PASS" if passed else "FAIL"
+
+
+class CheckResult(Mapping):
+    """Result of one DCMA point.
+
+    Reads like the plain dict checkers used to return (``result['passed']``,
+    ``result['failed_tasks']``), with the failures kept as ``FailedTasks``;
+    ``to_dict`` gives a plain, JSON-ready dict. ``passed`` is None when the
+    point could not be measured (see ``result_status``).
+    """
+    
+    KEYS = ('point', 'description', 'threshold', 'value', 'passed', 'failed_tasks', 'recommendation')
+    __slots__ = KEYS
+    
+    def __init__(self, point: int, description: str, threshold: str, value: Any, passed: Optional[bool],
+                 failed_tasks: FailedTasks, recommendation: Optional[str]):
+        self.point = point
+        self.description = description
+        self.threshold = threshold
+        self.value = value
+        self.passed = passed
+        self.failed_tasks = failed_tasks
+        self.recommendation = recommendation
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+    
+    def __len__(self) -> int:
+        return len(self.KEYS)
+    
+    def __repr__(self) -> str:
+        return f"CheckResult(point={self.point}, {result_status(self)}, value={self.value!r}, {len(self.failed_tasks)} failed)"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with every failed task formatted."""
+        result = dict(self.items())
+        result['failed_tasks'] = list(self.failed_tasks)
+        return result
\ No newline at end of file
@@ -7,11 +7,12 @@ class DCMARecommendation(BaseModel):
     """Single DCMA recommendation."""
     point_number: int
     point_name: str
-    status: str  # "PASS" or "FAIL"
+    status: str  # "PASS", "FAIL" or "N/A"
     threshold: str
     actual_value: str
     recommendation: str = None
     priority: str = None  # "HIGH", "MEDIUM", "LOW"
+    fallback: bool = False  # standard guidance, used when the point's own request failed
 
 
 class DCMAAnalysisResponse(BaseModel):
@@ -23,4 +24,11 @@ class DCMAAnalysisResponse(BaseModel):
     failed_checks: int
     recommendations: List[DCMARecommendation]
     implementation_plan: List[str]
+    risk_assessment: str
+
+
+class DCMAPointAnalysis(BaseModel):
+    """Structured response for a single failed DCMA point."""
+    recommendation: DCMARecommendation
+    implementation_steps: List[str]
     risk_assessment: str
\ No newline at end of file
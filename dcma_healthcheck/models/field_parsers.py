@@ -0,0 +1,117 @@
+"""Memoized parsers for the text fields of schedule exports."""
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+# strptime fallbacks per locale; the first format also decides the fast path's field order
+DATE_LOCALES = {
+    'en_US': ('%m/%d/%y', '%m/%d/%Y', '%Y-%m-%d'),
+    'en_GB': ('%d/%m/%y', '%d/%m/%Y', '%Y-%m-%d'),
+    'de_DE': ('%d.%m.%y', '%d.%m.%Y', '%Y-%m-%d'),
+    'fr_FR': ('%d/%m/%y', '%d/%m/%Y', '%Y-%m-%d'),
+}
+
+# Numeric dates as written by MS Project, optionally preceded by a weekday ("Tue 2/1/22")
+NUMERIC_DATE = re.compile(r'(?<!\d)(\d{1,2})[/.-](\d{1,2})[/.-](\d{2,4})\b')
+ISO_DATE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+
+class FieldParser:
+    """Parse dates, durations, percentages and relationship lists.
+
+    Exports repeat a small set of distinct values across many cells, so each
+    parser is wrapped in a bounded LRU cache. Common MS Project date layouts
+    are decoded directly; anything else falls back to ``strptime`` with the
+    locale's ``date_formats``. Custom ``date_formats`` skip the numeric
+    fast path, since it assumes a locale's field order; ISO dates, which
+    readers such as the XLSX one produce themselves, are always accepted.
+    """
+    
+    def __init__(self, locale: str = 'en_US', date_formats: Optional[Sequence[str]] = None,
+                 cache_size: int = 8192):
+        """Initialize parser for a locale, optionally overriding its date formats."""
+        if locale not in DATE_LOCALES:
+            raise ValueError(f"Unsupported locale: {locale}. Expected one of {sorted(DATE_LOCALES)}")
+        self.locale = locale
+        self.date_formats = tuple(date_formats or DATE_LOCALES[locale])
+        self.day_first = self.date_formats[0].startswith('%d')
+        self.fast_dates = self.date_formats in DATE_LOCALES.values()
+        
+        self.parse_date = lru_cache(maxsize=cache_size)(self._parse_date)
+        self.parse_duration = lru_cache(maxsize=cache_size)(self._parse_duration)
+        self.parse_percentage = lru_cache(maxsize=cache_size)(self._parse_percentage)
+    
+    def _parse_date(self, date_str: str) -> Optional[datetime]:
+        """Parse dates like "Tue 2/1/22", "2/1/2022" or "2022-02-01"."""
+        if not date_str or date_str.upper() == 'NA':
+            return None
+        
+        match = ISO_DATE.match(date_str)
+        if match:
+            try:
+                return datetime(*map(int, match.groups()))
+            except ValueError:
+                pass  # not a calendar date; let the formats decide
+        
+        if self.fast_dates:
+            match = NUMERIC_DATE.search(date_str)
+            if match:
+                first, second, year = match.groups()
+                month, day = (second, first) if self.day_first else (first, second)
+                year = int(year)
+                if len(match.group(3)) == 2:
+                    # Same pivot as strptime's %y
+                    year += 1900 if year >= 69 else 2000
+                try:
+                    return datetime(year, int(month), int(day))
+                except ValueError:
+                    pass
+        
+        for fmt in self.date_formats:
+            try:
+                return datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+        return None
+    
+    def _parse_duration(self, duration_str: str) -> float:
+        """Parse durations like "779.88 days" -> 779.88."""
+        if not duration_str or duration_str.upper() == 'NA':
+            return 0.0
+        try:
+            return float(duration_str.split()[0])  # Extract number before "days"
+        except (ValueError, IndexError):
+            return 0.0
+    
+    def _parse_percentage(self, pct_str: str) -> float:
+        """Parse percentages like "87%" -> 87.0."""
+        if not pct_str or pct_str.upper() == 'NA':
+            return 0.0
+        try:
+            return float(pct_str.rstrip('%'))
+        except ValueError:
+            return 0.0
+    
+    @staticmethod
+    def parse_list(rel_str: str) -> List[str]:
+        """Split a comma-separated predecessor/successor list."""
+        if not rel_str or rel_str.upper() == 'NA':
+            return []
+        return [x.strip() for x in rel_str.split(',') if x.strip()]
+    
+    def cache_info(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters and current size of each parser cache."""
+        return {
+            name: getattr(self, name).cache_info()._asdict()
+            for name in ('parse_date', 'parse_duration', 'parse_percentage')
+        }
+    
+    def cache_clear(self) -> None:
+        """Empty all parser caches and reset their counters."""
+        self.parse_date.cache_clear()
+        self.parse_duration.cache_clear()
+        self.parse_percentage.cache_clear()
+
+
+DEFAULT_PARSER = FieldParser()
\ No newline at end of file
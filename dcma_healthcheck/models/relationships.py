@@ -0,0 +1,164 @@
+"""Structured predecessor relationships parsed from schedule exports."""
+import re
+from array import array
+from enum import IntEnum
+from typing import Iterable, List, NamedTuple, Optional
+
+
+class RelationType(IntEnum):
+    """Dependency type, numbered as in MS Project XML (``PredecessorLink/Type``)."""
+    FF = 0
+    FS = 1
+    SF = 2
+    SS = 3
+
+
+class LagUnit(IntEnum):
+    """Lag unit, numbered as in MS Project XML (``PredecessorLink/LagFormat``)."""
+    MINUTES = 3
+    ELAPSED_MINUTES = 4
+    HOURS = 5
+    ELAPSED_HOURS = 6
+    DAYS = 7
+    ELAPSED_DAYS = 8
+    WEEKS = 9
+    ELAPSED_WEEKS = 10
+    MONTHS = 11
+    ELAPSED_MONTHS = 12
+    PERCENT = 19
+    ELAPSED_PERCENT = 20
+
+
+# Unit spellings used by MS Project in exported lag text
+LAG_UNITS = {
+    'm': LagUnit.MINUTES, 'min': LagUnit.MINUTES, 'mins': LagUnit.MINUTES,
+    'minute': LagUnit.MINUTES, 'minutes': LagUnit.MINUTES,
+    'em': LagUnit.ELAPSED_MINUTES, 'emin': LagUnit.ELAPSED_MINUTES, 'emins': LagUnit.ELAPSED_MINUTES,
+    'h': LagUnit.HOURS, 'hr': LagUnit.HOURS, 'hrs': LagUnit.HOURS,
+    'hour': LagUnit.HOURS, 'hours': LagUnit.HOURS,
+    'eh': LagUnit.ELAPSED_HOURS, 'ehr': LagUnit.ELAPSED_HOURS, 'ehrs': LagUnit.ELAPSED_HOURS,
+    'd': LagUnit.DAYS, 'day': LagUnit.DAYS, 'days': LagUnit.DAYS,
+    'ed': LagUnit.ELAPSED_DAYS, 'eday': LagUnit.ELAPSED_DAYS, 'edays': LagUnit.ELAPSED_DAYS,
+    'w': LagUnit.WEEKS, 'wk': LagUnit.WEEKS, 'wks': LagUnit.WEEKS,
+    'week': LagUnit.WEEKS, 'weeks': LagUnit.WEEKS,
+    'ew': LagUnit.ELAPSED_WEEKS, 'ewk': LagUnit.ELAPSED_WEEKS, 'ewks': LagUnit.ELAPSED_WEEKS,
+    'mo': LagUnit.MONTHS, 'mon': LagUnit.MONTHS, 'mons': LagUnit.MONTHS,
+    'month': LagUnit.MONTHS, 'months': LagUnit.MONTHS,
+    'emo': LagUnit.ELAPSED_MONTHS, 'emon': LagUnit.ELAPSED_MONTHS, 'emons': LagUnit.ELAPSED_MONTHS,
+    '%': LagUnit.PERCENT, 'e%': LagUnit.ELAPSED_PERCENT,
+}
+
+# Preferred display spelling per unit (the reverse of LAG_UNITS)
+LAG_LABELS = {
+    LagUnit.MINUTES: ' mins', LagUnit.ELAPSED_MINUTES: ' emins',
+    LagUnit.HOURS: ' hrs', LagUnit.ELAPSED_HOURS: ' ehrs',
+    LagUnit.DAYS: ' days', LagUnit.ELAPSED_DAYS: ' edays',
+    LagUnit.WEEKS: ' wks', LagUnit.ELAPSED_WEEKS: ' ewks',
+    LagUnit.MONTHS: ' mons', LagUnit.ELAPSED_MONTHS: ' emons',
+    LagUnit.PERCENT: '%', LagUnit.ELAPSED_PERCENT: 'e%',
+}
+
+# Working days per unit, using MS Project's default 8h day / 5 day week / 20 day month
+UNIT_DAYS = {
+    LagUnit.MINUTES: 1 / 480, LagUnit.ELAPSED_MINUTES: 1 / 1440,
+    LagUnit.HOURS: 1 / 8, LagUnit.ELAPSED_HOURS: 1 / 24,
+    LagUnit.DAYS: 1.0, LagUnit.ELAPSED_DAYS: 5 / 7,
+    LagUnit.WEEKS: 5.0, LagUnit.ELAPSED_WEEKS: 5.0,
+    LagUnit.MONTHS: 20.0, LagUnit.ELAPSED_MONTHS: 150 / 7,
+}
+
+# e.g. "76", "76FS", "76FS-5 days", "1417SS+2 wks", "12FF+50%", "9SF+3 edays?"
+RELATIONSHIP_PATTERN = re.compile(
+    r'^(?P<id>\d+)(?P<type>FS|SS|FF|SF)?'
+    r'(?:(?P<lag>[+-]\s*\d*\.?\d+)\s*(?P<unit>e?%|[a-z]*)\??)?$',
+    re.IGNORECASE
+)
+
+
+class Relationship(NamedTuple):
+    """A single predecessor link: who it points at, its type and its lag."""
+    predecessor_id: str
+    type: RelationType
+    lag: float
+    lag_unit: LagUnit
+    token: str
+    
+    def lag_days(self, predecessor_duration: float = 0.0) -> float:
+        """Lag expressed in working days; percentage lags scale the predecessor duration."""
+        if self.lag_unit in (LagUnit.PERCENT, LagUnit.ELAPSED_PERCENT):
+            return predecessor_duration * self.lag / 100
+        return self.lag * UNIT_DAYS[self.lag_unit]
+
+
+def parse_relationship(token: str) -> Relationship:
+    """Parse one predecessor token such as ``76FS-5 days``.
+
+    Tokens that do not follow MS Project's ``<id><type><lag>`` layout are
+    treated as a plain Finish-to-Start link to ``token``.
+    """
+    match = RELATIONSHIP_PATTERN.match(token)
+    if not match:
+        return Relationship(token, RelationType.FS, 0.0, LagUnit.DAYS, token)
+    
+    relation_type = RelationType[match.group('type').upper()] if match.group('type') else RelationType.FS
+    lag_text = match.group('lag')
+    if not lag_text:
+        return Relationship(match.group('id'), relation_type, 0.0, LagUnit.DAYS, token)
+    
+    unit = LAG_UNITS.get(match.group('unit').lower(), LagUnit.DAYS)
+    return Relationship(match.group('id'), relation_type, float(lag_text.replace(' ', '')), unit, token)
+
+
+def format_relationship(predecessor_id: str, relation_type: RelationType, lag: float = 0.0,
+                        lag_unit: LagUnit = LagUnit.DAYS) -> str:
+    """Render a link the way MS Project displays it, e.g. ``76FS+5 days``."""
+    if not lag:
+        return predecessor_id if relation_type == RelationType.FS else f"{predecessor_id}{relation_type.name}"
+    return f"{predecessor_id}{relation_type.name}{lag:+g}{LAG_LABELS[lag_unit]}"
+
+
+def parse_relationships(tokens: Iterable[str]) -> List[Relationship]:
+    """Parse a list of predecessor tokens, skipping empty entries."""
+    return [parse_relationship(token) for token in tokens if token]
+
+
+class RelationshipIndex:
+    """Flat per-schedule index of parsed relationships.
+
+    Entry ``i`` links row ``owners[i]`` to ``predecessor_ids[i]``; types, lags
+    and units are kept in compact typed arrays so checks reduce to integer
+    comparisons.
+    """
+    
+    def __init__(self):
+        self.owners = array('l')
+        self.types = array('b')
+        self.lags = array('d')
+        self.lag_units = array('b')
+        self.predecessor_ids: List[str] = []
+        self.tokens: List[str] = []
+    
+    def add(self, row: int, links: Iterable[Relationship]) -> None:
+        """Append the relationships of one schedule row."""
+        for link in links:
+            self.owners.append(row)
+            self.types.append(link.type)
+            self.lags.append(link.lag)
+            self.lag_units.append(link.lag_unit)
+            self.predecessor_ids.append(link.predecessor_id)
+            self.tokens.append(link.token)
+    
+    @classmethod
+    def from_links(cls, rows: Iterable[Optional[List[Relationship]]]) -> 'RelationshipIndex':
+        """Build an index from each row's list of relationships."""
+        index = cls()
+        for row, links in enumerate(rows):
+            index.add(row, links or [])
+        return index
+    
+    def __len__(self) -> int:
+        return len(self.types)
+    
+    def __getitem__(self, i: int) -> Relationship:
+        return Relationship(self.predecessor_ids[i], RelationType(self.types[i]), self.lags[i],
+                            LagUnit(self.lag_units[i]), self.tokens[i])
\ No newline at end of file
@@ -2,6 +2,16 @@
 from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime
+from .field_parsers import DEFAULT_PARSER, FieldParser
+from .relationships import Relationship, parse_relationships
+
+# Column order of exports without a header row
+CSV_COLUMNS = (
+    'Unique ID', 'ID', 'WBS STD', 'WBS', 'Task Name', '% Complete', 'Status',
+    'Start', 'Finish', 'Actual Start', 'Actual Finish', 'Duration', 'Actual Duration',
+    'Predecessors', 'Successors', 'Unique ID Predecessors', 'Unique ID Successors',
+    'Constraint Type', 'Constraint Date', 'Free Slack', 'Total Slack', 'Critical',
+)
 
 
 @dataclass
@@ -29,9 +39,15 @@ class ScheduleLine:
     free_slack: float
     total_slack: float
     critical: bool
+    predecessor_links: Optional[List[Relationship]] = None
+    
+    def __post_init__(self):
+        """Parse predecessor tokens once, when the line is created."""
+        if self.predecessor_links is None:
+            self.predecessor_links = parse_relationships(self.predecessors)
     
     @classmethod
-    def from_csv_line(cls, line: str) -> 'ScheduleLine':
+    def from_csv_line(cls, line: str, parser: Optional[FieldParser] = None) -> 'ScheduleLine':
         """Create ScheduleLine from CSV line."""
         parts = line.strip().split('\t')  # Tab-separated
         
@@ -41,47 +57,17 @@ class ScheduleLine:
         # Pad with empty strings if missing fields
         while len(parts) < 22:
             parts.append('')
+        
+        return cls.from_csv_with_headers(dict(zip(CSV_COLUMNS, parts)), parser)
     
     @classmethod
-    def from_csv_with_headers(cls, data_dict: dict) -> 'ScheduleLine':
+    def from_csv_with_headers(cls, data_dict: dict, parser: Optional[FieldParser] = None) -> 'ScheduleLine':
         """Create ScheduleLine from dictionary with headers."""
-        # Parse dates with new format (e.g., "Tue 2/1/22")
-        def parse_date(date_str: str) -> Optional[datetime]:
-            if not date_str or date_str.upper() == 'NA':
-                return None
-            try:
-                # Try different date formats
-                if '/' in date_str:
-                    # Format: "Tue 2/1/22" or "2/1/22"
-                    date_part = date_str.split()[-1] if ' ' in date_str else date_str
-                    return datetime.strptime(date_part, '%m/%d/%y')
-                return None
-            except ValueError:
-                return None
-        
-        # Parse duration (e.g., "779.88 days" -> 779.88)
-        def parse_duration(duration_str: str) -> float:
-            if not duration_str or duration_str.upper() == 'NA':
-                return 0.0
-            try:
-                return float(duration_str.split()[0])  # Extract number before "days"
-            except (ValueError, IndexError):
-                return 0.0
-        
-        # Parse percentage (e.g., "87%" -> 87.0)
-        def parse_percentage(pct_str: str) -> float:
-            if not pct_str or pct_str.upper() == 'NA':
-                return 0.0
-            try:
-                return float(pct_str.rstrip('%'))
-            except ValueError:
-                return 0.0
-        
-        # Parse predecessors/successors (comma-separated)
-        def parse_relationships(rel_str: str) -> List[str]:
-            if not rel_str or rel_str.upper() == 'NA':
-                return []
-            return [x.strip() for x in rel_str.split(',') if x.strip()]
+        parser = parser or DEFAULT_PARSER
+        parse_date = parser.parse_date
+        parse_duration = parser.parse_duration
+        parse_percentage = parser.parse_percentage
+        parse_list = parser.parse_list
         
         return cls(
             unique_id=data_dict.get('Unique ID', ''),
@@ -97,76 +83,13 @@ class ScheduleLine:
             actual_finish=parse_date(data_dict.get('Actual Finish', '')),
             duration=parse_duration(data_dict.get('Duration', '0 days')),
             actual_duration=parse_duration(data_dict.get('Actual Duration', '0 days')),
-            predecessors=parse_relationships(data_dict.get('Predecessors', '')),
-            successors=parse_relationships(data_dict.get('Successors', '')),
-            unique_id_predecessors=parse_relationships(data_dict.get('Unique ID Predecessors', '')),
-            unique_id_successors=parse_relationships(data_dict.get('Unique ID Successors', '')),
+            predecessors=parse_list(data_dict.get('Predecessors', '')),
+            successors=parse_list(data_dict.get('Successors', '')),
+            unique_id_predecessors=parse_list(data_dict.get('Unique ID Predecessors', '')),
+            unique_id_successors=parse_list(data_dict.get('Unique ID Successors', '')),
             constraint_type=data_dict.get('Constraint Type', ''),
             constraint_date=parse_date(data_dict.get('Constraint Date', '')),
             free_slack=parse_duration(data_dict.get('Free Slack', '0 days')),
             total_slack=parse_duration(data_dict.get('Total Slack', '0 days')),
             critical=data_dict.get('Critical', '').upper() == 'YES'
-        )
-        
-        # Parse dates with new format (e.g., "Tue 2/1/22")
-        def parse_date(date_str: str) -> Optional[datetime]:
-            if not date_str or date_str.upper() == 'NA':
-                return None
-            try:
-                # Try different date formats
-                if '/' in date_str:
-                    # Format: "Tue 2/1/22" or "2/1/22"
-                    date_part = date_str.split()[-1] if ' ' in date_str else date_str
-                    return datetime.strptime(date_part, '%m/%d/%y')
-                return None
-            except ValueError:
-                return None
-        
-        # Parse duration (e.g., "779.88 days" -> 779.88)
-        def parse_duration(duration_str: str) -> float:
-            if not duration_str or duration_str.upper() == 'NA':
-                return 0.0
-            try:
-                return float(duration_str.split()[0])  # Extract number before "days"
-            except (ValueError, IndexError):
-                return 0.0
-        
-        # Parse percentage (e.g., "87%" -> 87.0)
-        def parse_percentage(pct_str: str) -> float:
-            if not pct_str or pct_str.upper() == 'NA':
-                return 0.0
-            try:
-                return float(pct_str.rstrip('%'))
-            except ValueError:
-                return 0.0
-        
-        # Parse predecessors/successors (comma-separated)
-        def parse_relationships(rel_str: str) -> List[str]:
-            if not rel_str or rel_str.upper() == 'NA':
-                return []
-            return [x.strip() for x in rel_str.split(',') if x.strip()]
-        
-        return cls(
-            unique_id=parts[0],
-            id=parts[1],
-            wbs_std=parts[2],
-            wbs=parts[3],
-            task_name=parts[4],
-            percent_complete=parse_percentage(parts[5]),
-            status=parts[6],
-            start_date=parse_date(parts[7]),
-            finish_date=parse_date(parts[8]),
-            actual_start=parse_date(parts[9]),
-            actual_finish=parse_date(parts[10]),
-            duration=parse_duration(parts[11]),
-            actual_duration=parse_duration(parts[12]),
-            predecessors=parse_relationships(parts[13]),
-            successors=parse_relationships(parts[14]),
-            unique_id_predecessors=parse_relationships(parts[15]),
-            unique_id_successors=parse_relationships(parts[16]),
-            constraint_type=parts[17],
-            constraint_date=parse_date(parts[18]),
-            free_slack=parse_duration(parts[19]),
-            total_slack=parse_duration(parts[20]),
-            critical=parts[21].upper() == 'YES'
         )
\ No newline at end of file
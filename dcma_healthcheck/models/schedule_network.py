@@ -0,0 +1,255 @@
+"""Activity network built from the unique-ID relationship columns."""
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from .relationships import parse_relationship
+from .schedule_data import ScheduleLine
+
+# Leading ID of a relationship token followed by its type or lag
+LINK_ID = re.compile(r'(\d+)(?=FS|SS|FF|SF|[+-])', re.IGNORECASE)
+
+# (unique_id, unique-ID predecessor tokens, unique-ID successor tokens) of one row
+NetworkRow = Tuple[str, Sequence[str], Sequence[str]]
+
+# Findings of each kind listed in ``ScheduleNetwork.summary``; the rest are only counted
+NETWORK_SAMPLES = 10
+
+
+def network_row(line: ScheduleLine) -> NetworkRow:
+    """The parts of a schedule line the network is built from."""
+    return line.unique_id, line.unique_id_predecessors, line.unique_id_successors
+
+
+def link_id(token: str) -> str:
+    """Unique ID a relationship token points at, e.g. ``12`` for ``12FS+2 days``."""
+    if token.isdigit():
+        return token
+    # Cheap prefix match for well-formed tokens; anything else goes through the full parser
+    match = LINK_ID.match(token)
+    return match.group(1) if match else parse_relationship(token).predecessor_id
+
+
+def _group_by_source(count: int, sources: array, destinations: array) -> Tuple[array, array]:
+    """CSR offsets and targets of the edges, stably grouped by source node.
+
+    Vectorized with NumPy when it is installed; otherwise a counting sort.
+    """
+    try:
+        import numpy as np
+    except ImportError:  # optional, see the ``fast`` extra
+        offsets = array('l', bytes(array('l').itemsize * (count + 1)))
+        for source in sources:
+            offsets[source + 1] += 1
+        for node in range(count):
+            offsets[node + 1] += offsets[node]
+        targets = array('l', bytes(array('l').itemsize * len(sources)))
+        fill = offsets[:-1]
+        for source, destination in zip(sources, destinations):
+            targets[fill[source]] = destination
+            fill[source] += 1
+        return offsets, targets
+    
+    source_nodes = np.frombuffer(sources, dtype=np.int64)
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(source_nodes, minlength=count), out=offsets[1:])
+    targets = np.frombuffer(destinations, dtype=np.int64)[np.argsort(source_nodes, kind='stable')]
+    return array('l', offsets.tolist()), array('l', targets.tolist())
+
+
+def _unmatched_links(count: int, sources: array, destinations: array, mirrored: array) -> Tuple[List[int], List[int]]:
+    """``source * count + destination`` keys of the edges that are not in
+    ``mirrored`` (in edge order, repeats kept), and of the ``mirrored``
+    links that are not edges (sorted, unique).
+    """
+    try:
+        import numpy as np
+    except ImportError:  # optional, see the ``fast`` extra
+        listed = [source * count + destination for source, destination in zip(sources, destinations)]
+        mirrored_keys = set(mirrored)
+        return [key for key in listed if key not in mirrored_keys], sorted(mirrored_keys.difference(listed))
+    
+    def contains(sorted_keys, keys):
+        if not len(sorted_keys):
+            return np.zeros(len(keys), dtype=bool)
+        index = np.searchsorted(sorted_keys, keys).clip(max=len(sorted_keys) - 1)
+        return sorted_keys[index] == keys
+    
+    listed_keys = np.frombuffer(sources, dtype=np.int64) * count + np.frombuffer(destinations, dtype=np.int64)
+    mirrored_keys = np.unique(np.frombuffer(mirrored, dtype=np.int64))
+    return (listed_keys[~contains(mirrored_keys, listed_keys)].tolist(),
+            mirrored_keys[~contains(np.unique(listed_keys), mirrored_keys)].tolist())
+
+
+class ScheduleNetwork:
+    """Directed predecessor -> successor graph in compressed sparse row form.
+
+    Unique IDs are interned to dense node numbers (``ids[node]``); the
+    successors of ``node`` are ``targets[offsets[node]:offsets[node + 1]]``.
+    Edges come from the predecessor lists. References to IDs that are not
+    in the schedule are kept in ``dangling``, and, when the schedule carries
+    successor lists, links listed on only one side are kept in
+    ``one_sided``.
+    """
+    
+    def __init__(self, ids: List[str], offsets: array, targets: array,
+                 dangling: List[Tuple[str, str, str]], one_sided: Optional[List[Tuple[str, str, str]]]):
+        self.ids = ids
+        self.offsets = offsets
+        self.targets = targets
+        self.dangling = dangling
+        self.one_sided = one_sided
+    
+    @classmethod
+    def build(cls, rows: Iterable[NetworkRow]) -> 'ScheduleNetwork':
+        """Build the network from per-row ID and link lists in O(V + E).
+        
+        The links are resolved in one pass over the rows; grouping them by
+        source node and matching the predecessor and successor sides are
+        vectorized (see ``_group_by_source`` and ``_unmatched_links``).
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        ids = list(dict.fromkeys([unique_id for unique_id, _, _ in rows]))
+        count = len(ids)
+        nodes = dict(zip(ids, range(count)))
+        
+        # Edges as node pairs and successor-side links as source * count + destination keys
+        sources = array('q')
+        destinations = array('q')
+        mirrored = array('q')
+        dangling: List[Tuple[str, str, str]] = []
+        has_successors = False
+        lookup, add_source, add_destination, add_mirrored = nodes.get, sources.append, destinations.append, mirrored.append
+        for unique_id, predecessors, successors in rows:
+            node = nodes[unique_id]
+            for token in predecessors:
+                target = token if token.isdigit() else link_id(token)
+                other = lookup(target)
+                if other is None:
+                    dangling.append((unique_id, target, 'predecessor'))
+                else:
+                    add_source(other)
+                    add_destination(node)
+            if successors:
+                has_successors = True
+                base = node * count
+                for token in successors:
+                    target = token if token.isdigit() else link_id(token)
+                    other = lookup(target)
+                    if other is None:
+                        dangling.append((unique_id, target, 'successor'))
+                    else:
+                        add_mirrored(base + other)
+        
+        offsets, targets = _group_by_source(count, sources, destinations)
+        
+        one_sided = None
+        if has_successors:
+            predecessor_only, successor_only = _unmatched_links(count, sources, destinations, mirrored)
+            one_sided = [(ids[key // count], ids[key % count], 'predecessor') for key in predecessor_only]
+            one_sided.extend((ids[key // count], ids[key % count], 'successor') for key in successor_only)
+        
+        return cls(ids, offsets, targets, dangling, one_sided)
+    
+    @classmethod
+    def from_lines(cls, schedule_lines: Iterable[ScheduleLine]) -> 'ScheduleNetwork':
+        """Build the network from schedule lines."""
+        return cls.build(network_row(line) for line in schedule_lines)
+    
+    @classmethod
+    def from_table(cls, table) -> 'ScheduleNetwork':
+        """Build the network from a ``ScheduleTable``'s ID and link columns."""
+        predecessors = table.unique_id_predecessors
+        successors = table.unique_id_successors
+        return cls.build((table.unique_id[row], predecessors.row(row), successors.row(row))
+                         for row in range(len(table)))
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def successors(self, node: int) -> array:
+        """Successor node numbers of ``node``."""
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+    
+    def cycles(self) -> List[List[str]]:
+        """Unique IDs of every loop: strongly connected components of two or
+        more activities, and activities linked to themselves.
+
+        Iterative Tarjan, so deep chains do not hit the recursion limit.
+        """
+        offsets, targets = self.offsets, self.targets
+        count = len(self.ids)
+        index = [-1] * count
+        low = [0] * count
+        on_stack = bytearray(count)
+        stack: List[int] = []
+        loops: List[List[str]] = []
+        counter = 0
+        
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [[root, offsets[root]]]
+            
+            while work:
+                frame = work[-1]
+                node, edge = frame
+                if edge < offsets[node + 1]:
+                    frame[1] = edge + 1
+                    successor = targets[edge]
+                    if index[successor] == -1:
+                        index[successor] = low[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = 1
+                        work.append([successor, offsets[successor]])
+                    elif on_stack[successor] and index[successor] < low[node]:
+                        low[node] = index[successor]
+                    continue
+                
+                work.pop()
+                if work and low[node] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self.successors(node):
+                        loops.append([self.ids[member] for member in reversed(component)])
+        return loops
+    
+    def summary(self, max_samples: int = NETWORK_SAMPLES) -> Dict[str, Any]:
+        """Integrity findings in the shape used by the analysis results.
+        
+        ``cycles``, ``dangling_links`` and ``one_sided_links`` are counts;
+        the first ``max_samples`` findings of each kind are formatted
+        under ``samples``.
+        """
+        loops = self.cycles()
+        one_sided = self.one_sided or []
+        return {
+            'nodes': len(self.ids),
+            'links': len(self.targets),
+            'passed': not loops and not self.dangling and not one_sided,
+            'cycles': len(loops),
+            'dangling_links': len(self.dangling),
+            'one_sided_links': len(one_sided),
+            'links_checked': self.one_sided is not None,
+            'samples': {
+                'cycles': [', '.join(loop) for loop in loops[:max_samples]],
+                'dangling_links': [f"{unique_id}: {side} {missing} does not exist"
+                                   for unique_id, missing, side in self.dangling[:max_samples]],
+                'one_sided_links': [
+                    f"{predecessor} -> {successor}: only in the {side} list of "
+                    f"{successor if side == 'predecessor' else predecessor}"
+                    for predecessor, successor, side in one_sided[:max_samples]
+                ],
+            },
+        }
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""Columnar schedule representation for vectorized DCMA checks."""
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+import numpy as np
+from .relationships import Relationship, RelationshipIndex
+from .schedule_data import ScheduleLine
+
+# datetime64[D] counts days from 1970-01-01; NaT is the int64 minimum
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+NAT = np.iinfo(np.int64).min
+
+NUMERIC_FIELDS = ('percent_complete', 'duration', 'actual_duration', 'free_slack', 'total_slack')
+DATE_FIELDS = ('start_date', 'finish_date', 'actual_start', 'actual_finish', 'constraint_date')
+CATEGORY_FIELDS = ('wbs_std', 'status', 'constraint_type')
+TEXT_FIELDS = ('unique_id', 'id', 'wbs', 'task_name')
+LINK_FIELDS = ('predecessors', 'successors', 'unique_id_predecessors', 'unique_id_successors')
+
+
+def _date_ordinal(value: Optional[datetime]) -> int:
+    """Convert a datetime to a datetime64[D] integer, NaT for None."""
+    if value is None:
+        return NAT
+    return value.toordinal() - EPOCH_ORDINAL
+
+
+def _ordinal_date(value: np.datetime64) -> Optional[datetime]:
+    """Convert a datetime64[D] value back to a datetime, None for NaT."""
+    if np.isnat(value):
+        return None
+    return datetime.fromordinal(int(value.astype(np.int64)) + EPOCH_ORDINAL)
+
+
+class Categorical:
+    """Integer codes into a small list of distinct string values."""
+    
+    def __init__(self, codes: np.ndarray, categories: List[str]):
+        self.codes = codes
+        self.categories = categories
+    
+    @classmethod
+    def from_values(cls, values: Sequence[str]) -> 'Categorical':
+        """Encode a sequence of strings."""
+        lookup: Dict[str, int] = {}
+        codes = np.fromiter((lookup.setdefault(v, len(lookup)) for v in values),
+                            dtype=np.int32, count=len(values))
+        return cls(codes, list(lookup))
+    
+    def isin(self, values: Iterable[str]) -> np.ndarray:
+        """Boolean mask of rows whose value is one of ``values``."""
+        values = set(values)
+        wanted = [i for i, category in enumerate(self.categories) if category in values]
+        return np.isin(self.codes, wanted)
+    
+    def __getitem__(self, row: int) -> str:
+        return self.categories[self.codes[row]]
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class Links:
+    """Ragged per-row lists stored as a flat value array plus row offsets."""
+    
+    def __init__(self, offsets: np.ndarray, values: np.ndarray):
+        self.offsets = offsets
+        self.values = values
+    
+    @classmethod
+    def from_lists(cls, lists: Sequence[List[str]]) -> 'Links':
+        """Flatten a sequence of per-row lists, dropping empty tokens."""
+        flat: List[str] = []
+        offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+        for row, items in enumerate(lists):
+            flat.extend(item for item in items if item)
+            offsets[row + 1] = len(flat)
+        values = np.empty(len(flat), dtype=object)
+        values[:] = flat
+        return cls(offsets, values)
+    
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of entries per row."""
+        return np.diff(self.offsets)
+    
+    @property
+    def owners(self) -> np.ndarray:
+        """Row index owning each flat entry."""
+        return np.repeat(np.arange(len(self.offsets) - 1), self.counts)
+    
+    def row(self, row: int) -> List[str]:
+        """Entries belonging to one row."""
+        return list(self.values[self.offsets[row]:self.offsets[row + 1]])
+
+
+class ScheduleTable:
+    """Column-oriented view of a schedule.
+
+    Numeric fields are float64 arrays, dates are datetime64[D] arrays (NaT for
+    missing; times of day are dropped), low-cardinality text fields are
+    ``Categorical`` and relationship lists are ``Links``. Parsed predecessor
+    links live in ``relationships``, aligned entry for entry with
+    ``predecessors``, with ``link_types`` and ``link_lags`` as NumPy views.
+    The table holds the same information as a list of ``ScheduleLine`` and
+    can be converted back with ``iter_lines``.
+    """
+    
+    def __init__(self, columns: Dict[str, object]):
+        self.columns = columns
+        for name, column in columns.items():
+            setattr(self, name, column)
+    
+    def __len__(self) -> int:
+        return len(self.unique_id)
+    
+    @classmethod
+    def from_lines(cls, schedule_lines: Iterable[ScheduleLine]) -> 'ScheduleTable':
+        """Build a table from a list or stream of schedule lines."""
+        names = TEXT_FIELDS + CATEGORY_FIELDS + NUMERIC_FIELDS + DATE_FIELDS + LINK_FIELDS + (
+            'critical', 'predecessor_links')
+        raw: Dict[str, list] = {name: [] for name in names}
+        appenders = [(name, raw[name].append) for name in names]
+        
+        for line in schedule_lines:
+            for name, append in appenders:
+                append(getattr(line, name))
+        
+        columns: Dict[str, object] = {}
+        for name in TEXT_FIELDS:
+            column = np.empty(len(raw[name]), dtype=object)
+            column[:] = raw[name]
+            columns[name] = column
+        for name in CATEGORY_FIELDS:
+            columns[name] = Categorical.from_values(raw[name])
+        for name in NUMERIC_FIELDS:
+            columns[name] = np.array(raw[name], dtype=np.float64)
+        for name in DATE_FIELDS:
+            ordinals = np.fromiter((_date_ordinal(d) for d in raw[name]), dtype=np.int64,
+                                   count=len(raw[name]))
+            columns[name] = ordinals.view('datetime64[D]')
+        for name in LINK_FIELDS:
+            columns[name] = Links.from_lists(raw[name])
+        columns['critical'] = np.array(raw['critical'], dtype=bool)
+        columns['relationships'] = RelationshipIndex.from_links(raw['predecessor_links'])
+        
+        return cls(columns)
+    
+    @property
+    def link_types(self) -> np.ndarray:
+        """``RelationType`` code of every predecessor link."""
+        return np.frombuffer(self.relationships.types, dtype=np.int8)
+    
+    @property
+    def link_lags(self) -> np.ndarray:
+        """Signed lag value of every predecessor link."""
+        return np.frombuffer(self.relationships.lags, dtype=np.float64)
+    
+    def links(self, row: int) -> List[Relationship]:
+        """Parsed predecessor links of one row."""
+        offsets = self.predecessors.offsets
+        return [self.relationships[i] for i in range(offsets[row], offsets[row + 1])]
+    
+    def line(self, row: int) -> ScheduleLine:
+        """Materialise a single row as a ``ScheduleLine``."""
+        values = {name: self.columns[name][row] for name in TEXT_FIELDS + CATEGORY_FIELDS}
+        values.update((name, float(self.columns[name][row])) for name in NUMERIC_FIELDS)
+        values.update((name, self.date(name, row)) for name in DATE_FIELDS)
+        values.update((name, self.columns[name].row(row)) for name in LINK_FIELDS)
+        values['critical'] = bool(self.critical[row])
+        values['predecessor_links'] = self.links(row)
+        return ScheduleLine(**values)
+    
+    def iter_lines(self) -> Iterator[ScheduleLine]:
+        """Yield every row as a ``ScheduleLine``."""
+        for row in range(len(self)):
+            yield self.line(row)
+    
+    @staticmethod
+    def as_date(value: datetime) -> np.datetime64:
+        """Convert a datetime to a scalar comparable with the date columns."""
+        return np.datetime64(value.date(), 'D')
+    
+    def present(self, name: str) -> np.ndarray:
+        """Boolean mask of rows where the date column ``name`` is set."""
+        return ~np.isnat(self.columns[name])
+    
+    def format_dates(self, name: str, rows: np.ndarray, fmt: str) -> List[Optional[str]]:
+        """Format a date column at ``rows`` with ``strftime``, once per distinct date."""
+        distinct, inverse = np.unique(self.columns[name][rows], return_inverse=True)
+        texts = [_ordinal_date(value) for value in distinct]
+        texts = [value.strftime(fmt) if value else None for value in texts]
+        return [texts[k] for k in inverse.ravel()]
+    
+    def date(self, name: str, row: int) -> Optional[datetime]:
+        """Return one value of a date column as a datetime."""
+        return _ordinal_date(self.columns[name][row])
\ No newline at end of file
@@ -1,6 +1,6 @@
 """DCMA analysis prompts for OpenAI."""
 
-SYSTEM_PROMPT = """You are a project schedule quality expert specializing in DCMA 11-point analysis.
+SYSTEM_PROMPT = """You are a project schedule quality expert specializing in DCMA 14-point analysis.
 
 You analyze project schedules and provide recommendations based on DCMA criteria:
 1. Logic (≥95% activities have predecessors/successors)
@@ -14,6 +14,11 @@ You analyze project schedules and provide recommendations based on DCMA criteria
 9. High Duration (≤5% >44 days)
 10. Invalid Forecast Dates (0)
 11. Invalid Actual Dates (0)
+12. Critical Path Test (continuous critical path from start to finish)
+13. Critical Path Length Index (CPLI ≥ 0.95)
+14. Baseline Execution Index (BEI ≥ 0.95)
+
+A value of N/A means the point could not be measured (e.g. no baseline was supplied, or the project finish is not after the data date) and is left out of the passed and failed counts; it needs no recommendation.
 
 Provide clear, actionable recommendations for any failed checks."""
 
@@ -36,4 +41,107 @@ INTERPRETATION_PROMPT = """Interpret these DCMA analysis results for a project m
 Explain in business terms:
 - What these results mean for project success
 - Which issues pose the highest risk
-- Recommended next steps"""
\ No newline at end of file
+- Recommended next steps"""
+
+POINT_PROMPT = """Please analyze the following failed DCMA check and provide:
+
+1. A recommendation for this point with its priority (HIGH, MEDIUM or LOW)
+2. Concrete implementation steps to fix it
+3. The risk it poses to the project
+
+DCMA Point {point}: {name} (threshold {threshold})
+{description}
+Standard guidance: {recommendation}
+
+Check Result:
+{check_result}
+
+Focus on practical, actionable advice for project managers."""
+
+# Name, threshold, purpose and standard guidance for each point, e.g. for ``DCMAAgent.explain_dcma_point``
+DCMA_POINTS = {
+    1: {
+        "name": "Logic",
+        "threshold": "≥95%",
+        "description": "Ensures most activities have predecessors and successors (no open ends)",
+        "recommendation": "Review the schedule and ensure that all activities (except start/milestone) have both predecessors and successors."
+    },
+    2: {
+        "name": "Leads (Negative Lag)",
+        "threshold": "0",
+        "description": "Lead time (negative lag) should not be used as it can hide logic flaws",
+        "recommendation": "Remove negative lags and replace with explicit task sequencing to show accurate logic."
+    },
+    3: {
+        "name": "Lags",
+        "threshold": "≤5%",
+        "description": "Excessive lag can disrupt proper sequencing and control",
+        "recommendation": "Review and eliminate lag where feasible, replacing it with additional tasks or more explicit dependencies."
+    },
+    4: {
+        "name": "Relationship Types",
+        "threshold": "≥90% FS",
+        "description": "Ensures that at least 90% of activity relationships are Finish-to-Start (FS)",
+        "recommendation": "Convert SS/FF dependencies to FS wherever practical to maintain clarity and sequencing discipline."
+    },
+    5: {
+        "name": "Start-to-Finish Relations",
+        "threshold": "0",
+        "description": "Start-to-Finish dependencies are not recommended and should be avoided entirely",
+        "recommendation": "Identify and eliminate SF dependencies, replacing them with FS or SS links as appropriate."
+    },
+    6: {
+        "name": "Hard Constraints",
+        "threshold": "≤5%",
+        "description": "Limits use of constraints like 'Must Finish On' that override logic",
+        "recommendation": "Replace hard constraints with flexible alternatives (e.g., 'As Late As Possible')."
+    },
+    7: {
+        "name": "High Float",
+        "threshold": "≤5%",
+        "description": "Highlights overly flexible activities that may indicate poor logic",
+        "recommendation": "Analyze tasks with high float for unnecessary delay or missing dependencies."
+    },
+    8: {
+        "name": "Negative Float",
+        "threshold": "0",
+        "description": "Indicates the project is behind schedule or has unrealistic deadlines",
+        "recommendation": "Re-sequence or adjust the schedule to eliminate negative float and align with project goals."
+    },
+    9: {
+        "name": "High Duration",
+        "threshold": "≤5%",
+        "description": "Flags activities that are too long (+44 day duration) to manage effectively",
+        "recommendation": "Break long-duration tasks into smaller, more manageable activities with logical dependencies."
+    },
+    10: {
+        "name": "Invalid Forecast Dates",
+        "threshold": "0",
+        "description": "No forecast dates should be earlier than the data date",
+        "recommendation": "Update planned dates to ensure no forecasted work precedes the current data date."
+    },
+    11: {
+        "name": "Invalid Actual Dates",
+        "threshold": "0",
+        "description": "No actual dates should exist in the future",
+        "recommendation": "Correct future actual dates to reflect only completed work as of the current data date."
+    },
+    12: {
+        "name": "Critical Path Test",
+        "threshold": "Continuous",
+        "description": "The critical path must run unbroken through driving logic from the project start to its finish",
+        "recommendation": "Repair the logic of activities where the critical path breaks so that a continuous driving path links the project start to its finish."
+    },
+    13: {
+        "name": "Critical Path Length Index (CPLI)",
+        "threshold": "≥0.95",
+        "description": "Ratio of the remaining critical path length plus its total float to that length; below 1.0 the finish date is at risk",
+        "recommendation": "Recover the negative float on the critical path, e.g. by re-sequencing or adding resources, so the project can still finish on time."
+    },
+    14: {
+        "name": "Baseline Execution Index (BEI)",
+        "threshold": "≥0.95",
+        "description": "Tasks actually completed compared with the tasks the baseline planned to finish by the data date",
+        "recommendation": "Finish the overdue baseline work and review whether the remaining plan is still achievable."
+    }
+}
\ No newline at end of file
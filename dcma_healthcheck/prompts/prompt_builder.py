@@ -0,0 +1,206 @@
+"""Token-budgeted analysis prompts for the LLM agents."""
+import os
+from collections import Counter, OrderedDict
+from datetime import date
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+from ..models.check_result import result_status
+from .dcma_prompts import ANALYSIS_PROMPT, DCMA_POINTS, POINT_PROMPT
+
+# Rough size of a token in characters for English report text
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens ``text`` encodes to."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def source_key(path: str, *settings: Hashable) -> Optional[Tuple[Hashable, ...]]:
+    """Prompt cache key for a schedule file: its identity, today's date and ``settings``.
+
+    The date is part of the key because points 10, 11 and 14 measure
+    against it. Returns None for anything that is not a readable file.
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, date.today().toordinal()) + settings
+
+
+def point_info(result: Mapping[str, Any]) -> Dict[str, str]:
+    """``DCMA_POINTS`` entry of a result's point, made from the result itself for plugin points."""
+    point = DCMA_POINTS.get(result['point'])
+    if point is not None:
+        return point
+    return {
+        "name": result['description'],
+        "threshold": str(result['threshold']),
+        "description": result['description'],
+        "recommendation": result['recommendation'],
+    }
+
+
+class PromptBuilder:
+    """Render ``ANALYSIS_PROMPT`` with the analysis compacted to a token budget.
+
+    Instead of every failed task, each failed point lists its failure
+    count, the WBS branches (the first ``wbs_depth`` levels of the WBS
+    code) with the most failures, and its ``exemplars`` most severe
+    failures (see ``FailedTasks.top``). While the prompt exceeds
+    ``token_budget`` the exemplars and branches are halved, then the
+    recommendations dropped, and as a last resort the text is cut.
+
+    Rendered prompts are kept in a small LRU cache under a caller-supplied
+    key (see ``source_key``); call ``clear`` after changing analyzer
+    settings the key does not cover, such as the baseline.
+    """
+    
+    def __init__(self, token_budget: int = 6000, exemplars: int = 5, wbs_depth: int = 2,
+                 wbs_groups: int = 8, cache_size: int = 128):
+        """Initialize the builder."""
+        self.token_budget = token_budget
+        self.exemplars = exemplars
+        self.wbs_depth = wbs_depth
+        self.wbs_groups = wbs_groups
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[Hashable, str]' = OrderedDict()
+    
+    def lookup(self, key: Optional[Hashable]) -> Optional[str]:
+        """Cached prompt for ``key``, or None."""
+        if key is None or key not in self._cache:
+            return None
+        self._cache.move_to_end(key)
+        return self._cache[key]
+    
+    def clear(self) -> None:
+        """Forget all cached prompts."""
+        self._cache.clear()
+    
+    def build(self, analysis_results: Dict[str, Any], wbs: Optional[Mapping[str, str]] = None,
+              key: Optional[Hashable] = None) -> str:
+        """Render the analysis prompt within the token budget.
+
+        ``wbs`` maps unique IDs to WBS codes (see ``DCMAAnalyzer.process_file``);
+        without it failures are only counted per point. With a ``key`` the
+        prompt is cached, and a cached prompt is returned as is.
+        """
+        cached = self.lookup(key)
+        if cached is not None:
+            return cached
+        
+        points = [self._point_facts(result, wbs) for result in analysis_results['results']]
+        overhead = estimate_tokens(ANALYSIS_PROMPT.format(analysis_results=''))
+        budget = self.token_budget - overhead
+        
+        exemplars, groups = self.exemplars, self.wbs_groups
+        while True:
+            text = self._render(analysis_results, points, exemplars, groups, recommendations=True)
+            if estimate_tokens(text) <= budget or (exemplars == 0 and groups == 0):
+                break
+            exemplars, groups = exemplars // 2, groups // 2
+        if estimate_tokens(text) > budget:
+            text = self._render(analysis_results, points, 0, 0, recommendations=False)
+        if estimate_tokens(text) > budget:
+            text = self._truncate(text, budget)
+        
+        prompt = ANALYSIS_PROMPT.format(analysis_results=text)
+        if key is not None:
+            self._cache[key] = prompt
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return prompt
+    
+    def build_point(self, result: Mapping[str, Any], wbs: Optional[Mapping[str, str]] = None) -> str:
+        """Render ``POINT_PROMPT`` for one failed point within the token budget.
+
+        ``result`` is one entry of the analysis ``results``; the prompt
+        adds the point's standard guidance from ``DCMA_POINTS``, or the
+        checker's own for a point outside the 14 (see ``point_info``).
+        Not cached.
+        """
+        facts = dict(point_info(result), point=result['point'])
+        branches, top = self._point_facts(result, wbs)
+        budget = self.token_budget - estimate_tokens(POINT_PROMPT.format(check_result='', **facts))
+        
+        exemplars, groups = self.exemplars, self.wbs_groups
+        while True:
+            text = "\n".join(self._point_lines(result, branches, top, exemplars, groups, recommendations=True))
+            if estimate_tokens(text) <= budget or (exemplars == 0 and groups == 0):
+                break
+            exemplars, groups = exemplars // 2, groups // 2
+        if estimate_tokens(text) > budget:
+            text = self._truncate(text, budget)
+        return POINT_PROMPT.format(check_result=text, **facts)
+    
+    @staticmethod
+    def _truncate(text: str, budget: int) -> str:
+        """Cut ``text`` at a line boundary so that it fits ``budget`` tokens."""
+        marker = "\n[truncated]"
+        return text[:max(budget * CHARS_PER_TOKEN - len(marker), 0)].rsplit("\n", 1)[0] + marker
+    
+    def _branch(self, code: Optional[str]) -> str:
+        if not code:
+            return "(no WBS)"
+        return '.'.join(code.split('.')[:self.wbs_depth])
+    
+    def _point_facts(self, result: Mapping[str, Any],
+                     wbs: Optional[Mapping[str, str]]) -> Tuple[List[Tuple[str, int]], List[str]]:
+        """Failures of one point by WBS branch (largest first) and its most severe exemplars."""
+        failed_tasks = result['failed_tasks']
+        if result['passed'] is not False or not failed_tasks:
+            return [], []
+        branches: List[Tuple[str, int]] = []
+        if wbs is not None:
+            counts = Counter(self._branch(wbs.get(unique_id)) for unique_id in failed_tasks.unique_ids())
+            branches = counts.most_common()
+        return branches, failed_tasks.top(self.exemplars)
+    
+    def _render(self, analysis_results: Dict[str, Any], points: List[Tuple[List[Tuple[str, int]], List[str]]],
+                exemplars: int, groups: int, recommendations: bool) -> str:
+        """Compact report text with the given number of exemplars and WBS branches per point."""
+        summary = analysis_results['summary']
+        lines = ["DCMA 14-Point Schedule Quality Check Report (failures summarised)",
+                 f"Overall Results: {summary['passed_checks']}/{summary['total_checks']} checks passed "
+                 f"({summary['overall_pass_rate']})",
+                 ""]
+        
+        for result, (branches, top) in zip(analysis_results['results'], points):
+            lines.extend(self._point_lines(result, branches, top, exemplars, groups, recommendations))
+        
+        network = analysis_results.get('network')
+        if network is not None:
+            status = "PASS" if network['passed'] else "FAIL"
+            findings = [f"{network['cycles']} loops", f"{network['dangling_links']} links to missing activities"]
+            if network['links_checked']:
+                findings.append(f"{network['one_sided_links']} one-sided links")
+            lines.append(f"Network Integrity: {network['nodes']} activities, {network['links']} links - {status} "
+                         f"({', '.join(findings)})")
+        critical_path = analysis_results.get('critical_path')
+        if critical_path is not None:
+            lines.append(f"Critical Path (computed float): {critical_path['duration']:g} working days, "
+                         f"{critical_path['critical']} critical activities")
+        return "\n".join(lines)
+    
+    def _point_lines(self, result: Mapping[str, Any], branches: List[Tuple[str, int]], top: List[str],
+                     exemplars: int, groups: int, recommendations: bool) -> List[str]:
+        """Report lines for one point."""
+        if result['passed'] is not False:
+            return [f"Point {result['point']}: {result['description']} - {result_status(result)} "
+                    f"(threshold {result['threshold']}, actual {result['value']})"]
+        lines = [f"Point {result['point']}: {result['description']} - FAIL",
+                 f"  Threshold: {result['threshold']}",
+                 f"  Actual: {result['value']}"]
+        if recommendations:
+            lines.append(f"  Recommendation: {result['recommendation']}")
+        failed_count = len(result['failed_tasks'])
+        if failed_count:
+            lines.append(f"  Failed tasks: {failed_count}")
+        if branches and groups:
+            shown = ", ".join(f"{branch}: {count}" for branch, count in branches[:groups])
+            more = f" (+{len(branches) - groups} more branches)" if len(branches) > groups else ""
+            lines.append(f"  By WBS branch: {shown}{more}")
+        if top and exemplars:
+            lines.append("  Most severe:")
+            lines.extend(f"    - {task}" for task in top[:exemplars])
+        return lines
\ No newline at end of file
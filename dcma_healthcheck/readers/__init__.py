@@ -0,0 +1 @@
+"""Schedule readers module."""
\ No newline at end of file
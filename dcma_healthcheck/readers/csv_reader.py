@@ -0,0 +1,128 @@
+"""Streaming reader for tab-separated schedule exports."""
+import io
+import os
+import sys
+from contextlib import contextmanager
+from typing import IO, Dict, Iterator, Optional, Tuple, Union
+from ..models.field_parsers import FieldParser
+from ..models.schedule_data import ScheduleLine
+
+ScheduleSource = Union[str, os.PathLike, IO]
+
+# Leading bytes of the compressed container formats we accept transparently,
+# and the module that reads each
+COMPRESSION_MAGIC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'lzma'),
+)
+
+
+def _decompress(binary: IO[bytes]) -> IO[bytes]:
+    """Wrap a peekable binary stream in a decompressor if its magic bytes match one."""
+    head = binary.peek(6)[:6]
+    for magic, module in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            # Imported here so that uncompressed exports never load the codecs
+            if module == 'gzip':
+                import gzip
+                return gzip.GzipFile(fileobj=binary)
+            if module == 'bz2':
+                import bz2
+                return bz2.BZ2File(binary)
+            import lzma
+            return lzma.LZMAFile(binary)
+    return binary
+
+
+@contextmanager
+def open_schedule_binary(source: ScheduleSource) -> Iterator[IO[bytes]]:
+    """Open a schedule source as a binary stream.
+    
+    Accepts a path, ``'-'`` for stdin, or an open binary file object. Input
+    compressed with gzip, bz2 or xz is decompressed on the fly. File objects
+    passed in by the caller are left open.
+    """
+    owned = None
+    if isinstance(source, (str, os.PathLike)):
+        if os.fspath(source) == '-':
+            binary = sys.stdin.buffer
+        else:
+            binary = owned = open(source, 'rb')
+    else:
+        binary = source
+    
+    # Streams without ``peek`` get a buffer for sniffing the magic bytes; it is
+    # detached afterwards, since closing or collecting it would close the stream
+    buffered = None
+    if not hasattr(binary, 'peek'):
+        binary = buffered = io.BufferedReader(binary)
+    try:
+        yield _decompress(binary)
+    finally:
+        if buffered is not None:
+            buffered.detach()
+        if owned is not None:
+            owned.close()
+
+
+@contextmanager
+def open_schedule_text(source: ScheduleSource, encoding: str = 'utf-8') -> Iterator[IO[str]]:
+    """Open a schedule export as a text stream.
+    
+    Takes the same sources as ``open_schedule_binary``; an already open text
+    stream is used as is.
+    """
+    if isinstance(source, io.TextIOBase):
+        yield source
+        return
+    
+    with open_schedule_binary(source) as binary:
+        text = io.TextIOWrapper(binary, encoding=encoding)
+        try:
+            yield text
+        finally:
+            # Detach so closing the wrapper never closes a caller's stream or stdin
+            text.detach()
+
+
+def iter_rows(stream: IO[str]) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Yield ``(line_number, {header: value})`` for each non-blank data row."""
+    header_line = stream.readline()
+    if not header_line:
+        return
+    headers = [h.strip() for h in header_line.split('\t')]
+    
+    for line_num, line in enumerate(stream, 2):
+        if line.strip():
+            values = [v.strip() for v in line.split('\t')]
+            yield line_num, dict(zip(headers, values))
+
+
+def iter_schedule_lines(stream: IO[str], has_headers: bool = True,
+                        parser: Optional[FieldParser] = None) -> Iterator[ScheduleLine]:
+    """Lazily parse schedule lines from a tab-separated text stream.
+    
+    Rows that fail to parse are reported and skipped, matching the behaviour
+    of the original whole-file reader.
+    """
+    if has_headers:
+        for line_num, data_dict in iter_rows(stream):
+            try:
+                yield ScheduleLine.from_csv_with_headers(data_dict, parser)
+            except Exception as e:
+                print(f"Error parsing line {line_num}: {e}")
+    else:
+        for line_num, line in enumerate(stream, 1):
+            if line.strip():
+                try:
+                    yield ScheduleLine.from_csv_line(line, parser)
+                except Exception as e:
+                    print(f"Error parsing line {line_num}: {e}")
+
+
+def read_schedule(source: ScheduleSource, has_headers: bool = True, encoding: str = 'utf-8',
+                  parser: Optional[FieldParser] = None) -> Iterator[ScheduleLine]:
+    """Stream schedule lines from a path, file object, stdin or compressed file."""
+    with open_schedule_text(source, encoding) as stream:
+        yield from iter_schedule_lines(stream, has_headers, parser)
\ No newline at end of file
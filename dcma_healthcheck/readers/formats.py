@@ -0,0 +1,51 @@
+"""Choose a schedule reader from a file's format."""
+import os
+from typing import Iterator, Optional
+from ..models.field_parsers import FieldParser
+from ..models.schedule_data import ScheduleLine
+from .csv_reader import ScheduleSource, read_schedule
+
+# File extensions (after any compression suffix) and the format they imply
+EXTENSIONS = {
+    '.csv': 'tsv',
+    '.tsv': 'tsv',
+    '.txt': 'tsv',
+    '.xml': 'mspdi',
+    '.xer': 'xer',
+    '.xlsx': 'xlsx',
+}
+COMPRESSION_SUFFIXES = ('.gz', '.bz2', '.xz')
+FORMATS = ('tsv', 'mspdi', 'xer', 'xlsx')
+
+
+def detect_format(source: ScheduleSource) -> str:
+    """Guess the format of a schedule source from its name, defaulting to tab-separated."""
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, 'name', '')
+    name = os.fspath(name).lower() if isinstance(name, (str, os.PathLike)) else ''
+    for suffix in COMPRESSION_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return EXTENSIONS.get(os.path.splitext(name)[1], 'tsv')
+
+
+def read_schedule_file(source: ScheduleSource, fmt: Optional[str] = None, has_headers: bool = True,
+                       parser: Optional[FieldParser] = None) -> Iterator[ScheduleLine]:
+    """Stream schedule lines from any supported format.
+    
+    ``has_headers`` only applies to tab-separated exports and ``parser`` to
+    tab-separated and Excel exports. The readers of the other formats
+    are imported on first use, keeping them off the tab-separated path.
+    """
+    fmt = fmt or detect_format(source)
+    if fmt == 'tsv':
+        return read_schedule(source, has_headers, parser=parser)
+    if fmt == 'mspdi':
+        from .mspdi_reader import read_mspdi
+        return read_mspdi(source)
+    if fmt == 'xer':
+        from .xer_reader import read_xer
+        return read_xer(source)
+    if fmt == 'xlsx':
+        from .xlsx_reader import read_xlsx
+        return read_xlsx(source, parser)
+    raise ValueError(f"Unknown schedule format: {fmt}. Expected one of {FORMATS}")
\ No newline at end of file
@@ -0,0 +1,237 @@
+"""Streaming importer for Microsoft Project XML (MSPDI) files."""
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from ..models.relationships import LagUnit, Relationship, RelationType, format_relationship
+from ..models.schedule_data import ScheduleLine
+from .csv_reader import ScheduleSource, open_schedule_binary
+
+# Task/ConstraintType codes
+CONSTRAINT_TYPES = {
+    '0': 'As Soon As Possible',
+    '1': 'As Late As Possible',
+    '2': 'Must Start On',
+    '3': 'Must Finish On',
+    '4': 'Start No Earlier Than',
+    '5': 'Start No Later Than',
+    '6': 'Finish No Earlier Than',
+    '7': 'Finish No Later Than',
+}
+
+# LagFormat codes 35+ are the "estimated" variants of 3-20
+ESTIMATED_LAG_OFFSET = 32
+
+# TotalSlack/FreeSlack are written in thousandths of a minute
+SLACK_UNITS_PER_MINUTE = 1000
+
+# Sub-trees the DCMA checks never look at; they are dropped as soon as they close
+SKIPPED_SECTIONS = {'Calendar', 'Resource', 'Assignment', 'ExtendedAttributes', 'OutlineCodes'}
+
+# Project-level elements and the reader attribute they set
+PROJECT_SETTINGS = {
+    'MinutesPerDay': 'minutes_per_day',
+    'MinutesPerWeek': 'minutes_per_week',
+    'DaysPerMonth': 'days_per_month',
+    'StatusDate': 'status_date',
+}
+
+ISO_DURATION = re.compile(
+    r'^-?P(?:(?P<days>\d+(?:\.\d+)?)D)?'
+    r'(?:T(?:(?P<hours>\d+(?:\.\d+)?)H)?(?:(?P<minutes>\d+(?:\.\d+)?)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$'
+)
+
+# Raw link as read from the file: predecessor UID, type, LinkLag, LagFormat
+RawLink = Tuple[str, RelationType, int, LagUnit]
+
+
+@lru_cache(maxsize=256)
+def _local(tag: str) -> str:
+    """Strip the XML namespace from a tag."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _parse_datetime(text: Optional[str]) -> Optional[datetime]:
+    """Parse an MSPDI timestamp such as ``2022-02-01T08:00:00``."""
+    if not text:
+        return None
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def _duration_minutes(text: Optional[str], minutes_per_day: float) -> float:
+    """Convert an ISO 8601 duration (``PT16H0M0S``) to working minutes."""
+    match = ISO_DURATION.match(text or '')
+    if not match:
+        return 0.0
+    parts = {name: float(value) for name, value in match.groupdict().items() if value}
+    minutes = (parts.get('days', 0.0) * minutes_per_day + parts.get('hours', 0.0) * 60
+               + parts.get('minutes', 0.0) + parts.get('seconds', 0.0) / 60)
+    return -minutes if text.startswith('-') else minutes
+
+
+class MSPDIReader:
+    """Read tasks and links from an MSPDI file in a single ``iterparse`` pass.
+
+    Each ``Task`` element is converted as soon as it closes and then
+    removed from the tree, so memory is bounded by the resulting schedule
+    rather than the XML tree. Summary tasks (``<Summary>1</Summary>``) only
+    roll up their subtasks; like the XER reader's level of effort and WBS
+    summary tasks, they are not imported and links to or from them are
+    dropped. Successor lists and ID-based predecessor tokens are filled in
+    once all tasks have been seen.
+    """
+    
+    def __init__(self, minutes_per_day: float = 480, minutes_per_week: float = 2400,
+                 days_per_month: float = 20):
+        """Initialize with calendar defaults, overridden by the file's own settings."""
+        self.minutes_per_day = minutes_per_day
+        self.minutes_per_week = minutes_per_week
+        self.days_per_month = days_per_month
+        self.status_date: Optional[datetime] = None
+    
+    def _lag_value(self, link_lag: int, unit: LagUnit) -> float:
+        """Express a ``LinkLag`` (tenths of a minute or percent) in its display unit."""
+        value = link_lag / 10
+        minutes_per_unit = {
+            LagUnit.MINUTES: 1, LagUnit.ELAPSED_MINUTES: 1,
+            LagUnit.HOURS: 60, LagUnit.ELAPSED_HOURS: 60,
+            LagUnit.DAYS: self.minutes_per_day, LagUnit.ELAPSED_DAYS: 1440,
+            LagUnit.WEEKS: self.minutes_per_week, LagUnit.ELAPSED_WEEKS: 10080,
+            LagUnit.MONTHS: self.minutes_per_day * self.days_per_month, LagUnit.ELAPSED_MONTHS: 43200,
+        }
+        return value / minutes_per_unit.get(unit, 1)
+    
+    def _status(self, percent_complete: float, actual_start: Optional[datetime],
+                finish: Optional[datetime]) -> str:
+        """Derive MS Project's Status field, which MSPDI does not store."""
+        if percent_complete >= 100:
+            return 'Complete'
+        if self.status_date and finish and finish < self.status_date:
+            return 'Late'
+        return 'On Schedule' if actual_start else 'Future Task'
+    
+    def _read_task(self, fields: Dict[str, str]) -> ScheduleLine:
+        """Convert the child values of one ``Task`` element."""
+        percent_complete = float(fields.get('PercentComplete') or 0)
+        start = _parse_datetime(fields.get('Start'))
+        finish = _parse_datetime(fields.get('Finish'))
+        actual_start = _parse_datetime(fields.get('ActualStart'))
+        
+        if fields.get('OutlineLevel') == '0':
+            wbs_std = 'PRJT'
+        elif fields.get('Milestone') == '1':
+            wbs_std = 'MLSTN'
+        else:
+            wbs_std = ''
+        
+        slack_scale = SLACK_UNITS_PER_MINUTE * self.minutes_per_day
+        return ScheduleLine(
+            unique_id=fields.get('UID', ''),
+            id=fields.get('ID', ''),
+            wbs_std=wbs_std,
+            wbs=fields.get('WBS', ''),
+            task_name=fields.get('Name', ''),
+            percent_complete=percent_complete,
+            status=self._status(percent_complete, actual_start, finish),
+            start_date=start,
+            finish_date=finish,
+            actual_start=actual_start,
+            actual_finish=_parse_datetime(fields.get('ActualFinish')),
+            duration=_duration_minutes(fields.get('Duration'), self.minutes_per_day) / self.minutes_per_day,
+            actual_duration=_duration_minutes(fields.get('ActualDuration'), self.minutes_per_day) / self.minutes_per_day,
+            predecessors=[],
+            successors=[],
+            unique_id_predecessors=[],
+            unique_id_successors=[],
+            constraint_type=CONSTRAINT_TYPES.get(fields.get('ConstraintType', '0'), ''),
+            constraint_date=_parse_datetime(fields.get('ConstraintDate')),
+            free_slack=float(fields.get('FreeSlack') or 0) / slack_scale,
+            total_slack=float(fields.get('TotalSlack') or 0) / slack_scale,
+            critical=fields.get('Critical') == '1',
+            predecessor_links=[],
+        )
+    
+    def _read_link(self, fields: Dict[str, str]) -> RawLink:
+        """Convert the child values of one ``PredecessorLink`` element."""
+        lag_format = int(fields.get('LagFormat') or LagUnit.DAYS)
+        if lag_format > ESTIMATED_LAG_OFFSET:
+            lag_format -= ESTIMATED_LAG_OFFSET
+        try:
+            unit = LagUnit(lag_format)
+        except ValueError:
+            unit = LagUnit.DAYS
+        return (fields.get('PredecessorUID', ''), RelationType(int(fields.get('Type') or RelationType.FS)),
+                int(float(fields.get('LinkLag') or 0)), unit)
+    
+    def _resolve(self, tasks: List[Tuple[ScheduleLine, List[RawLink]]], skipped: Set[str]) -> None:
+        """Fill in predecessor/successor tokens once every task's ID is known.
+        
+        Links from the tasks whose UIDs are in ``skipped`` are dropped.
+        """
+        by_uid = {line.unique_id: line for line, _ in tasks}
+        for line, links in tasks:
+            for predecessor_uid, relation_type, link_lag, unit in links:
+                if predecessor_uid in skipped:
+                    continue
+                lag = self._lag_value(link_lag, unit)
+                predecessor = by_uid.get(predecessor_uid)
+                predecessor_id = predecessor.id if predecessor else predecessor_uid
+                
+                token = format_relationship(predecessor_id, relation_type, lag, unit)
+                line.predecessors.append(token)
+                line.unique_id_predecessors.append(format_relationship(predecessor_uid, relation_type, lag, unit))
+                line.predecessor_links.append(Relationship(predecessor_id, relation_type, lag, unit, token))
+                
+                if predecessor:
+                    predecessor.successors.append(format_relationship(line.id, relation_type, lag, unit))
+                    predecessor.unique_id_successors.append(
+                        format_relationship(line.unique_id, relation_type, lag, unit))
+    
+    def read(self, source: ScheduleSource) -> Iterator[ScheduleLine]:
+        """Stream an MSPDI file and yield one ``ScheduleLine`` per task."""
+        tasks: List[Tuple[ScheduleLine, List[RawLink]]] = []
+        skipped: Set[str] = set()
+        
+        with open_schedule_binary(source) as stream:
+            # Start events only maintain the stack of open elements, so that a
+            # converted task can be removed from its parent
+            open_elements: List[ET.Element] = []
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                if event == 'start':
+                    open_elements.append(elem)
+                    continue
+                open_elements.pop()
+                tag = _local(elem.tag)
+                
+                if tag == 'Task':
+                    fields: Dict[str, str] = {}
+                    links: List[RawLink] = []
+                    for child in elem:
+                        child_tag = _local(child.tag)
+                        if child_tag == 'PredecessorLink':
+                            links.append(self._read_link({_local(c.tag): (c.text or '').strip() for c in child}))
+                        else:
+                            fields[child_tag] = (child.text or '').strip()
+                    if fields.get('Summary') == '1':
+                        skipped.add(fields.get('UID', ''))
+                    else:
+                        tasks.append((self._read_task(fields), links))
+                    open_elements[-1].remove(elem)
+                elif tag in SKIPPED_SECTIONS:
+                    open_elements[-1].remove(elem)
+                elif tag in PROJECT_SETTINGS and elem.text:
+                    setattr(self, PROJECT_SETTINGS[tag], _parse_datetime(elem.text)
+                            if tag == 'StatusDate' else float(elem.text))
+        
+        self._resolve(tasks, skipped)
+        for line, _ in tasks:
+            yield line
+
+
+def read_mspdi(source: ScheduleSource) -> Iterator[ScheduleLine]:
+    """Stream schedule lines from an MS Project XML file."""
+    return MSPDIReader().read(source)
\ No newline at end of file
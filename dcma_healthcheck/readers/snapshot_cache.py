@@ -0,0 +1,236 @@
+"""Content-addressed on-disk cache of parsed schedules."""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from ..models.relationships import RelationshipIndex
+from ..models.schedule_table import (
+    CATEGORY_FIELDS, DATE_FIELDS, LINK_FIELDS, NUMERIC_FIELDS, TEXT_FIELDS,
+    Categorical, Links, ScheduleTable,
+)
+
+# Bump whenever parsing logic or the table layout changes; older snapshots are discarded
+SNAPSHOT_VERSION = 1
+
+MAGIC = b'DCMASNAP'
+PREAMBLE = struct.Struct('<8sII')  # magic, version, header length
+ALIGNMENT = 64
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """Hash the raw bytes of a file."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _join_text(values) -> np.ndarray:
+    """Encode strings as one NUL-separated UTF-8 buffer."""
+    return np.frombuffer('\x00'.join(values).encode('utf-8'), dtype=np.uint8)
+
+
+def _split_text(buffer: np.ndarray, count: int) -> np.ndarray:
+    """Inverse of ``_join_text``, returning an object array."""
+    column = np.empty(count, dtype=object)
+    if count:
+        column[:] = buffer.tobytes().decode('utf-8').split('\x00')
+    return column
+
+
+def _flatten(table: ScheduleTable) -> Tuple[Dict[str, object], Dict[str, np.ndarray]]:
+    """Split a table into JSON metadata and named raw arrays."""
+    meta: Dict[str, object] = {'rows': len(table), 'categories': {}, 'counts': {}}
+    arrays: Dict[str, np.ndarray] = {}
+    
+    for name in TEXT_FIELDS:
+        arrays[name] = _join_text(table.columns[name])
+    for name in CATEGORY_FIELDS:
+        arrays[name] = table.columns[name].codes
+        meta['categories'][name] = table.columns[name].categories
+    for name in NUMERIC_FIELDS:
+        arrays[name] = table.columns[name]
+    for name in DATE_FIELDS:
+        arrays[name] = table.columns[name].view(np.int64)
+    for name in LINK_FIELDS:
+        arrays[name + '.offsets'] = table.columns[name].offsets
+        arrays[name + '.values'] = _join_text(table.columns[name].values)
+        meta['counts'][name] = len(table.columns[name].values)
+    arrays['critical'] = table.critical
+    
+    index = table.relationships
+    for name in ('owners', 'types', 'lags', 'lag_units'):
+        arrays['relationships.' + name] = np.asarray(getattr(index, name))
+    arrays['relationships.predecessor_ids'] = _join_text(index.predecessor_ids)
+    arrays['relationships.tokens'] = _join_text(index.tokens)
+    meta['counts']['relationships'] = len(index)
+    
+    return meta, arrays
+
+
+def _rebuild(meta: Dict[str, object], arrays: Dict[str, np.ndarray]) -> ScheduleTable:
+    """Reassemble a table from snapshot metadata and (memory-mapped) arrays."""
+    rows = meta['rows']
+    counts = meta['counts']
+    columns: Dict[str, object] = {}
+    
+    for name in TEXT_FIELDS:
+        columns[name] = _split_text(arrays[name], rows)
+    for name in CATEGORY_FIELDS:
+        columns[name] = Categorical(arrays[name], meta['categories'][name])
+    for name in NUMERIC_FIELDS:
+        columns[name] = arrays[name]
+    for name in DATE_FIELDS:
+        columns[name] = arrays[name].view('datetime64[D]')
+    for name in LINK_FIELDS:
+        columns[name] = Links(arrays[name + '.offsets'],
+                              _split_text(arrays[name + '.values'], counts[name]))
+    columns['critical'] = arrays['critical']
+    
+    index = RelationshipIndex()
+    for name in ('owners', 'types', 'lags', 'lag_units'):
+        setattr(index, name, arrays['relationships.' + name])
+    index.predecessor_ids = list(_split_text(arrays['relationships.predecessor_ids'], counts['relationships']))
+    index.tokens = list(_split_text(arrays['relationships.tokens'], counts['relationships']))
+    columns['relationships'] = index
+    
+    return ScheduleTable(columns)
+
+
+def write_snapshot(table: ScheduleTable, path: str) -> None:
+    """Write a table to ``path`` in the snapshot format.
+
+    Layout: preamble, JSON header, then each array's raw bytes at a
+    64-byte aligned offset so it can be mapped straight back into NumPy.
+    """
+    meta, arrays = _flatten(table)
+    layout: List[Dict[str, object]] = []
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        layout.append({'name': name, 'dtype': array.dtype.str, 'count': int(array.size), 'offset': offset})
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+    meta['arrays'] = layout
+    
+    header = json.dumps(meta).encode('utf-8')
+    data_start = -(-(PREAMBLE.size + len(header)) // ALIGNMENT) * ALIGNMENT
+    
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(PREAMBLE.pack(MAGIC, SNAPSHOT_VERSION, len(header)))
+            file.write(header)
+            for entry in layout:
+                file.seek(data_start + entry['offset'])
+                file.write(arrays[entry['name']].tobytes())
+            # Pad so trailing empty arrays still map inside the file
+            file.truncate(data_start + offset)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_snapshot(path: str) -> Optional[ScheduleTable]:
+    """Memory-map a snapshot back into a table; None if it is stale or unreadable."""
+    with open(path, 'rb') as file:
+        preamble = file.read(PREAMBLE.size)
+        if len(preamble) < PREAMBLE.size:
+            return None
+        magic, version, header_length = PREAMBLE.unpack(preamble)
+        if magic != MAGIC or version != SNAPSHOT_VERSION:
+            return None
+        meta = json.loads(file.read(header_length).decode('utf-8'))
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    data_start = -(-(PREAMBLE.size + header_length) // ALIGNMENT) * ALIGNMENT
+    arrays = {
+        entry['name']: np.frombuffer(mapped, dtype=np.dtype(entry['dtype']), count=entry['count'],
+                                     offset=data_start + entry['offset'])
+        for entry in meta['arrays']
+    }
+    return _rebuild(meta, arrays)
+
+
+class SnapshotCache:
+    """Directory of schedule snapshots keyed by the source file's content hash.
+
+    Entries are evicted least-recently-used first once the directory grows
+    beyond ``max_bytes``; a hit refreshes the entry's modification time.
+    """
+    
+    def __init__(self, directory: str, max_bytes: int = 1 << 30):
+        """Initialize cache in ``directory``, creating it if needed."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+    
+    def key(self, path: str, variant: str = '') -> str:
+        """Cache key for a source file; ``variant`` distinguishes parse options."""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{SNAPSHOT_VERSION}:{variant}:{file_digest(path)}".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.snap')
+    
+    def load(self, key: str) -> Optional[ScheduleTable]:
+        """Return the cached table for ``key``, or None."""
+        path = self._entry_path(key)
+        try:
+            table = read_snapshot(path)
+        except (OSError, ValueError, KeyError):
+            table = None
+        
+        if table is None:
+            self.misses += 1
+            if os.path.exists(path):
+                os.unlink(path)
+            return None
+        
+        self.hits += 1
+        os.utime(path)
+        return table
+    
+    def store(self, key: str, table: ScheduleTable) -> None:
+        """Write ``table`` under ``key`` and evict old entries if over budget."""
+        write_snapshot(table, self._entry_path(key))
+        self.evict()
+    
+    def get_or_build(self, path: str, build: Callable[[], ScheduleTable],
+                     variant: str = '') -> ScheduleTable:
+        """Load the snapshot for ``path`` or build and cache it."""
+        key = self.key(path, variant)
+        table = self.load(key)
+        if table is None:
+            table = build()
+            self.store(key, table)
+        return table
+    
+    def evict(self) -> None:
+        """Delete least recently used snapshots until under ``max_bytes``."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.snap'):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.unlink(os.path.join(self.directory, name))
+            total -= size
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counters for this cache instance."""
+        return {'hits': self.hits, 'misses': self.misses}
\ No newline at end of file
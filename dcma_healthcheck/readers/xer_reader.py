@@ -0,0 +1,241 @@
+"""Streaming importer for Primavera P6 XER exports."""
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from ..models.relationships import LagUnit, Relationship, RelationType, format_relationship
+from ..models.schedule_data import ScheduleLine
+from .csv_reader import ScheduleSource, open_schedule_text
+
+# P6 writes XER files in the Windows ANSI code page
+XER_ENCODING = 'cp1252'
+
+# Columns decoded per table; every other table and column is skipped unread
+XER_COLUMNS = {
+    'PROJECT': ('proj_id', 'last_recalc_date'),
+    'CALENDAR': ('clndr_id', 'day_hr_cnt'),
+    'PROJWBS': ('wbs_id', 'parent_wbs_id', 'wbs_short_name', 'proj_node_flag'),
+    'TASK': (
+        'task_id', 'proj_id', 'wbs_id', 'clndr_id', 'task_code', 'task_name', 'task_type',
+        'status_code', 'phys_complete_pct', 'total_float_hr_cnt', 'free_float_hr_cnt',
+        'target_drtn_hr_cnt', 'remain_drtn_hr_cnt', 'act_start_date', 'act_end_date',
+        'early_start_date', 'early_end_date', 'cstr_type', 'cstr_date', 'driving_path_flag',
+    ),
+    'TASKPRED': ('task_id', 'pred_task_id', 'pred_type', 'lag_hr_cnt'),
+}
+
+# TASKPRED.pred_type codes
+PRED_TYPES = {
+    'PR_FS': RelationType.FS,
+    'PR_SS': RelationType.SS,
+    'PR_FF': RelationType.FF,
+    'PR_SF': RelationType.SF,
+}
+
+# TASK.cstr_type codes, named after their MS Project equivalents so the checks treat them alike
+CONSTRAINT_TYPES = {
+    '': 'As Soon As Possible',
+    'CS_ALAP': 'As Late As Possible',
+    'CS_MSO': 'Start On',
+    'CS_MEO': 'Finish On',
+    'CS_MANDSTART': 'Must Start On',
+    'CS_MANDFIN': 'Must Finish On',
+    'CS_MSOA': 'Start No Earlier Than',
+    'CS_MSOB': 'Start No Later Than',
+    'CS_MEOA': 'Finish No Earlier Than',
+    'CS_MEOB': 'Finish No Later Than',
+}
+
+MILESTONE_TYPES = {'TT_Mile', 'TT_FinMile'}
+
+# Level of effort and WBS summary tasks span other work instead of being
+# discrete activities; they are left out with their links, as the DCMA
+# points only measure discrete work
+SKIPPED_TYPES = {'TT_LOE', 'TT_WBS'}
+
+# P6's own default when a calendar is missing or has no hours per day
+DEFAULT_DAY_HOURS = 8.0
+
+Record = Dict[str, str]
+
+
+def _parse_datetime(text: str) -> Optional[datetime]:
+    """Parse an XER timestamp such as ``2022-02-01 08:00``."""
+    if not text:
+        return None
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def _float(text: str) -> float:
+    """Parse a numeric XER cell, treating blanks as zero."""
+    try:
+        return float(text) if text else 0.0
+    except ValueError:
+        return 0.0
+
+
+class XERReader:
+    """Read tasks and links from an XER file in a single pass over its tables.
+
+    XER files are a sequence of tab-separated tables, each introduced by a
+    ``%T`` name line and a ``%F`` field line followed by ``%R`` rows. Rows of
+    tables the checks do not use are skipped without being split, and only
+    the columns in ``XER_COLUMNS`` are kept. Predecessors are joined to tasks
+    through ``task_id`` dictionaries once the whole file has been read, so
+    table order within the file does not matter. Level of effort and WBS
+    summary tasks (``SKIPPED_TYPES``) are not imported, and links to or from
+    them are dropped.
+    """
+    
+    def __init__(self, encoding: str = XER_ENCODING):
+        """Initialize reader for files in ``encoding``."""
+        self.encoding = encoding
+        self.status_date: Optional[datetime] = None
+    
+    def _read_tables(self, source: ScheduleSource) -> Dict[str, List[Record]]:
+        """Collect the wanted columns of the wanted tables."""
+        tables: Dict[str, List[Record]] = {name: [] for name in XER_COLUMNS}
+        rows: Optional[List[Record]] = None
+        wanted: Tuple[str, ...] = ()
+        positions: List[Tuple[str, int]] = []
+        
+        with open_schedule_text(source, self.encoding) as stream:
+            for line in stream:
+                marker = line[:2]
+                if marker == '%R':
+                    if rows is not None:
+                        values = line.rstrip('\r\n').split('\t')
+                        count = len(values)
+                        rows.append({name: values[i] if i < count else '' for name, i in positions})
+                elif marker == '%T':
+                    table = line[2:].strip()
+                    rows = tables.get(table)
+                    wanted = XER_COLUMNS.get(table, ())
+                elif marker == '%F' and rows is not None:
+                    fields = line.rstrip('\r\n').split('\t')
+                    # Columns absent from this export read as blank; offsets include the %R marker
+                    positions = [(name, fields.index(name)) if name in fields else (name, len(fields) + 1)
+                                 for name in wanted]
+        return tables
+    
+    def _wbs_paths(self, wbs_rows: List[Record]) -> Dict[str, str]:
+        """Dotted WBS code for every WBS node, excluding the project node itself."""
+        nodes = {row['wbs_id']: row for row in wbs_rows}
+        paths: Dict[str, str] = {}
+        
+        def path(wbs_id: str) -> str:
+            if wbs_id in paths:
+                return paths[wbs_id]
+            # Walk up iteratively; deep WBS trees would exceed the recursion limit
+            chain = []
+            node = nodes.get(wbs_id)
+            while node is not None and node['proj_node_flag'] != 'Y' and node['wbs_id'] not in paths:
+                chain.append(node)
+                node = nodes.get(node['parent_wbs_id'])
+            prefix = paths.get(node['wbs_id'], '') if node is not None else ''
+            for node in reversed(chain):
+                prefix = f"{prefix}.{node['wbs_short_name']}" if prefix else node['wbs_short_name']
+                paths[node['wbs_id']] = prefix
+            return paths.get(wbs_id, '')
+        
+        for wbs_id in nodes:
+            path(wbs_id)
+        return paths
+    
+    def _status(self, status_code: str, finish: Optional[datetime]) -> str:
+        """Map P6's status code onto MS Project's Status values."""
+        if status_code == 'TK_Complete':
+            return 'Complete'
+        if self.status_date and finish and finish < self.status_date:
+            return 'Late'
+        return 'On Schedule' if status_code == 'TK_Active' else 'Future Task'
+    
+    def _read_task(self, task: Record, day_hours: float, wbs: str) -> ScheduleLine:
+        """Convert one TASK row, with hour counts expressed in days of its calendar."""
+        actual_start = _parse_datetime(task['act_start_date'])
+        actual_finish = _parse_datetime(task['act_end_date'])
+        finish = actual_finish or _parse_datetime(task['early_end_date'])
+        total_float = _float(task['total_float_hr_cnt']) / day_hours
+        duration = _float(task['target_drtn_hr_cnt']) / day_hours
+        percent_complete = 100.0 if task['status_code'] == 'TK_Complete' else _float(task['phys_complete_pct'])
+        
+        return ScheduleLine(
+            unique_id=task['task_id'],
+            id=task['task_code'],
+            wbs_std='MLSTN' if task['task_type'] in MILESTONE_TYPES else '',
+            wbs=wbs,
+            task_name=task['task_name'],
+            percent_complete=percent_complete,
+            status=self._status(task['status_code'], finish),
+            start_date=actual_start or _parse_datetime(task['early_start_date']),
+            finish_date=finish,
+            actual_start=actual_start,
+            actual_finish=actual_finish,
+            duration=duration,
+            actual_duration=max(duration - _float(task['remain_drtn_hr_cnt']) / day_hours, 0.0)
+            if actual_start else 0.0,
+            predecessors=[],
+            successors=[],
+            unique_id_predecessors=[],
+            unique_id_successors=[],
+            constraint_type=CONSTRAINT_TYPES.get(task['cstr_type'], task['cstr_type']),
+            constraint_date=_parse_datetime(task['cstr_date']),
+            free_slack=_float(task['free_float_hr_cnt']) / day_hours,
+            total_slack=total_float,
+            critical=task['driving_path_flag'] == 'Y' or (not actual_finish and total_float <= 0),
+            predecessor_links=[],
+        )
+    
+    def read(self, source: ScheduleSource) -> Iterator[ScheduleLine]:
+        """Stream an XER file and yield one ``ScheduleLine`` per task."""
+        tables = self._read_tables(source)
+        
+        # Data date of the (first) project drives the Late status
+        for project in tables['PROJECT']:
+            self.status_date = _parse_datetime(project['last_recalc_date'])
+            if self.status_date:
+                break
+        
+        day_hours = {row['clndr_id']: _float(row['day_hr_cnt']) or DEFAULT_DAY_HOURS
+                     for row in tables['CALENDAR']}
+        wbs_paths = self._wbs_paths(tables['PROJWBS'])
+        
+        by_task_id: Dict[str, ScheduleLine] = {}
+        task_hours: Dict[str, float] = {}
+        skipped = set()
+        for task in tables['TASK']:
+            if task['task_type'] in SKIPPED_TYPES:
+                skipped.add(task['task_id'])
+                continue
+            hours = day_hours.get(task['clndr_id'], DEFAULT_DAY_HOURS)
+            by_task_id[task['task_id']] = self._read_task(task, hours, wbs_paths.get(task['wbs_id'], ''))
+            task_hours[task['task_id']] = hours
+        
+        for link in tables['TASKPRED']:
+            line = by_task_id.get(link['task_id'])
+            if line is None or link['pred_task_id'] in skipped:
+                continue
+            relation_type = PRED_TYPES.get(link['pred_type'], RelationType.FS)
+            # P6 schedules lag on the successor's calendar by default
+            lag = _float(link['lag_hr_cnt']) / task_hours[link['task_id']]
+            predecessor_uid = link['pred_task_id']
+            predecessor = by_task_id.get(predecessor_uid)
+            predecessor_id = predecessor.id if predecessor else predecessor_uid
+            
+            token = format_relationship(predecessor_id, relation_type, lag, LagUnit.DAYS)
+            line.predecessors.append(token)
+            line.unique_id_predecessors.append(format_relationship(predecessor_uid, relation_type, lag, LagUnit.DAYS))
+            line.predecessor_links.append(Relationship(predecessor_id, relation_type, lag, LagUnit.DAYS, token))
+            
+            if predecessor:
+                predecessor.successors.append(format_relationship(line.id, relation_type, lag, LagUnit.DAYS))
+                predecessor.unique_id_successors.append(
+                    format_relationship(line.unique_id, relation_type, lag, LagUnit.DAYS))
+        
+        yield from by_task_id.values()
+
+
+def read_xer(source: ScheduleSource) -> Iterator[ScheduleLine]:
+    """Stream schedule lines from a Primavera P6 XER file."""
+    return XERReader().read(source)
\ No newline at end of file
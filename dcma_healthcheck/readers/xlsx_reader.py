@@ -0,0 +1,220 @@
+"""Streaming reader for Excel (.xlsx) schedule exports."""
+import io
+import posixpath
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from ..models.field_parsers import FieldParser
+from ..models.schedule_data import ScheduleLine
+from .csv_reader import ScheduleSource, open_schedule_binary
+
+# Built-in number formats (ECMA-376 18.8.30) that display dates or percentages
+BUILTIN_DATE_FORMATS = set(range(14, 23)) | {45, 46, 47}
+BUILTIN_PERCENT_FORMATS = {9, 10}
+
+# Date/time codes in a custom format once quoted text, escapes and [colour] blocks are removed
+DATE_FORMAT_CODES = re.compile(r'[dmyhs]', re.IGNORECASE)
+FORMAT_LITERALS = re.compile(r'"[^"]*"|\\.|\[[^\]]*\]')
+
+EPOCH_1900 = datetime(1899, 12, 30)
+EPOCH_1904 = datetime(1904, 1, 1)
+
+RELATIONSHIP_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+
+@lru_cache(maxsize=256)
+def _local(tag: str) -> str:
+    """Strip the XML namespace from a tag."""
+    return tag.rsplit('}', 1)[-1]
+
+
+@lru_cache(maxsize=1024)
+def _column_letters_index(letters: str) -> int:
+    """Zero-based column of column letters such as ``AB``."""
+    index = 0
+    for char in letters:
+        index = index * 26 + ord(char) - 64
+    return index - 1
+
+
+def _column_index(reference: str) -> int:
+    """Zero-based column of a cell reference such as ``AB12``."""
+    return _column_letters_index(reference.rstrip('0123456789'))
+
+
+@contextmanager
+def _open_archive(source: ScheduleSource) -> Iterator[zipfile.ZipFile]:
+    """Open a workbook from any schedule source.
+    
+    Zip archives keep their directory at the end, so stdin and compressed
+    input are buffered in memory; plain files are read in place.
+    """
+    with open_schedule_binary(source) as binary:
+        if not (isinstance(binary, (io.BufferedReader, io.BytesIO)) and binary.seekable()):
+            binary = io.BytesIO(binary.read())
+        with zipfile.ZipFile(binary) as archive:
+            yield archive
+
+
+class XLSXReader:
+    """Read the first worksheet of a workbook as schedule lines.
+
+    The shared-strings table and the sheet are streamed with ``iterparse``;
+    each ``row`` element is converted to text cells and emptied as soon as it
+    closes, so only one row of the sheet is held at a time. Cells formatted as
+    dates are written as ISO dates and percentage cells as ``87%``, matching
+    what the tab-separated export contains.
+    """
+    
+    def __init__(self, parser: Optional[FieldParser] = None):
+        """Initialize reader with the field parser used for each row."""
+        self.parser = parser
+    
+    def _sheet_path(self, archive: zipfile.ZipFile) -> Tuple[str, datetime]:
+        """Locate the first worksheet and the workbook's date epoch."""
+        epoch = EPOCH_1900
+        first_sheet = None
+        with archive.open('xl/workbook.xml') as stream:
+            for _, elem in ET.iterparse(stream):
+                tag = _local(elem.tag)
+                if tag == 'workbookPr' and elem.get('date1904') in ('1', 'true'):
+                    epoch = EPOCH_1904
+                elif tag == 'sheet' and first_sheet is None:
+                    first_sheet = elem.get(RELATIONSHIP_NS + 'id')
+        
+        try:
+            with archive.open('xl/_rels/workbook.xml.rels') as stream:
+                for _, elem in ET.iterparse(stream):
+                    if _local(elem.tag) == 'Relationship' and elem.get('Id') == first_sheet:
+                        target = elem.get('Target')
+                        path = target.lstrip('/') if target.startswith('/') else posixpath.join('xl', target)
+                        return posixpath.normpath(path), epoch
+        except KeyError:
+            pass
+        return 'xl/worksheets/sheet1.xml', epoch
+    
+    def _shared_strings(self, archive: zipfile.ZipFile) -> List[str]:
+        """Text of every shared string, ignoring phonetic runs."""
+        strings: List[str] = []
+        try:
+            stream = archive.open('xl/sharedStrings.xml')
+        except KeyError:
+            return strings
+        
+        with stream:
+            for _, elem in ET.iterparse(stream):
+                if _local(elem.tag) == 'si':
+                    # Plain <t> or rich-text <r><t> runs; phonetic <rPh> guides are skipped
+                    strings.append(''.join(
+                        node.text or '' for child in elem if _local(child.tag) in ('t', 'r')
+                        for node in child.iter() if _local(node.tag) == 't'))
+                    elem.clear()
+        return strings
+    
+    def _number_styles(self, archive: zipfile.ZipFile) -> Tuple[Set[int], Set[int]]:
+        """Cell style indices that display numbers as dates and as percentages."""
+        date_styles: Set[int] = set()
+        percent_styles: Set[int] = set()
+        try:
+            stream = archive.open('xl/styles.xml')
+        except KeyError:
+            return date_styles, percent_styles
+        
+        custom: Dict[int, str] = {}
+        in_cell_xfs = False
+        style = 0
+        with stream:
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                tag = _local(elem.tag)
+                if tag == 'cellXfs':
+                    in_cell_xfs = event == 'start'
+                elif event == 'end' and tag == 'numFmt':
+                    custom[int(elem.get('numFmtId'))] = elem.get('formatCode', '')
+                elif event == 'end' and tag == 'xf' and in_cell_xfs:
+                    fmt_id = int(elem.get('numFmtId', 0))
+                    code = FORMAT_LITERALS.sub('', custom.get(fmt_id, ''))
+                    if fmt_id in BUILTIN_DATE_FORMATS or DATE_FORMAT_CODES.search(code):
+                        date_styles.add(style)
+                    elif fmt_id in BUILTIN_PERCENT_FORMATS or '%' in code:
+                        percent_styles.add(style)
+                    style += 1
+        return date_styles, percent_styles
+    
+    def iter_cells(self, source: ScheduleSource) -> Iterator[Tuple[int, List[str]]]:
+        """Yield ``(row_number, cell_texts)`` for each non-blank worksheet row."""
+        with _open_archive(source) as archive:
+            sheet_path, epoch = self._sheet_path(archive)
+            strings = self._shared_strings(archive)
+            date_styles, percent_styles = self._number_styles(archive)
+            
+            with archive.open(sheet_path) as stream:
+                for _, elem in ET.iterparse(stream):
+                    # Cells are handled when their row closes, keeping per-element work minimal
+                    if elem.tag[-4:] != '}row' and elem.tag != 'row':
+                        continue
+                    cells: Dict[int, str] = {}
+                    for cell in elem:
+                        # The r attribute is optional; without it cells are consecutive
+                        reference = cell.get('r')
+                        column = _column_index(reference) if reference else max(cells, default=-1) + 1
+                        cells[column] = self._cell_text(cell, strings, date_styles, percent_styles, epoch)
+                    if any(cells.values()):
+                        values = [''] * (max(cells) + 1)
+                        for column, text in cells.items():
+                            values[column] = text
+                        yield int(elem.get('r', 0)), values
+                    elem.clear()
+    
+    @staticmethod
+    def _cell_text(cell: ET.Element, strings: List[str], date_styles: Set[int],
+                   percent_styles: Set[int], epoch: datetime) -> str:
+        """Render one ``c`` element the way the tab-separated export would."""
+        cell_type = cell.get('t', 'n')
+        if cell_type == 'inlineStr':
+            return ''.join(node.text or '' for node in cell.iter() if _local(node.tag) == 't').strip()
+        
+        value = None
+        for child in cell:
+            if _local(child.tag) == 'v':
+                value = child.text or ''
+                break
+        if value is None:
+            return ''
+        
+        if cell_type == 's':
+            return strings[int(value)].strip()
+        if cell_type == 'b':
+            return 'Yes' if value == '1' else 'No'
+        if cell_type != 'n':
+            return value.strip()
+        
+        style = int(cell.get('s', 0))
+        if style in date_styles:
+            return (epoch + timedelta(days=float(value))).isoformat(' ')
+        if style in percent_styles:
+            return f"{float(value) * 100:g}%"
+        return value
+    
+    def read(self, source: ScheduleSource) -> Iterator[ScheduleLine]:
+        """Stream schedule lines, using the first non-blank row as headers."""
+        rows = self.iter_cells(source)
+        for _, header_cells in rows:
+            headers = [header.strip() for header in header_cells]
+            break
+        else:
+            return
+        
+        for row_num, values in rows:
+            try:
+                yield ScheduleLine.from_csv_with_headers(dict(zip(headers, values)), self.parser)
+            except Exception as e:
+                print(f"Error parsing row {row_num}: {e}")
+
+
+def read_xlsx(source: ScheduleSource, parser: Optional[FieldParser] = None) -> Iterator[ScheduleLine]:
+    """Stream schedule lines from the first sheet of an Excel workbook."""
+    return XLSXReader(parser).read(source)
\ No newline at end of file
@@ -0,0 +1,309 @@
+"""Streaming machine-readable exports of DCMA analysis results."""
+import csv
+import json
+import os
+import struct
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from functools import lru_cache
+from typing import IO, Any, BinaryIO, Callable, Dict, Iterator, List, Mapping, Optional, TextIO
+
+# Unsigned 32-bit array typecode ('I' is 4 bytes on every common platform)
+_U32 = 'I' if array('I').itemsize == 4 else 'L'
+
+CSV_COLUMNS = ('source', 'record', 'point', 'description', 'threshold', 'value', 'passed',
+               'failed_count', 'recommendation', 'unique_id', 'task', 'error')
+
+# Version 2 widened the point columns to uint16 for plugin points above 255
+COLUMNAR_MAGIC = b'DCMACOL2'
+# Per-schedule block: has error, number of points, number of failed tasks
+_BLOCK_HEADER = struct.Struct('<BHI')
+_LENGTH = struct.Struct('<I')
+# ``passed`` of a point (None for N/A) as stored in the columnar format, and back
+_PASSED_CODES = {False: 0, True: 1, None: 2}
+_PASSED_VALUES = (False, True, None)
+
+
+def _dumps(value: Any) -> bytes:
+    """Compact UTF-8 JSON."""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _encoder() -> Callable[[Any], bytes]:
+    """``orjson.dumps`` when it is installed, imported on first export; else ``_dumps``."""
+    try:
+        import orjson
+    except ImportError:  # optional, see the ``json`` extra
+        return _dumps
+    return orjson.dumps
+
+
+class ResultExporter(ABC):
+    """Base class of the exporters: one ``write`` per analyzed schedule.
+
+    Exporters write straight to their sink as they walk the results, so
+    memory stays flat however many schedules are exported. ``source``
+    labels the records of one schedule (typically its path).
+    """
+    
+    # Whether the sink is opened in binary mode
+    binary = False
+    
+    def __init__(self, sink: IO):
+        """Initialize the exporter on an open sink."""
+        self.sink = sink
+        self._owns_sink = False
+    
+    @classmethod
+    def open(cls, path: str) -> 'ResultExporter':
+        """Create an exporter writing to a new file at ``path``."""
+        sink = open(path, 'wb') if cls.binary else open(path, 'w', encoding='utf-8', newline='')
+        exporter = cls(sink)
+        exporter._owns_sink = True
+        return exporter
+    
+    @abstractmethod
+    def write(self, analysis_results: Mapping[str, Any], source: Optional[str] = None) -> None:
+        """Export the results of one schedule."""
+    
+    def close(self) -> None:
+        """Flush the sink, closing it if the exporter opened it."""
+        if self._owns_sink:
+            self.sink.close()
+        else:
+            self.sink.flush()
+    
+    def __enter__(self) -> 'ResultExporter':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class JSONLinesExporter(ResultExporter):
+    """JSON Lines: one record per point and one per failed activity.
+
+    Point records carry the point's fields with ``failed_tasks`` as a
+    count; each failed task follows as a ``failed_task`` record with its
+    ``unique_id`` and text. A schedule that could not be analyzed gives one
+    ``error`` record. The sink is binary. Failed-task lines are assembled from a per-point
+    prefix and the encoded strings, so no dict is built per task.
+    """
+    
+    binary = True
+    
+    def write(self, analysis_results: Mapping[str, Any], source: Optional[str] = None) -> None:
+        """Export the results of one schedule."""
+        write = self.sink.write
+        dumps = _encoder()
+        if 'error' in analysis_results:
+            write(dumps({'type': 'error', 'source': source, 'error': analysis_results['error']}) + b'\n')
+            return
+        
+        encoded_source = dumps(source)
+        for result in analysis_results['results']:
+            failed_tasks = result['failed_tasks']
+            write(dumps({
+                'type': 'point',
+                'source': source,
+                'point': result['point'],
+                'description': result['description'],
+                'threshold': result['threshold'],
+                'value': result['value'],
+                'passed': result['passed'],
+                'failed_tasks': len(failed_tasks),
+                'recommendation': result['recommendation'],
+            }) + b'\n')
+            
+            prefix = b'{"type":"failed_task","source":%s,"point":%d,"unique_id":' % (encoded_source, result['point'])
+            for unique_id, task in zip(failed_tasks.unique_ids(), failed_tasks):
+                write(prefix + dumps(unique_id) + b',"task":' + dumps(task) + b'}\n')
+
+
+class CSVExporter(ResultExporter):
+    """Flat CSV with the ``CSV_COLUMNS`` header and one row per point and per failed activity.
+
+    ``record`` is ``point``, ``failed_task`` or ``error``; columns that do
+    not apply to a record are left empty.
+    """
+    
+    def __init__(self, sink: TextIO):
+        """Initialize the exporter on a text sink (opened with ``newline=''``)."""
+        super().__init__(sink)
+        self.writer = csv.writer(sink)
+        self.writer.writerow(CSV_COLUMNS)
+    
+    def write(self, analysis_results: Mapping[str, Any], source: Optional[str] = None) -> None:
+        """Export the results of one schedule."""
+        writerow = self.writer.writerow
+        source = source or ''
+        if 'error' in analysis_results:
+            writerow((source, 'error', '', '', '', '', '', '', '', '', '', analysis_results['error']))
+            return
+        
+        for result in analysis_results['results']:
+            point = result['point']
+            failed_tasks = result['failed_tasks']
+            writerow((source, 'point', point, result['description'], result['threshold'], result['value'],
+                      result['passed'], len(failed_tasks), result['recommendation'] or '', '', '', ''))
+            for unique_id, task in zip(failed_tasks.unique_ids(), failed_tasks):
+                writerow((source, 'failed_task', point, '', '', '', '', '', '', unique_id, task, ''))
+
+
+def _pack_strings(values: List[str]) -> bytes:
+    """String column: ``n + 1`` uint32 end offsets (starting at 0) then the UTF-8 blob."""
+    offsets = array(_U32, [0])
+    blob = bytearray()
+    for value in values:
+        blob += value.encode('utf-8')
+        offsets.append(len(blob))
+    return _little_endian(offsets) + bytes(blob)
+
+
+def _little_endian(column: array) -> bytes:
+    if sys.byteorder != 'little':
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+class ColumnarExporter(ResultExporter):
+    """Compact binary columnar format for bulk loading.
+
+    The file starts with ``COLUMNAR_MAGIC`` and holds one block per
+    schedule, all little-endian::
+
+        header      uint8 has_error, uint16 points, uint32 failed tasks
+        source      uint32 length + UTF-8
+        error       uint32 length + UTF-8 (only with has_error)
+        point       uint16[points]
+        passed      uint8[points]   0 failed, 1 passed, 2 N/A
+        failed      uint32[points]  failed tasks per point
+        description, threshold, value, recommendation   string columns
+        task_point  uint16[failed tasks]
+        unique_id, task                                  string columns
+
+    A string column is ``n + 1`` uint32 end offsets followed by the UTF-8
+    bytes of its values. ``read_columnar`` reads the blocks back.
+    """
+    
+    binary = True
+    
+    def __init__(self, sink: BinaryIO):
+        """Initialize the exporter on a binary sink and write the magic."""
+        super().__init__(sink)
+        sink.write(COLUMNAR_MAGIC)
+    
+    def write(self, analysis_results: Mapping[str, Any], source: Optional[str] = None) -> None:
+        """Export the results of one schedule as one block."""
+        write = self.sink.write
+        encoded_source = (source or '').encode('utf-8')
+        if 'error' in analysis_results:
+            error = analysis_results['error'].encode('utf-8')
+            write(_BLOCK_HEADER.pack(1, 0, 0))
+            write(_LENGTH.pack(len(encoded_source)) + encoded_source)
+            write(_LENGTH.pack(len(error)) + error)
+            return
+        
+        results = analysis_results['results']
+        points = array('H', (result['point'] for result in results))
+        passed = array('B', (_PASSED_CODES[result['passed']] for result in results))
+        counts = array(_U32, (len(result['failed_tasks']) for result in results))
+        
+        write(_BLOCK_HEADER.pack(0, len(results), sum(counts)))
+        write(_LENGTH.pack(len(encoded_source)) + encoded_source)
+        write(_little_endian(points))
+        write(passed.tobytes())
+        write(_little_endian(counts))
+        for key in ('description', 'threshold', 'value'):
+            write(_pack_strings([str(result[key]) for result in results]))
+        write(_pack_strings([result['recommendation'] or '' for result in results]))
+        
+        task_points = array('H')
+        for result, count in zip(results, counts):
+            task_points.extend([result['point']] * count)
+        write(_little_endian(task_points))
+        
+        # Each failed task is formatted once, straight into both string columns
+        id_offsets, ids = array(_U32, [0]), bytearray()
+        task_offsets, tasks = array(_U32, [0]), bytearray()
+        for result in results:
+            failed_tasks = result['failed_tasks']
+            for unique_id, task in zip(failed_tasks.unique_ids(), failed_tasks):
+                ids += str(unique_id).encode('utf-8')
+                id_offsets.append(len(ids))
+                tasks += task.encode('utf-8')
+                task_offsets.append(len(tasks))
+        write(_little_endian(id_offsets) + ids)
+        write(_little_endian(task_offsets) + tasks)
+
+
+def _read_exact(file: BinaryIO, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated columnar export")
+    return data
+
+
+def _read_array(file: BinaryIO, typecode: str, count: int) -> array:
+    column = array(typecode)
+    column.frombytes(_read_exact(file, column.itemsize * count))
+    if sys.byteorder != 'little':
+        column.byteswap()
+    return column
+
+
+def _read_strings(file: BinaryIO, count: int) -> List[str]:
+    offsets = _read_array(file, _U32, count + 1)
+    blob = _read_exact(file, offsets[-1])
+    return [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(count)]
+
+
+def _read_string(file: BinaryIO) -> str:
+    length, = _LENGTH.unpack(_read_exact(file, _LENGTH.size))
+    return _read_exact(file, length).decode('utf-8')
+
+
+def read_columnar(file: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Yield each schedule block of a columnar export as a dict of columns."""
+    if file.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+        raise ValueError("Not a DCMA columnar export")
+    while True:
+        header = file.read(_BLOCK_HEADER.size)
+        if not header:
+            return
+        if len(header) != _BLOCK_HEADER.size:
+            raise ValueError("Truncated columnar export")
+        has_error, n_points, n_tasks = _BLOCK_HEADER.unpack(header)
+        block: Dict[str, Any] = {'source': _read_string(file)}
+        if has_error:
+            block['error'] = _read_string(file)
+            yield block
+            continue
+        
+        block['point'] = list(_read_array(file, 'H', n_points))
+        block['passed'] = [_PASSED_VALUES[value] for value in _read_array(file, 'B', n_points)]
+        block['failed'] = list(_read_array(file, _U32, n_points))
+        for key in ('description', 'threshold', 'value', 'recommendation'):
+            block[key] = _read_strings(file, n_points)
+        block['task_point'] = list(_read_array(file, 'H', n_tasks))
+        block['unique_id'] = _read_strings(file, n_tasks)
+        block['task'] = _read_strings(file, n_tasks)
+        yield block
+
+
+EXPORTERS = {
+    '.jsonl': JSONLinesExporter,
+    '.csv': CSVExporter,
+    '.dcmac': ColumnarExporter,
+}
+
+
+def open_exporter(path: str) -> ResultExporter:
+    """Open an exporter for ``path``, choosing the format from its extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXPORTERS:
+        raise ValueError(f"Unsupported export format '{extension}'. Expected one of {', '.join(EXPORTERS)}")
+    return EXPORTERS[extension].open(path)
\ No newline at end of file
@@ -1,28 +1,156 @@
 """PDF report generator for DCMA analysis."""
+import os
+from functools import lru_cache
+from string import Template
 from typing import Dict, Any, Optional
+from ..models.check_result import NOT_APPLICABLE, result_status
+from .pdf_writer import PDFWriter
+
+# Built-in templates; a ``<name>.txt`` file in the generator's template_dir
+# overrides one. Lines starting with '# ' are titles and '## ' headings.
+TEMPLATES = {
+    'report': (
+        "# DCMA 14-Point Schedule Quality Check Report\n"
+        "Source: $source\n"
+        "Overall Results: $passed_checks/$total_checks checks passed ($overall_pass_rate)\n"
+    ),
+    'point_passed': (
+        "## Point $point: $description - PASS\n"
+        "Threshold: $threshold\n"
+        "Actual: $value\n"
+    ),
+    'point_na': (
+        "## Point $point: $description - N/A\n"
+        "Threshold: $threshold\n"
+        "Actual: $value\n"
+    ),
+    'point_failed': (
+        "## Point $point: $description - FAIL\n"
+        "Threshold: $threshold\n"
+        "Actual: $value\n"
+        "Failed tasks: $failed_count\n"
+        "Recommendation: $recommendation\n"
+    ),
+    'appendix': (
+        "## Point $point: $description - $failed_count failed tasks\n"
+    ),
+    'executive_summary': (
+        "# DCMA Executive Summary\n"
+        "Overall Health Score: $overall_health_score\n"
+        "Checks: $passed_checks/$total_checks passed ($failed_checks failed)\n"
+        "\n"
+        "$executive_summary\n"
+        "\n"
+        "## Risk Assessment\n"
+        "$risk_assessment\n"
+    ),
+    'recommendation': (
+        "## Point $point_number: $point_name - $status\n"
+        "Threshold: $threshold\n"
+        "Actual: $actual_value\n"
+        "Priority: $priority\n"
+        "Recommendation: $recommendation\n"
+    ),
+}
+
+# Template of a point section by its status
+POINT_TEMPLATES = {'PASS': 'point_passed', 'FAIL': 'point_failed', NOT_APPLICABLE: 'point_na'}
+
+
+@lru_cache(maxsize=None)
+def _template(template_dir: Optional[str], template_name: str) -> Template:
+    """Load and compile a template once per process."""
+    if template_dir:
+        path = os.path.join(template_dir, f"{template_name}.txt")
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                return Template(file.read())
+    if template_name not in TEMPLATES:
+        raise ValueError(f"Unknown report template '{template_name}'")
+    return Template(TEMPLATES[template_name])
 
 
 class PDFReportGenerator:
     """Generate PDF reports from DCMA analysis results."""
     
     def __init__(self, template_dir: Optional[str] = None):
-        """Initialize PDF generator."""
-        # TODO: Implement PDF generator initialization
-        pass
+        """Initialize PDF generator.
+
+        ``template_dir`` holds ``<name>.txt`` files overriding the built-in
+        ``TEMPLATES``; templates are compiled once per process.
+        """
+        self.template_dir = template_dir
+    
+    def create_pdf_output(self, analysis_results: Dict[str, Any],
+                         output_path: str, source: Optional[str] = None) -> str:
+        """Create PDF output from analysis results.
+
+        Pages are written as they fill, and the failed-task appendix reads
+        each point's ``FailedTasks`` one entry at a time, so memory stays
+        bounded however many tasks failed. Returns ``output_path``.
+        """
+        if 'error' in analysis_results:
+            raise ValueError(f"Analysis failed: {analysis_results['error']}")
         
-    def create_pdf_output(self, analysis_results: Dict[str, Any], 
-                         output_path: str) -> str:
-        """Create PDF output from analysis results."""
-        # TODO: Implement PDF creation from analysis results
-        pass
+        summary = analysis_results['summary']
+        results = analysis_results['results']
+        with open(output_path, 'wb') as file:
+            writer = PDFWriter(file, title="DCMA 14-Point Schedule Quality Check Report")
+            self._render(writer, self.apply_template('report', dict(summary, source=source or '-')))
+            
+            for result in results:
+                data = dict(result, failed_count=len(result['failed_tasks']))
+                self._render(writer, self.apply_template(POINT_TEMPLATES[result_status(result)], data))
+            
+            failed = [result for result in results if result['failed_tasks']]
+            if failed:
+                writer.new_page()
+                writer.line("Appendix: Failed Tasks", 'title')
+                for result in failed:
+                    data = dict(result, failed_count=len(result['failed_tasks']))
+                    self._render(writer, self.apply_template('appendix', data))
+                    for task in result['failed_tasks']:
+                        writer.line(f"- {task}")
+                    writer.line()
+            writer.close()
+        return output_path
     
-    def generate_executive_summary(self, llm_analysis: Any, 
+    def generate_executive_summary(self, llm_analysis: Any,
                                  output_path: str) -> str:
-        """Generate executive summary PDF."""
-        # TODO: Implement executive summary PDF generation
-        pass
+        """Generate executive summary PDF.
+
+        ``llm_analysis`` is a ``DCMAAnalysisResponse`` (or a dict of the
+        same fields). Returns ``output_path``.
+        """
+        data = llm_analysis if isinstance(llm_analysis, dict) else llm_analysis.model_dump()
+        
+        with open(output_path, 'wb') as file:
+            writer = PDFWriter(file, title="DCMA Executive Summary")
+            self._render(writer, self.apply_template('executive_summary', data))
+            
+            writer.line("Recommendations", 'title')
+            for recommendation in data['recommendations']:
+                recommendation = dict(recommendation)
+                recommendation['priority'] = recommendation.get('priority') or '-'
+                recommendation['recommendation'] = recommendation.get('recommendation') or '-'
+                self._render(writer, self.apply_template('recommendation', recommendation))
+            
+            writer.line("Implementation Plan", 'title')
+            for i, step in enumerate(data['implementation_plan'], 1):
+                writer.line(f"{i}. {step}")
+            writer.close()
+        return output_path
     
     def apply_template(self, template_name: str, data: Dict[str, Any]) -> str:
         """Apply template to data."""
-        # TODO: Implement template application logic
-        pass
\ No newline at end of file
+        return _template(self.template_dir, template_name).substitute(data)
+    
+    def _render(self, writer: PDFWriter, text: str) -> None:
+        """Write templated text, mapping '# ' and '## ' lines to title and heading styles."""
+        for line in text.split("\n"):
+            if line.startswith("# "):
+                writer.line(line[2:], 'title')
+            elif line.startswith("## "):
+                writer.line(line[3:], 'heading')
+            else:
+                writer.line(line)
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""Minimal streaming PDF writer for text reports."""
+import textwrap
+import zlib
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+PAGE_WIDTH = 612   # US Letter, in points
+PAGE_HEIGHT = 792
+MARGIN = 54
+
+# Style name -> (font resource, font size, line height)
+STYLES: Dict[str, Tuple[str, float, float]] = {
+    'title': ('F2', 16, 24),
+    'heading': ('F2', 11.5, 17),
+    'body': ('F1', 9, 11.5),
+}
+FONTS = {'F1': 'Courier', 'F2': 'Helvetica-Bold'}
+
+# Characters the standard fonts' WinAnsi encoding lacks
+_SUBSTITUTES = str.maketrans({'≥': '>=', '≤': '<=', '≠': '!=', '→': '->', '…': '...'})
+
+# Fixed object numbers; pages and their content streams follow
+_CATALOG, _PAGES, _INFO, _FIRST_FONT = 1, 2, 3, 4
+
+
+def _pdf_string(text: str) -> bytes:
+    """Encode ``text`` as a PDF literal string in WinAnsi."""
+    data = text.translate(_SUBSTITUTES).encode('cp1252', errors='replace')
+    return b'(' + data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+
+class PDFWriter:
+    """Write a text document to a PDF file one page at a time.
+
+    Each page's content stream is compressed and written to ``sink`` as
+    soon as the page is full; only the byte offsets of written objects are
+    kept, so memory does not grow with the length of the document. The
+    standard Courier and Helvetica-Bold fonts are referenced, not embedded,
+    so no font files or third-party packages are needed.
+    """
+    
+    def __init__(self, sink: BinaryIO, title: Optional[str] = None):
+        """Start a document on a binary sink."""
+        self.sink = sink
+        self.title = title
+        self.offsets: Dict[int, int] = {}
+        self.page_objects: List[int] = []
+        self.next_object = _FIRST_FONT + len(FONTS)
+        self.position = 0
+        self.content: List[bytes] = []
+        self.y = PAGE_HEIGHT - MARGIN
+        
+        self._write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        for number, (resource, name) in enumerate(FONTS.items(), _FIRST_FONT):
+            self._object(number, b'<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>'
+                         % name.encode('ascii'))
+    
+    def _write(self, data: bytes) -> None:
+        self.sink.write(data)
+        self.position += len(data)
+    
+    def _object(self, number: int, body: bytes) -> None:
+        self.offsets[number] = self.position
+        self._write(b'%d 0 obj\n' % number + body + b'\nendobj\n')
+    
+    def _allocate(self) -> int:
+        number = self.next_object
+        self.next_object += 1
+        return number
+    
+    def line(self, text: str = '', style: str = 'body') -> None:
+        """Add ``text`` in ``style``, wrapped to the page width; an empty line leaves a gap."""
+        resource, size, leading = STYLES[style]
+        width = int((PAGE_WIDTH - 2 * MARGIN) / (0.6 * size))
+        chunks = [text] if len(text) <= width else textwrap.wrap(text, width, subsequent_indent='  ') or ['']
+        for chunk in chunks:
+            if self.y - leading < MARGIN:
+                self.new_page()
+            self.y -= leading
+            if chunk:
+                self.content.append(b'BT /%s %g Tf %d %.2f Td %s Tj ET\n'
+                                    % (resource.encode('ascii'), size, MARGIN, self.y, _pdf_string(chunk)))
+    
+    def new_page(self) -> None:
+        """Finish the current page, if it has content, and write it out."""
+        if not self.content:
+            self.y = PAGE_HEIGHT - MARGIN
+            return
+        page_number = len(self.page_objects) + 1
+        footer = f"{self.title} - page {page_number}" if self.title else f"Page {page_number}"
+        self.content.append(b'BT /F1 8 Tf %d %d Td %s Tj ET\n' % (MARGIN, MARGIN // 2, _pdf_string(footer)))
+        
+        stream = zlib.compress(b''.join(self.content))
+        self.content = []
+        self.y = PAGE_HEIGHT - MARGIN
+        
+        content_object = self._allocate()
+        self._object(content_object, b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(stream)
+                     + stream + b'\nendstream')
+        page_object = self._allocate()
+        fonts = b' '.join(b'/%s %d 0 R' % (resource.encode('ascii'), number)
+                          for number, resource in enumerate(FONTS, _FIRST_FONT))
+        self._object(page_object, b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] '
+                     b'/Resources << /Font << %s >> >> /Contents %d 0 R >>'
+                     % (_PAGES, PAGE_WIDTH, PAGE_HEIGHT, fonts, content_object))
+        self.page_objects.append(page_object)
+    
+    def close(self) -> None:
+        """Write the last page, the page tree and the cross-reference table."""
+        self.new_page()
+        if not self.page_objects:
+            # A PDF needs at least one page
+            self.content.append(b'\n')
+            self.new_page()
+        
+        kids = b' '.join(b'%d 0 R' % number for number in self.page_objects)
+        self._object(_PAGES, b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(self.page_objects)))
+        self._object(_CATALOG, b'<< /Type /Catalog /Pages %d 0 R >>' % _PAGES)
+        info = b'/Producer (dcma-healthcheck)'
+        if self.title:
+            info += b' /Title ' + _pdf_string(self.title)
+        self._object(_INFO, b'<< %s >>' % info)
+        
+        xref_position = self.position
+        size = self.next_object
+        entries = [b'0000000000 65535 f \n']
+        entries.extend(b'%010d 00000 n \n' % self.offsets[number] for number in range(1, size))
+        self._write(b'xref\n0 %d\n' % size + b''.join(entries))
+        self._write(b'trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                    % (size, _CATALOG, _INFO, xref_position))
\ No newline at end of file
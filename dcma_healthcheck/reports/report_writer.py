@@ -0,0 +1,133 @@
+"""Streaming text report writer for DCMA analysis results."""
+from typing import Any, Dict, Iterable, Mapping, Optional, TextIO, Union
+from ..models.check_result import result_status
+
+# A cap for every point, or caps by point number (points not listed are uncapped)
+FailureCap = Union[int, Mapping[int, int], None]
+
+TITLE = "DCMA 14-Point Schedule Quality Check Report"
+
+
+def overall_line(passed_checks: int, total_checks: int) -> str:
+    """The 'Overall Results' line, as ``DCMAAnalyzer.summarize`` rates it."""
+    pass_rate = f"{(passed_checks / total_checks) * 100:.1f}%" if total_checks > 0 else "0%"
+    return f"Overall Results: {passed_checks}/{total_checks} checks passed ({pass_rate})"
+
+
+class ReportWriter:
+    """Write the text report section by section to a text sink.
+
+    Nothing is collected in memory: every line goes to ``sink`` (a file,
+    ``sys.stdout``, a socket's ``makefile('w')``, ...) as soon as it is
+    formed and the sink is flushed after each section, so output starts
+    with the first point. Failed tasks are read one at a time from their
+    ``FailedTasks``; ``max_failed`` caps how many are listed, either for
+    every point or per point number, keeping the most severe ones.
+
+    ``write`` produces the same text ``DCMAAnalyzer.generate_report``
+    returns, followed by a newline. To report results while they are
+    still being computed, call ``begin``, ``write_result`` for each point
+    and ``end``; with ``summary_first=False`` the overall line then comes
+    last, counted from the points written.
+    """
+    
+    def __init__(self, sink: TextIO, max_failed: FailureCap = None, summary_first: bool = True):
+        """Initialize the writer for one report."""
+        self.sink = sink
+        self.max_failed = max_failed
+        self.summary_first = summary_first
+        self.total_checks = 0
+        self.passed_checks = 0
+    
+    def _line(self, text: str = "") -> None:
+        self.sink.write(text)
+        self.sink.write("\n")
+    
+    def _flush(self) -> None:
+        flush = getattr(self.sink, 'flush', None)
+        if flush is not None:
+            flush()
+    
+    def cap(self, point: int) -> Optional[int]:
+        """Number of failed tasks listed for ``point``; None lists all."""
+        if isinstance(self.max_failed, Mapping):
+            return self.max_failed.get(point)
+        return self.max_failed
+    
+    def write(self, analysis_results: Dict[str, Any]) -> None:
+        """Write the whole report for an analysis result."""
+        if 'error' in analysis_results:
+            self._line(f"Error: {analysis_results['error']}")
+            self._flush()
+            return
+        
+        self.begin(analysis_results['summary'])
+        for result in analysis_results['results']:
+            self.write_result(result)
+        self.end(analysis_results.get('critical_path'), analysis_results.get('network'))
+    
+    def begin(self, summary: Optional[Dict[str, Any]] = None) -> None:
+        """Write the title and, in the summary-first layout, the overall results."""
+        self._line(TITLE)
+        self._line("=" * 50)
+        if self.summary_first:
+            if summary is None:
+                raise ValueError("The summary-first layout needs the summary up front")
+            self._line(overall_line(summary['passed_checks'], summary['total_checks']))
+            self._line()
+        self._flush()
+    
+    def write_result(self, result: Mapping[str, Any]) -> None:
+        """Write the section of one point."""
+        self.total_checks += result['passed'] is not None
+        self.passed_checks += bool(result['passed'])
+        
+        self._line(f"Point {result['point']}: {result['description']} - {result_status(result)}")
+        self._line(f"  Threshold: {result['threshold']}")
+        self._line(f"  Actual: {result['value']}")
+        
+        if result['passed'] is False:
+            self._line(f"  Recommendation: {result['recommendation']}")
+            failed_tasks = result['failed_tasks']
+            if failed_tasks:
+                self._line("  Failed Tasks:")
+                cap = self.cap(result['point'])
+                shown: Iterable[str] = failed_tasks if cap is None else failed_tasks.top(cap)
+                listed = 0
+                for task in shown:
+                    self._line(f"    - {task}")
+                    listed += 1
+                if listed < len(failed_tasks):
+                    self._line(f"    ... and {len(failed_tasks) - listed} more")
+        self._line()
+        self._flush()
+    
+    def end(self, critical_path: Optional[Dict[str, Any]] = None,
+            network: Optional[Dict[str, Any]] = None) -> None:
+        """Write the computed-float and network sections and, if not written yet, the overall results."""
+        if not self.summary_first:
+            self._line(overall_line(self.passed_checks, self.total_checks))
+            self._line()
+        
+        if critical_path is not None:
+            self._line(f"Critical Path (computed float): {critical_path['duration']:g} working days, "
+                       f"{critical_path['critical']} critical activities")
+            if critical_path['unscheduled']:
+                self._line(f"  Not scheduled (in or after a logic loop): {len(critical_path['unscheduled'])}")
+            self._line()
+        
+        if network is not None:
+            status = "PASS" if network['passed'] else "FAIL"
+            self._line(f"Network Integrity: {network['nodes']} activities, {network['links']} links - {status}")
+            sections = [('Circular logic', 'cycles'), ('Links to missing activities', 'dangling_links')]
+            if network['links_checked']:
+                sections.append(('One-sided links', 'one_sided_links'))
+            for title, key in sections:
+                samples = network['samples'][key]
+                self._line(f"  {title}: {network[key]}")
+                for finding in samples:
+                    self._line(f"    - {finding}")
+                if len(samples) < network[key]:
+                    self._line(f"    ... and {network[key] - len(samples)} more")
+            self._line()
+        self._flush()
\ No newline at end of file
@@ -1,17 +1,5 @@
 """Main script to demonstrate DCMA schedule analysis."""
-from dcma_healthcheck.analyzers.dcma_analyzer import DCMAAnalyzer
-
-
-def main():
-    """Run DCMA analysis on sample schedule."""
-    analyzer = DCMAAnalyzer()
-    
-    # Analyze the sample schedule
-    results = analyzer.process_csv_file('sample_with_headers.csv', has_headers=True)
-    
-    # Generate and print report
-    report = analyzer.generate_report(results)
-    print(report)
+from dcma_healthcheck.main import main
 
 
 if __name__ == "__main__":
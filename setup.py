@@ -4,7 +4,7 @@ from setuptools import setup, find_packages
 setup(
     name="dcma-healthcheck",
     version="0.1.0",
-    description="DCMA 11-point schedule quality analysis tool",
+    description="DCMA 14-point schedule quality analysis tool",
     packages=find_packages(),
     python_requires=">=3.8",
     install_requires=[
@@ -12,6 +12,12 @@ setup(
         "openai>=1.0.0",
     ],
     extras_require={
+        "fast": [
+            "numpy>=1.21.0",
+        ],
+        "json": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=22.0.0",
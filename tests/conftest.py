@@ -0,0 +1,81 @@
+"""Shared fixtures: a small synthetic schedule that fails every DCMA point somewhere."""
+import random
+from datetime import date, timedelta
+import pytest
+from dcma_healthcheck.readers.csv_reader import read_schedule
+
+HEADER = ['Unique ID', 'ID', 'WBS STD', 'WBS', 'Task Name', '% Complete', 'Status', 'Start', 'Finish',
+          'Actual Start', 'Actual Finish', 'Duration', 'Actual Duration', 'Predecessors', 'Successors',
+          'Unique ID Predecessors', 'Unique ID Successors', 'Constraint Type', 'Constraint Date',
+          'Free Slack', 'Total Slack', 'Critical']
+
+CONSTRAINTS = ['As Soon As Possible', 'Must Start On', 'Start No Earlier Than', 'Must Finish On',
+               'As Late As Possible']
+
+
+def export_date(day: date) -> str:
+    """A date as MS Project exports it, e.g. ``Tue 2/1/22``."""
+    return f"{day:%a} {day.month}/{day.day}/{day.year % 100:02d}"
+
+
+def schedule_text(count: int = 300, seed: int = 7) -> str:
+    """Tab-separated export of a random schedule of ``count`` tasks.
+
+    Dates lie around today, so forecasts in the past and actuals in the
+    future occur; links carry every relationship type and day lags of
+    both signs, and the last task is the completion milestone.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    unique_ids = [str(1000 + 3 * i) for i in range(count)]
+    predecessors = [[] for _ in range(count)]
+    successors = [[] for _ in range(count)]
+    for i in range(1, count):
+        for _ in range(rng.choice([0, 1, 1, 2])):
+            j = rng.randrange(max(0, i - 20), i)
+            link_type = rng.choices(['', 'FS', 'SS', 'FF', 'SF'], [60, 10, 10, 10, 3])[0]
+            lag = f"{rng.choice('+-')}{rng.randint(1, 5)} days" if rng.random() < 0.15 else ''
+            token = (link_type or ('FS' if lag else '')) + lag
+            predecessors[i].append((j, token))
+            successors[j].append((i, token))
+    
+    rows = ['\t'.join(HEADER)]
+    for i in range(count):
+        start = today + timedelta(days=rng.randint(-200, 200))
+        duration = rng.choice([0, 1, 5, 10, 20, 30, 60])
+        finish = start + timedelta(days=duration)
+        complete = rng.choice([0, 0, 50, 100])
+        actual_start = export_date(start) if complete else 'NA'
+        if rng.random() < 0.03:
+            actual_start = export_date(today + timedelta(days=30))
+        constraint = rng.choices(CONSTRAINTS, [85, 4, 6, 2, 3])[0]
+        slack = rng.choice([0, 0, 5, 10, 50, -5])
+        wbs_std = 'CMPLT' if i == count - 1 else rng.choices(['TASK', 'START', 'MLSTN'], [90, 2, 8])[0]
+        rows.append('\t'.join([
+            unique_ids[i], str(i + 1), wbs_std, f"1.{i // 50}.{i % 50}", f"Task {i}", f"{complete}%",
+            'Complete' if complete == 100 else rng.choice(['Late', 'On Schedule', 'Future Task']),
+            export_date(start), export_date(finish), actual_start,
+            export_date(finish) if complete == 100 else 'NA',
+            f"{duration} days", f"{duration * complete / 100:g} days",
+            ','.join(f"{j + 1}{token}" for j, token in predecessors[i]),
+            ','.join(f"{j + 1}{token}" for j, token in successors[i]),
+            ','.join(f"{unique_ids[j]}{token}" for j, token in predecessors[i]),
+            ','.join(f"{unique_ids[j]}{token}" for j, token in successors[i]),
+            constraint, export_date(start) if constraint != 'As Soon As Possible' else 'NA',
+            f"{max(slack, 0)} days", f"{slack} days", 'Yes' if slack <= 0 else 'No',
+        ]))
+    return '\n'.join(rows) + '\n'
+
+
+@pytest.fixture
+def schedule_file(tmp_path):
+    """Path of the synthetic schedule written as a tab-separated export."""
+    path = tmp_path / 'schedule.csv'
+    path.write_text(schedule_text(), encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture
+def schedule_lines(schedule_file):
+    """The synthetic schedule parsed into ``ScheduleLine`` objects."""
+    return list(read_schedule(schedule_file))
\ No newline at end of file
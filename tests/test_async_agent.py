@@ -0,0 +1,125 @@
+"""Async agent: schedules and requests stay within their concurrency caps."""
+import asyncio
+import re
+from types import SimpleNamespace
+import shutil
+import pytest
+
+pytest.importorskip('openai')
+pytest.importorskip('pydantic')
+from dcma_healthcheck.agents.async_agent import AsyncDCMAAgent  # noqa: E402
+from dcma_healthcheck.models.dcma_models import (  # noqa: E402
+    DCMAAnalysisResponse, DCMAPointAnalysis, DCMARecommendation,
+)
+
+ANSWER = DCMAAnalysisResponse(
+    executive_summary="Logic is incomplete.", overall_health_score="62%", total_checks=12, passed_checks=8,
+    failed_checks=4, recommendations=[], implementation_plan=["Link open ends"],
+    risk_assessment="Finish date at risk.")
+
+
+class FakeClient:
+    """Stand-in for ``AsyncOpenAI`` that records how many requests overlap."""
+    
+    def __init__(self, answer=lambda messages, response_format: ANSWER, delay=0.01):
+        self.answer = answer
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.requests = 0
+        self.beta = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(parse=self.parse)))
+    
+    async def parse(self, model, messages, response_format, **kwargs):
+        self.requests += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            parsed = self.answer(messages, response_format)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(parsed=parsed))])
+    
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    
+    def make(client=None, **kwargs):
+        agent = AsyncDCMAAgent(**kwargs)
+        agent.client = client or FakeClient()
+        return agent
+    return make
+
+
+@pytest.fixture
+def schedule_files(schedule_file, tmp_path):
+    paths = [str(tmp_path / f'copy{number}.csv') for number in range(6)]
+    for path in paths:
+        shutil.copyfile(schedule_file, path)
+    return paths
+
+
+def interpret_all(agent, paths, **kwargs):
+    async def run():
+        async with agent:
+            return [item async for item in agent.interpret_many(paths, **kwargs)]
+    return dict(asyncio.run(run()))
+
+
+def test_interpret_many_caps_concurrent_schedules(agent, schedule_files):
+    client = FakeClient()
+    results = interpret_all(agent(client, max_concurrency=2), schedule_files)
+    assert set(results) == set(schedule_files)
+    assert all(response == ANSWER for response in results.values())
+    assert client.requests == len(schedule_files)
+    assert client.peak == 2
+
+
+def test_failures_stay_with_their_schedule(agent, schedule_files, tmp_path):
+    missing = str(tmp_path / 'missing.csv')
+    results = interpret_all(agent(max_concurrency=3), schedule_files[:2] + [missing])
+    assert 'error' in results[missing]
+    assert results[schedule_files[0]] == results[schedule_files[1]] == ANSWER
+
+
+def point_answer(messages, response_format):
+    """Per-point answer naming its point; point 1 fails for good."""
+    point = int(re.search(r'DCMA Point (\d+):', messages[-1]['content']).group(1))
+    if point == 1:
+        raise ValueError("invalid request")
+    recommendation = DCMARecommendation(point_number=0, point_name="?", status="?", threshold="?",
+                                        actual_value="?", recommendation=f"Fix point {point}.", priority="HIGH")
+    return DCMAPointAnalysis(recommendation=recommendation, implementation_steps=[f"Step for {point}"],
+                             risk_assessment=f"Risk of {point}.")
+
+
+def test_analyze_by_point_caps_requests_in_flight(agent, schedule_file):
+    client = FakeClient(point_answer)
+    by_point = agent(client, max_concurrency=1, max_requests=3)
+    response = asyncio.run(by_point.analyze_by_point(schedule_file))
+    failed = [recommendation for recommendation in response.recommendations if recommendation.status == 'FAIL']
+    assert client.requests == len(failed) > 3
+    assert client.peak == 3
+    
+    # The failed request falls back to the standard guidance, the others keep their answers
+    assert [recommendation.point_number for recommendation in failed if recommendation.fallback] == [1]
+    assert all(recommendation.recommendation == f"Fix point {recommendation.point_number}."
+               for recommendation in failed if not recommendation.fallback)
+    assert "No model answer for Point 1" in response.risk_assessment
+
+
+def test_request_cap_defaults_to_schedule_cap(agent, schedule_files):
+    client = FakeClient(point_answer)
+    interpret_all(agent(client, max_concurrency=2), schedule_files[:3], by_point=True)
+    assert client.peak == 2
+
+
+def test_rejects_invalid_limits(agent):
+    with pytest.raises(ValueError, match='max_concurrency'):
+        agent(max_concurrency=0)
+    with pytest.raises(ValueError, match='max_requests'):
+        agent(max_requests=0)
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""Lazy failed-task lists: formatting on access, top-N ranking and pages."""
+from datetime import date
+import pytest
+from dcma_healthcheck.models.check_result import CheckResult, FailedTasks, result_status
+
+TEMPLATE = "{0}: {1} ({2} days)"
+
+ENTRIES = [('10', 'Dig', 50.0), ('11', 'Pour', 90.0), ('12', 'Cure', 50.0), ('13', 'Frame', 120.0),
+           ('14', 'Roof', 45.0)]
+
+
+class Counted:
+    """A value that counts how often it is formatted."""
+    
+    formatted = 0
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def __format__(self, spec):
+        Counted.formatted += 1
+        return format(self.value, spec)
+
+
+def test_entries_format_on_access():
+    failed = FailedTasks(TEMPLATE, list(ENTRIES), severity=(2, 1))
+    assert len(failed) == 5
+    assert failed[0] == "10: Dig (50.0 days)"
+    assert failed[-1] == "14: Roof (45.0 days)"
+    assert failed[1:3] == ["11: Pour (90.0 days)", "12: Cure (50.0 days)"]
+    assert failed == [TEMPLATE.format(*entry) for entry in ENTRIES]
+    assert list(failed.unique_ids()) == ['10', '11', '12', '13', '14']
+    with pytest.raises(IndexError):
+        failed[5]
+
+
+def test_top_ranks_by_severity_keeping_schedule_order_on_ties():
+    failed = FailedTasks(TEMPLATE, list(ENTRIES), severity=(2, 1))
+    assert failed.top(3) == ["13: Frame (120.0 days)", "11: Pour (90.0 days)", "10: Dig (50.0 days)"]
+    assert failed.top(4)[3] == "12: Cure (50.0 days)"
+    assert failed.top(10) == failed.top(5)
+    
+    # Smaller values are worse, e.g. the earliest of invalid dates
+    dates = FailedTasks("{0}: {1}", [('1', date(2024, 3, 1)), ('2', date(2024, 1, 1)), ('3', date(2024, 2, 1))],
+                        severity=(1, -1))
+    assert dates.top(2) == ["2: 2024-01-01", "3: 2024-02-01"]
+    
+    # Without a severity the first entries are kept
+    assert FailedTasks(TEMPLATE, list(ENTRIES)).top(2) == failed[:2]
+
+
+def test_top_formats_only_the_selected_entries():
+    failed = FailedTasks(TEMPLATE, [(str(i), Counted(f"Task {i}"), i % 97) for i in range(1000)], severity=(2, 1))
+    Counted.formatted = 0
+    assert len(failed.top(5)) == 5
+    assert Counted.formatted == 5
+
+
+def test_pages():
+    failed = FailedTasks(TEMPLATE, list(ENTRIES))
+    assert failed.page_count(2) == 3
+    assert failed.page(0, 2) == failed[:2]
+    assert failed.page(2, 2) == [failed[4]]
+    assert failed.page(3, 2) == []
+    assert FailedTasks().page_count() == 0
+
+
+def test_columns_read_like_entries():
+    np = pytest.importorskip('numpy')
+    unique_ids, names, days = zip(*ENTRIES)
+    columns = FailedTasks(TEMPLATE, columns=(np.array(unique_ids), np.array(names), list(days)), severity=(2, 1))
+    entries = FailedTasks(TEMPLATE, list(ENTRIES), severity=(2, 1))
+    assert columns == entries
+    assert columns.top(3) == entries.top(3)
+    assert list(columns.unique_ids()) == list(entries.unique_ids())
+
+
+def test_check_result_reads_as_a_dict():
+    result = CheckResult(9, "High Duration", "≤ 5%", "100.0%", False,
+                         FailedTasks(TEMPLATE, list(ENTRIES)), "Break long tasks up.")
+    assert result['passed'] is False and result_status(result) == 'FAIL'
+    assert set(result) == set(CheckResult.KEYS)
+    with pytest.raises(KeyError):
+        result['missing']
+    plain = result.to_dict()
+    assert type(plain['failed_tasks']) is list and plain['failed_tasks'] == list(result['failed_tasks'])
+    assert result_status(dict(plain, passed=None)) == 'N/A'
\ No newline at end of file
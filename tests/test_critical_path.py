@@ -0,0 +1,102 @@
+"""CPM passes on hand-checked networks, with and without NumPy."""
+import math
+import random
+import sys
+import time
+from datetime import date
+import pytest
+from dcma_healthcheck.analyzers.critical_path import CriticalPath
+
+# Seconds the vectorized passes may take for a schedule of about 200k links
+SCALE_BUDGET_S = 10.0
+
+ASAP = 'As Soon As Possible'
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def engine(request, monkeypatch):
+    """Run the test once vectorized and once on the pure-Python fallback."""
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+    return request.param
+
+
+def schedule(tasks, project_start=None):
+    """``CriticalPath`` of ``(unique_id, duration, predecessor tokens[, constraint, date])`` tuples."""
+    return CriticalPath.compute([(unique_id, duration, tokens, *(constraint or (ASAP, None)))
+                                 for unique_id, duration, tokens, *constraint in tasks], project_start)
+
+
+def column(critical_path, name):
+    return {unique_id: getattr(critical_path, name)[node] for node, unique_id in enumerate(critical_path.ids)}
+
+
+def test_relationship_types_with_lags(engine):
+    critical_path = schedule([
+        ('1', 5.0, []),
+        ('2', 3.0, ['1FS+2 days']),
+        ('3', 4.0, ['1SS+1 days']),
+        ('4', 2.0, ['3FF+3 days']),
+        ('5', 6.0, ['2SF+1 days']),
+        ('6', 0.0, ['2', '4', '5']),
+    ])
+    assert column(critical_path, 'early_start') == {'1': 0, '2': 7, '3': 1, '4': 6, '5': 2, '6': 10}
+    assert column(critical_path, 'late_start') == {'1': 0, '2': 7, '3': 3, '4': 8, '5': 4, '6': 10}
+    assert column(critical_path, 'total_float') == {'1': 0, '2': 0, '3': 2, '4': 2, '5': 2, '6': 0}
+    assert column(critical_path, 'free_float') == {'1': 0, '2': 0, '3': 0, '4': 2, '5': 2, '6': 0}
+    assert critical_path.project_finish == 10
+    assert critical_path.critical == ['1', '2', '6']
+
+
+def test_constraints_bound_both_passes(engine):
+    # 2024-01-01 is a Monday; offsets count working days from it
+    critical_path = schedule([
+        ('1', 5.0, []),
+        ('2', 5.0, ['1'], 'Start No Earlier Than', date(2024, 1, 15)),
+        ('3', 5.0, ['2'], 'Finish No Later Than', date(2024, 1, 19)),
+        ('4', 2.0, [], 'Must Start On', date(2024, 1, 3)),
+    ], project_start=date(2024, 1, 1))
+    assert column(critical_path, 'early_start') == {'1': 0, '2': 10, '3': 15, '4': 2}
+    assert column(critical_path, 'total_float') == {'1': 0, '2': -5, '3': -5, '4': 0}
+    assert critical_path.project_finish == 20
+
+
+def test_loops_are_unscheduled(engine):
+    critical_path = schedule([
+        ('1', 1.0, ['3']),
+        ('2', 1.0, ['1']),
+        ('3', 1.0, ['2']),
+        ('4', 1.0, ['3']),
+        ('5', 2.0, []),
+    ])
+    assert critical_path.unscheduled == ['1', '2', '3', '4']
+    assert all(math.isnan(critical_path.total_float[node]) for node in range(4))
+    assert critical_path.activity('5')['total_float'] == 0
+    assert critical_path.project_finish == 2
+
+
+def test_vectorized_matches_fallback(schedule_lines, monkeypatch):
+    pytest.importorskip('numpy')
+    expected = CriticalPath.from_lines(schedule_lines)
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    fallback = CriticalPath.from_lines(schedule_lines)
+    assert fallback.unscheduled == expected.unscheduled
+    for name in ('early_start', 'early_finish', 'late_start', 'late_finish', 'total_float', 'free_float'):
+        assert getattr(fallback, name).tobytes() == getattr(expected, name).tobytes(), name
+
+
+def test_scale():
+    pytest.importorskip('numpy')
+    rng = random.Random(1)
+    tasks = [('0', 5.0, [])]
+    for task in range(1, 100000):
+        tokens = [f"{rng.randrange(max(0, task - 2000), task)}{rng.choice(['', '', 'SS', 'FF', 'SF+2 days'])}"
+                  for _ in range(rng.choice([1, 2, 2, 3]))]
+        tasks.append((str(task), float(rng.choice([0, 1, 5, 10, 20])), tokens))
+    started = time.perf_counter()
+    critical_path = schedule(tasks)
+    elapsed = time.perf_counter() - started
+    assert not critical_path.unscheduled and critical_path.critical
+    assert elapsed <= SCALE_BUDGET_S, f"scheduling {len(tasks)} activities took {elapsed:.1f} s"
\ No newline at end of file
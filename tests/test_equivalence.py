@@ -0,0 +1,85 @@
+"""Every evaluation path gives the same results as running the checkers one by one."""
+import dataclasses
+import random
+import pytest
+from dcma_healthcheck.analyzers import sharded
+from dcma_healthcheck.analyzers.check_engine import CheckEngine, supports_accumulate
+from dcma_healthcheck.analyzers.dcma_analyzer import DCMAAnalyzer
+
+
+@pytest.fixture
+def analyzer():
+    return DCMAAnalyzer(check_network=True)
+
+
+def test_schedule_fails_every_point(analyzer, schedule_lines):
+    # Otherwise the comparisons below would only cover passing results
+    results = analyzer.analyze_schedule(schedule_lines, fused=False)['results']
+    failing = {result['point'] for result in results if result['failed_tasks']}
+    assert failing >= set(range(1, 12))
+
+
+def test_fused_matches_list(analyzer, schedule_file, schedule_lines):
+    expected = analyzer.analyze_schedule(schedule_lines, fused=False)
+    assert analyzer.analyze_schedule(schedule_lines) == expected
+    assert analyzer.analyze_schedule(iter(schedule_lines)) == expected
+    assert analyzer.process_csv_file(schedule_file) == expected
+
+
+def test_default_path_streams(analyzer, schedule_file, monkeypatch):
+    # Every registered checker accumulates, so no rows are collected for ``check``
+    assert all(supports_accumulate(checker) for checker in analyzer.checkers)
+    kept = []
+    feed = CheckEngine.feed
+    monkeypatch.setattr(CheckEngine, 'feed', lambda self, *args: kept.append(feed(self, *args)) or kept[-1])
+    analyzer.process_csv_file(schedule_file)
+    assert kept == [[]]
+
+
+def test_vectorized_matches_list(analyzer, schedule_lines):
+    pytest.importorskip('numpy')
+    from dcma_healthcheck.models.schedule_table import ScheduleTable
+    assert analyzer.analyze_table(ScheduleTable.from_lines(schedule_lines)) == analyzer.analyze_schedule(schedule_lines)
+
+
+def test_vectorized_computed_float_matches_list(schedule_lines):
+    pytest.importorskip('numpy')
+    from dcma_healthcheck.models.schedule_table import ScheduleTable
+    analyzer = DCMAAnalyzer(computed_float=True)
+    assert analyzer.analyze_table(ScheduleTable.from_lines(schedule_lines)) == analyzer.analyze_schedule(schedule_lines)
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_sharded_matches_list(analyzer, schedule_file, workers, monkeypatch):
+    # Small shards, so the test schedule is really split and merged
+    monkeypatch.setattr(sharded, 'MIN_SHARD_BYTES', 4096)
+    expected = analyzer.process_csv_file(schedule_file)
+    assert analyzer.process_csv_file_sharded(schedule_file, workers=workers) == expected
+
+
+def test_incremental_matches_list(analyzer, schedule_lines):
+    rng = random.Random(3)
+    current = schedule_lines[:200]
+    session = analyzer.start_session(current)
+    assert session.results() == analyzer.analyze_schedule(current)
+    
+    for step in range(3):
+        changed = [dataclasses.replace(line, total_slack=float(rng.randint(-5, 60)),
+                                       constraint_type=rng.choice(['Must Start On', 'As Soon As Possible']))
+                   for line in rng.sample(current, 10)]
+        session.upsert(changed)
+        replaced = {line.unique_id: line for line in changed}
+        current = [replaced.get(line.unique_id, line) for line in current]
+        
+        deleted = {line.unique_id for line in rng.sample(current, 5)}
+        session.delete(deleted)
+        current = [line for line in current if line.unique_id not in deleted]
+        
+        added = schedule_lines[200 + 20 * step:220 + 20 * step]
+        session.upsert(added)
+        current += added
+        assert session.results() == analyzer.analyze_schedule(current), step
+        
+        rng.shuffle(current)
+        session.apply(current)
+        assert session.results() == analyzer.analyze_schedule(current), step
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""Machine-readable exports and the columnar round trip."""
+import csv
+import io
+import json
+import pytest
+from dcma_healthcheck.analyzers.dcma_analyzer import DCMAAnalyzer
+from dcma_healthcheck.models.check_result import CheckResult, FailedTasks
+from dcma_healthcheck.reports import exporters
+from dcma_healthcheck.reports.exporters import (CSV_COLUMNS, ColumnarExporter, CSVExporter, JSONLinesExporter,
+                                                open_exporter, read_columnar)
+
+ERROR = {'error': "File not found: missing.csv"}
+
+
+@pytest.fixture
+def analysis(schedule_lines):
+    return DCMAAnalyzer().analyze_schedule(schedule_lines)
+
+
+def failures(analysis):
+    """``(point, unique_id, text)`` of every failed task, in export order."""
+    return [(result['point'], unique_id, task) for result in analysis['results']
+            for unique_id, task in zip(result['failed_tasks'].unique_ids(), result['failed_tasks'])]
+
+
+@pytest.mark.parametrize('encoder', ['default', 'json'])
+def test_json_lines(analysis, encoder, monkeypatch):
+    if encoder == 'json':
+        monkeypatch.setattr(exporters, '_encoder', lambda: exporters._dumps)
+    sink = io.BytesIO()
+    exporter = JSONLinesExporter(sink)
+    exporter.write(analysis, 'plan.csv')
+    exporter.write(ERROR, 'missing.csv')
+    records = [json.loads(line) for line in sink.getvalue().decode('utf-8').splitlines()]
+    
+    points = [record for record in records if record['type'] == 'point']
+    assert [(record['point'], record['passed'], record['failed_tasks']) for record in points] == [
+        (result['point'], result['passed'], len(result['failed_tasks'])) for result in analysis['results']]
+    assert [(record['point'], record['unique_id'], record['task']) for record in records
+            if record['type'] == 'failed_task'] == failures(analysis)
+    assert all(record['source'] == 'plan.csv' for record in records[:-1])
+    assert records[-1] == {'type': 'error', 'source': 'missing.csv', 'error': ERROR['error']}
+
+
+def test_csv(analysis):
+    sink = io.StringIO(newline='')
+    exporter = CSVExporter(sink)
+    exporter.write(analysis, 'plan.csv')
+    exporter.write(ERROR, 'missing.csv')
+    sink.seek(0)
+    reader = csv.DictReader(sink)
+    assert tuple(reader.fieldnames) == CSV_COLUMNS
+    rows = list(reader)
+    
+    points = [row for row in rows if row['record'] == 'point']
+    assert [(int(row['point']), int(row['failed_count'])) for row in points] == [
+        (result['point'], len(result['failed_tasks'])) for result in analysis['results']]
+    assert [(int(row['point']), row['unique_id'], row['task']) for row in rows
+            if row['record'] == 'failed_task'] == failures(analysis)
+    assert rows[-1]['record'] == 'error' and rows[-1]['error'] == ERROR['error']
+
+
+def test_columnar_round_trip(analysis):
+    # A plugin point above 255 needs the uint16 point columns
+    plugin = CheckResult(300, "Plugin check", "none", "2", False,
+                         FailedTasks("{0}: {1}", [('7', 'Ünïcode task'), ('8', 'Other')]), None)
+    second = dict(analysis, results=list(analysis['results']) + [plugin])
+    sink = io.BytesIO()
+    exporter = ColumnarExporter(sink)
+    for source, results in (('plan.csv', analysis), ('missing.csv', ERROR), ('plugins.csv', second)):
+        exporter.write(results, source)
+    
+    sink.seek(0)
+    blocks = list(read_columnar(sink))
+    assert [block['source'] for block in blocks] == ['plan.csv', 'missing.csv', 'plugins.csv']
+    assert blocks[1] == {'source': 'missing.csv', 'error': ERROR['error']}
+    for block, results in ((blocks[0], analysis), (blocks[2], second)):
+        assert block['point'] == [result['point'] for result in results['results']]
+        assert block['passed'] == [result['passed'] for result in results['results']]
+        assert block['failed'] == [len(result['failed_tasks']) for result in results['results']]
+        assert block['value'] == [str(result['value']) for result in results['results']]
+        assert block['recommendation'] == [result['recommendation'] or '' for result in results['results']]
+        assert list(zip(block['task_point'], block['unique_id'], block['task'])) == failures(results)
+
+
+def test_columnar_rejects_damaged_files(analysis):
+    sink = io.BytesIO()
+    ColumnarExporter(sink).write(analysis, 'plan.csv')
+    data = sink.getvalue()
+    with pytest.raises(ValueError):
+        list(read_columnar(io.BytesIO(data[:-5])))
+    with pytest.raises(ValueError):
+        list(read_columnar(io.BytesIO(b'NOTDCMA!' + data[8:])))
+
+
+def test_open_exporter_by_extension(tmp_path, analysis):
+    with open_exporter(str(tmp_path / 'results.jsonl')) as exporter:
+        exporter.write(analysis, 'plan.csv')
+    assert exporter.sink.closed
+    assert (tmp_path / 'results.jsonl').read_bytes().startswith(b'{"type":"point"')
+    with open_exporter(str(tmp_path / 'results.DCMAC')) as exporter:
+        assert isinstance(exporter, ColumnarExporter)
+    with pytest.raises(ValueError, match='.xml'):
+        open_exporter(str(tmp_path / 'results.xml'))
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""Import-time and run-time budgets of the command line entry point."""
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time of ``dcma_healthcheck.main`` a pure-analysis CLI run may spend
+IMPORT_BUDGET_MS = 100
+
+# Wall-clock time a ``dcma-check`` run on the bundled sample may take, interpreter start included
+RUN_BUDGET_S = 1.0
+
+# Dependencies only the agents, the vectorized checks and the snapshot cache need
+HEAVY_MODULES = ('numpy', 'openai', 'pydantic')
+
+# Process pool modules only batch mode needs
+POOL_MODULES = ('concurrent.futures.process', 'multiprocessing')
+
+
+def _import_main():
+    """Import ``dcma_healthcheck.main`` in a fresh interpreter.
+
+    Returns its cumulative import time in milliseconds, as reported by
+    ``-X importtime``, and the heavy modules it left in ``sys.modules``.
+    """
+    code = (f"import sys, dcma_healthcheck.main; "
+            f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))")
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, env=env,
+                             capture_output=True, text=True, check=True)
+    cumulative = None
+    for line in process.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package", nested imports indented
+        _, _, times = line.partition('import time:')
+        fields = times.split('|')
+        if len(fields) == 3 and fields[2].strip() == 'dcma_healthcheck.main':
+            cumulative = int(fields[1]) / 1000
+    assert cumulative is not None, process.stderr
+    return cumulative, [name for name in process.stdout.strip().split(',') if name]
+
+
+def _run_sample():
+    """Run ``dcma-check`` without arguments, i.e. on the bundled sample, in a fresh interpreter.
+
+    Returns the wall-clock time of the run in seconds, the names of every
+    module it imported and its output.
+    """
+    code = "import sys; from dcma_healthcheck.main import main; sys.argv[0] = 'dcma-check'; main()"
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    started = time.perf_counter()
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, env=env,
+                             capture_output=True, text=True, check=True)
+    elapsed = time.perf_counter() - started
+    imported = {line.rsplit('|', 1)[-1].strip() for line in process.stderr.splitlines() if 'import time:' in line}
+    return elapsed, imported, process.stdout
+
+
+def test_cli_import_skips_heavy_dependencies():
+    _, loaded = _import_main()
+    assert loaded == []
+
+
+def test_cli_import_time_within_budget():
+    # Best of three, so a busy machine does not fail the budget
+    best = min(_import_main()[0] for _ in range(3))
+    assert best <= IMPORT_BUDGET_MS, f"importing dcma_healthcheck.main took {best:.0f} ms"
+
+
+def test_cli_sample_run_skips_pool_and_heavy_dependencies():
+    _, imported, report = _run_sample()
+    assert report.startswith('DCMA 14-Point Schedule Quality Check Report')
+    assert not imported.intersection(HEAVY_MODULES + POOL_MODULES)
+
+
+def test_cli_sample_run_within_budget():
+    best = min(_run_sample()[0] for _ in range(3))
+    assert best <= RUN_BUDGET_S, f"dcma-check on the sample took {best:.2f} s"
\ No newline at end of file
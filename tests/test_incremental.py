@@ -0,0 +1,19 @@
+"""Incremental sessions keep their state consistent when an update is rejected."""
+import dataclasses
+import pytest
+from dcma_healthcheck.analyzers.dcma_analyzer import DCMAAnalyzer
+
+
+def test_apply_rejects_duplicates_before_changing_anything(schedule_lines):
+    analyzer = DCMAAnalyzer()
+    session = analyzer.start_session(schedule_lines[:100])
+    expected = session.results()
+    
+    export = [dataclasses.replace(line, total_slack=-20.0) for line in schedule_lines[:50]]
+    export += schedule_lines[100:120] + [schedule_lines[0]]
+    with pytest.raises(ValueError, match=schedule_lines[0].unique_id):
+        session.apply(export)
+    assert len(session) == 100
+    assert session.line(schedule_lines[1].unique_id) == schedule_lines[1]
+    assert session.results() == expected
+    assert session.results() == analyzer.analyze_schedule(schedule_lines[:100], fused=False)
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""PDF reports: a well-formed file whose pages read like the text report."""
+import re
+import zlib
+import pytest
+from dcma_healthcheck.analyzers.dcma_analyzer import DCMAAnalyzer
+from dcma_healthcheck.reports.pdf_generator import PDFReportGenerator
+
+TEXT = re.compile(rb'\(((?:\\.|[^\\)])*)\) Tj')
+
+
+def pdf_pages(data):
+    """Text lines of every page in page order, checking the file structure on the way."""
+    assert data.startswith(b'%PDF-1.4\n') and data.endswith(b'%%EOF\n')
+    xref = int(data.rsplit(b'startxref\n', 1)[1].split(b'\n')[0])
+    assert data[xref:].startswith(b'xref\n')
+    size = int(data[xref:].split(b'\n')[1].split()[1])
+    entries = data[xref:].split(b'\n')[3:2 + size]
+    objects = {}
+    for number, entry in enumerate(entries, 1):
+        offset = int(entry.split()[0])
+        assert data[offset:].startswith(b'%d 0 obj\n' % number), number
+        objects[number] = data[offset + len(b'%d 0 obj\n' % number):]
+    
+    catalog = objects[int(data.split(b'/Root ')[1].split()[0])]
+    pages = objects[int(catalog.split(b'/Pages ')[1].split()[0])]
+    kids = [int(kid) for kid in re.findall(rb'(\d+) 0 R', pages.split(b'/Kids [')[1].split(b']')[0])]
+    assert int(pages.split(b'/Count ')[1].split()[0]) == len(kids)
+    
+    text = []
+    for kid in kids:
+        content = objects[int(objects[kid].split(b'/Contents ')[1].split()[0])]
+        length = int(content.split(b'/Length ')[1].split()[0])
+        stream = zlib.decompress(content.split(b'stream\n', 1)[1][:length])
+        text.append([re.sub(rb'\\(.)', rb'\1', match).decode('cp1252') for match in TEXT.findall(stream)])
+    return text
+
+
+@pytest.fixture
+def analysis(schedule_lines):
+    return DCMAAnalyzer().analyze_schedule(schedule_lines)
+
+
+def test_report_pages(tmp_path, analysis):
+    path = str(tmp_path / 'report.pdf')
+    assert PDFReportGenerator().create_pdf_output(analysis, path, source='plan.csv') == path
+    with open(path, 'rb') as file:
+        pages = pdf_pages(file.read())
+    lines = [line for page in pages for line in page]
+    
+    assert lines[:2] == ["DCMA 14-Point Schedule Quality Check Report", "Source: plan.csv"]
+    for result in analysis['results']:
+        assert any(line.startswith(f"Point {result['point']}: {result['description']}") for line in lines)
+    # Characters outside WinAnsi are spelled out
+    assert "Threshold: <= 5%" in lines
+    
+    # Every failed task is listed in the appendix, which starts on a page of its own
+    appendix = next(number for number, page in enumerate(pages) if page[0] == "Appendix: Failed Tasks")
+    listed = [line for page in pages[appendix:] for line in page if line.startswith("- ")]
+    assert len(listed) == sum(len(result['failed_tasks']) for result in analysis['results'])
+    assert all(page[-1] == f"DCMA 14-Point Schedule Quality Check Report - page {number}"
+               for number, page in enumerate(pages, 1))
+
+
+def test_template_override(tmp_path, analysis):
+    (tmp_path / 'report.txt').write_text("# Portfolio review\nFile: $source\n", encoding='utf-8')
+    path = str(tmp_path / 'report.pdf')
+    PDFReportGenerator(str(tmp_path)).create_pdf_output(analysis, path, source='plan.csv')
+    with open(path, 'rb') as file:
+        assert pdf_pages(file.read())[0][:2] == ["Portfolio review", "File: plan.csv"]
+
+
+def test_error_results_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match='not found'):
+        PDFReportGenerator().create_pdf_output({'error': 'File not found: x.csv'}, str(tmp_path / 'x.pdf'))
+
+
+def test_executive_summary(tmp_path):
+    summary = {
+        'executive_summary': "Logic is incomplete.", 'overall_health_score': "62%", 'total_checks': 12,
+        'passed_checks': 8, 'failed_checks': 4, 'risk_assessment': "Finish date at risk.",
+        'recommendations': [{'point_number': 1, 'point_name': "Logic", 'status': "FAIL", 'threshold': "≤ 5%",
+                             'actual_value': "12%", 'priority': None, 'recommendation': "Link open ends."}],
+        'implementation_plan': ["Review open ends", "Re-baseline"],
+    }
+    path = str(tmp_path / 'summary.pdf')
+    PDFReportGenerator().generate_executive_summary(summary, path)
+    with open(path, 'rb') as file:
+        lines = pdf_pages(file.read())[0]
+    assert lines[0] == "DCMA Executive Summary"
+    assert "Priority: -" in lines and "Recommendation: Link open ends." in lines
+    assert lines[-3:-1] == ["1. Review open ends", "2. Re-baseline"]
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""Token-budgeted prompts: compaction stages, truncation and the prompt cache."""
+import pytest
+from dcma_healthcheck.analyzers.dcma_analyzer import DCMAAnalyzer
+from dcma_healthcheck.prompts.dcma_prompts import DCMA_POINTS
+from dcma_healthcheck.prompts.prompt_builder import PromptBuilder, estimate_tokens, source_key
+
+UNLIMITED = 10 ** 6
+
+
+@pytest.fixture
+def analysis(schedule_file):
+    wbs = {}
+    return DCMAAnalyzer().process_csv_file(schedule_file, wbs_index=wbs), wbs
+
+
+def shape(prompt):
+    """Exemplar, WBS branch and recommendation lines in a prompt, and whether it was cut."""
+    lines = prompt.splitlines()
+    return (sum(line.startswith("    - ") for line in lines),
+            sum(line.startswith("  By WBS branch:") for line in lines),
+            sum(line.startswith("  Recommendation:") for line in lines),
+            "[truncated]" in lines)
+
+
+def test_full_prompt_summarises_failures(analysis):
+    results, wbs = analysis
+    prompt = PromptBuilder(UNLIMITED, exemplars=3).build(results, wbs)
+    failed = [result for result in results['results'] if result['passed'] is False and result['failed_tasks']]
+    for result in failed:
+        assert f"  Failed tasks: {len(result['failed_tasks'])}" in prompt
+        assert all(f"    - {task}" in prompt for task in result['failed_tasks'].top(3))
+    assert shape(prompt) == (sum(min(len(result['failed_tasks']), 3) for result in failed), len(failed),
+                             sum(result['passed'] is False for result in results['results']), False)
+    # Only the most severe failures are listed, not every task
+    assert estimate_tokens(prompt) < sum(estimate_tokens(task) for result in failed
+                                         for task in result['failed_tasks'])
+
+
+def test_prompt_fits_every_budget(analysis):
+    results, wbs = analysis
+    full = estimate_tokens(PromptBuilder(UNLIMITED).build(results, wbs))
+    shapes = []
+    for budget in range(full, 200, -25):
+        prompt = PromptBuilder(budget).build(results, wbs)
+        assert estimate_tokens(prompt) <= budget, budget
+        shapes.append(shape(prompt))
+    
+    # Exemplars and branches go first, then recommendations; the text is cut last
+    exemplars, branches, recommendations, truncated = zip(*shapes)
+    assert list(exemplars) == sorted(exemplars, reverse=True) and exemplars[-1] == 0
+    assert list(branches) == sorted(branches, reverse=True) and branches[-1] == 0
+    assert all(count == recommendations[0] for count, cut in zip(recommendations, exemplars) if cut)
+    assert recommendations[-1] == 0
+    assert truncated.index(True) > recommendations.index(0)
+    assert all(truncated[truncated.index(True):])
+
+
+def test_truncation_keeps_whole_lines(analysis):
+    results, wbs = analysis
+    untruncated = PromptBuilder(UNLIMITED, exemplars=0, wbs_groups=0).build(results, wbs)
+    prompt = PromptBuilder(300).build(results, wbs)
+    assert estimate_tokens(prompt) <= 300
+    lines = prompt.splitlines()
+    cut = lines.index("[truncated]")
+    assert cut > 0 and all(line in untruncated.splitlines() for line in lines[:cut])
+    assert "Recommendation:" not in prompt
+
+
+def test_point_prompt_fits_budget(analysis):
+    results, wbs = analysis
+    result = max((result for result in results['results'] if result['passed'] is False),
+                 key=lambda result: len(result['failed_tasks']))
+    full = PromptBuilder(UNLIMITED).build_point(result, wbs)
+    assert f"DCMA Point {result['point']}: {DCMA_POINTS[result['point']]['name']}" in full
+    assert f"Standard guidance: {DCMA_POINTS[result['point']]['recommendation']}" in full
+    for budget in (estimate_tokens(full) - 20, 250):
+        prompt = PromptBuilder(budget).build_point(result, wbs)
+        assert estimate_tokens(prompt) <= budget
+        assert shape(prompt)[0] < shape(full)[0]
+
+
+def test_cached_prompts(analysis, schedule_file):
+    results, wbs = analysis
+    builder = PromptBuilder(cache_size=2)
+    key = source_key(schedule_file)
+    assert key is not None and source_key(schedule_file + '.missing') is None
+    prompt = builder.build(results, wbs, key)
+    assert builder.lookup(key) == prompt
+    # A cached prompt is returned as is, whatever the analysis passed
+    assert builder.build({'results': [], 'summary': {}}, None, key) == prompt
+    
+    builder.build(results, wbs, 'second')
+    builder.lookup(key)
+    builder.build(results, wbs, 'third')
+    assert builder.lookup('second') is None and builder.lookup(key) == prompt
+    builder.clear()
+    assert builder.lookup(key) is None
\ No newline at end of file
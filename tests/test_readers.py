@@ -0,0 +1,226 @@
+"""Round trips of the synthetic schedule through every input format and the snapshot cache."""
+import bz2
+import gc
+import gzip
+import io
+import lzma
+import zipfile
+from datetime import datetime
+from xml.sax.saxutils import escape
+import pytest
+from dcma_healthcheck.analyzers.dcma_analyzer import DCMAAnalyzer
+from dcma_healthcheck.models.field_parsers import DEFAULT_PARSER, FieldParser
+from dcma_healthcheck.models.schedule_network import link_id
+from dcma_healthcheck.readers.formats import detect_format, read_schedule_file
+
+DATE_COLUMNS = {'Start', 'Finish', 'Actual Start', 'Actual Finish', 'Constraint Date'}
+
+# Constraint names of the synthetic schedule in MSPDI and XER codes
+MSPDI_CONSTRAINTS = {'As Soon As Possible': 0, 'As Late As Possible': 1, 'Must Start On': 2,
+                     'Must Finish On': 3, 'Start No Earlier Than': 4}
+XER_CONSTRAINTS = {'As Soon As Possible': '', 'As Late As Possible': 'CS_ALAP', 'Must Start On': 'CS_MANDSTART',
+                   'Must Finish On': 'CS_MANDFIN', 'Start No Earlier Than': 'CS_MSOA'}
+
+# Fields every format carries over unchanged
+COMMON_FIELDS = ('unique_id', 'id', 'task_name', 'percent_complete', 'finish_date', 'actual_start',
+                 'actual_finish', 'duration', 'free_slack', 'total_slack', 'constraint_type')
+
+
+def links(line):
+    return [(link.predecessor_id, link.type, link.lag) for link in line.predecessor_links]
+
+
+def linked_ids(tokens):
+    return [link_id(token) for token in tokens]
+
+
+def assert_same_tasks(lines, expected, fields=COMMON_FIELDS):
+    assert len(lines) == len(expected)
+    for line, original in zip(lines, expected):
+        for name in fields:
+            assert getattr(line, name) == getattr(original, name), (original.unique_id, name)
+        assert links(line) == links(original), original.unique_id
+
+
+def write_xlsx(path, text):
+    """Workbook with the export's cells: dates and percentages as styled numbers, the rest as shared strings."""
+    rows = [row.split('\t') for row in text.splitlines()]
+    header, strings, sheet = rows[0], {}, []
+    for number, row in enumerate(rows, 1):
+        cells = []
+        for column, value in enumerate(row):
+            reference = f"{chr(65 + column // 26 - 1) if column >= 26 else ''}{chr(65 + column % 26)}{number}"
+            day = DEFAULT_PARSER.parse_date(value) if number > 1 and header[column] in DATE_COLUMNS else None
+            if day:
+                cells.append(f'<c r="{reference}" s="1"><v>{(day - datetime(1899, 12, 30)).days}</v></c>')
+            elif number > 1 and header[column] == '% Complete':
+                cells.append(f'<c r="{reference}" s="2"><v>{DEFAULT_PARSER.parse_percentage(value) / 100}</v></c>')
+            elif value:
+                cells.append(f'<c r="{reference}" t="s"><v>{strings.setdefault(value, len(strings))}</v></c>')
+        sheet.append(f'<row r="{number}">{"".join(cells)}</row>')
+    main = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('xl/workbook.xml', f'<workbook xmlns="{main}" xmlns:r="http://schemas.openxmlformats.org/'
+                                            f'officeDocument/2006/relationships"><sheets><sheet name="Tasks" '
+                                            f'sheetId="1" r:id="rId1"/></sheets></workbook>')
+        archive.writestr('xl/_rels/workbook.xml.rels',
+                         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                         '<Relationship Id="rId1" Type="worksheet" Target="worksheets/sheet1.xml"/></Relationships>')
+        archive.writestr('xl/styles.xml', f'<styleSheet xmlns="{main}"><numFmts count="1"><numFmt numFmtId="164" '
+                                          f'formatCode="ddd m/d/yy"/></numFmts><cellXfs count="3"><xf numFmtId="0"/>'
+                                          f'<xf numFmtId="164"/><xf numFmtId="9"/></cellXfs></styleSheet>')
+        archive.writestr('xl/sharedStrings.xml', f'<sst xmlns="{main}">'
+                         + ''.join(f'<si><t>{escape(value)}</t></si>' for value in strings) + '</sst>')
+        archive.writestr('xl/worksheets/sheet1.xml', f'<worksheet xmlns="{main}"><sheetData>{"".join(sheet)}'
+                                                     f'</sheetData></worksheet>')
+
+
+def write_mspdi(path, lines, summary=()):
+    """MS Project XML with the tasks' fields, day lags written in tenths of a minute; ``summary`` tasks are flagged."""
+    unique_ids = {line.id: line.unique_id for line in lines}
+    parts = ['<?xml version="1.0" encoding="UTF-8"?><Project xmlns="http://schemas.microsoft.com/project">'
+             '<MinutesPerDay>480</MinutesPerDay><Tasks>']
+    for line in lines:
+        parts.append(f'<Task><UID>{line.unique_id}</UID><ID>{line.id}</ID><Name>{escape(line.task_name)}</Name>'
+                     f'<WBS>{line.wbs}</WBS><OutlineLevel>2</OutlineLevel>'
+                     f'<Summary>{int(line.unique_id in summary)}</Summary>'
+                     f'<PercentComplete>{line.percent_complete:g}</PercentComplete>')
+        for tag, value in (('Start', line.start_date), ('Finish', line.finish_date), ('ActualStart', line.actual_start),
+                           ('ActualFinish', line.actual_finish), ('ConstraintDate', line.constraint_date)):
+            if value:
+                parts.append(f'<{tag}>{value.isoformat()}</{tag}>')
+        parts.append(f'<Duration>PT{line.duration * 8:g}H0M0S</Duration>'
+                     f'<ConstraintType>{MSPDI_CONSTRAINTS[line.constraint_type]}</ConstraintType>'
+                     f'<TotalSlack>{line.total_slack * 480000:.0f}</TotalSlack>'
+                     f'<FreeSlack>{line.free_slack * 480000:.0f}</FreeSlack>')
+        for link in line.predecessor_links:
+            parts.append(f'<PredecessorLink><PredecessorUID>{unique_ids[link.predecessor_id]}</PredecessorUID>'
+                         f'<Type>{int(link.type)}</Type><LinkLag>{link.lag * 4800:.0f}</LinkLag>'
+                         f'<LagFormat>7</LagFormat></PredecessorLink>')
+        parts.append('</Task>')
+    parts.append('</Tasks></Project>')
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(''.join(parts))
+
+
+def write_xer(path, lines, level_of_effort=()):
+    """P6 export of the tasks on an 8-hour calendar; ``level_of_effort`` rows are typed TT_LOE."""
+    unique_ids = {line.id: line.unique_id for line in lines}
+    timestamp = lambda value: f"{value:%Y-%m-%d %H:%M}" if value else ''
+    rows = ['ERMHDR\t19.12', '%T\tPROJECT', '%F\tproj_id\tlast_recalc_date', '%R\t1\t',
+            '%T\tCALENDAR', '%F\tclndr_id\tday_hr_cnt', '%R\t1\t8',
+            '%T\tTASK', '%F\ttask_id\tclndr_id\ttask_code\ttask_name\ttask_type\tstatus_code\tphys_complete_pct'
+            '\ttotal_float_hr_cnt\tfree_float_hr_cnt\ttarget_drtn_hr_cnt\tact_start_date\tact_end_date'
+            '\tearly_start_date\tearly_end_date\tcstr_type\tcstr_date']
+    for line in lines:
+        task_type = 'TT_LOE' if line.unique_id in level_of_effort else 'TT_Task'
+        status = 'TK_Complete' if line.percent_complete >= 100 else 'TK_Active' if line.actual_start else 'TK_NotStart'
+        rows.append('\t'.join(['%R', line.unique_id, '1', line.id, line.task_name, task_type, status,
+                               f"{line.percent_complete:g}", f"{line.total_slack * 8:g}", f"{line.free_slack * 8:g}",
+                               f"{line.duration * 8:g}", timestamp(line.actual_start), timestamp(line.actual_finish),
+                               timestamp(line.start_date), timestamp(line.finish_date),
+                               XER_CONSTRAINTS[line.constraint_type], timestamp(line.constraint_date)]))
+    rows += ['%T\tTASKPRED', '%F\ttask_id\tpred_task_id\tpred_type\tlag_hr_cnt']
+    for line in lines:
+        for link in line.predecessor_links:
+            rows.append(f"%R\t{line.unique_id}\t{unique_ids[link.predecessor_id]}\tPR_{link.type.name}"
+                        f"\t{link.lag * 8:g}")
+    rows.append('%E')
+    with open(path, 'w', encoding='cp1252') as file:
+        file.write('\n'.join(rows) + '\n')
+
+
+@pytest.mark.parametrize('suffix, compress', [('.gz', gzip.compress), ('.bz2', bz2.compress), ('.xz', lzma.compress)])
+def test_compressed_export(tmp_path, schedule_file, schedule_lines, suffix, compress):
+    path = tmp_path / f"schedule.csv{suffix}"
+    with open(schedule_file, 'rb') as file:
+        path.write_bytes(compress(file.read()))
+    assert detect_format(str(path)) == 'tsv'
+    assert list(read_schedule_file(str(path))) == schedule_lines
+
+
+@pytest.mark.parametrize('compress', [bytes, gzip.compress])
+def test_caller_stream_left_open(schedule_file, schedule_lines, compress):
+    with open(schedule_file, 'rb') as file:
+        stream = io.BytesIO(compress(file.read()))
+    assert list(read_schedule_file(stream, fmt='tsv')) == schedule_lines
+    gc.collect()  # a collected sniffing buffer would close the stream
+    assert not stream.closed
+
+
+def test_xlsx(tmp_path, schedule_file, schedule_lines):
+    path = str(tmp_path / 'schedule.xlsx')
+    with open(schedule_file, encoding='utf-8') as file:
+        write_xlsx(path, file.read())
+    assert list(read_schedule_file(path)) == schedule_lines
+
+
+def test_xlsx_custom_date_formats(tmp_path, schedule_file, schedule_lines):
+    # Date cells are numbers, so they do not depend on the parser's text formats
+    path = str(tmp_path / 'schedule.xlsx')
+    with open(schedule_file, encoding='utf-8') as file:
+        write_xlsx(path, file.read())
+    parser = FieldParser(locale='en_GB', date_formats=('%d.%m.%Y',))
+    assert list(read_schedule_file(path, parser=parser)) == schedule_lines
+
+
+def test_mspdi(tmp_path, schedule_lines):
+    path = str(tmp_path / 'schedule.xml')
+    write_mspdi(path, schedule_lines)
+    lines = list(read_schedule_file(path))
+    assert_same_tasks(lines, schedule_lines, COMMON_FIELDS + ('start_date', 'wbs'))
+    for line, original in zip(lines, schedule_lines):
+        assert linked_ids(line.unique_id_successors) == linked_ids(original.unique_id_successors)
+
+
+def test_mspdi_skips_summary_tasks(tmp_path, schedule_lines):
+    path = str(tmp_path / 'schedule.xml')
+    skipped = {line.unique_id for line in schedule_lines[10:20]}
+    write_mspdi(path, schedule_lines, summary=skipped)
+    lines = list(read_schedule_file(path))
+    assert [line.unique_id for line in lines] == [line.unique_id for line in schedule_lines
+                                                  if line.unique_id not in skipped]
+    for line in lines:
+        assert not skipped.intersection(linked_ids(line.unique_id_predecessors + line.unique_id_successors))
+
+
+def test_xer(tmp_path, schedule_lines):
+    path = str(tmp_path / 'schedule.xer')
+    write_xer(path, schedule_lines)
+    assert_same_tasks(list(read_schedule_file(path)), schedule_lines)
+
+
+def test_xer_skips_level_of_effort(tmp_path, schedule_lines):
+    path = str(tmp_path / 'schedule.xer')
+    skipped = {line.unique_id for line in schedule_lines[10:20]}
+    write_xer(path, schedule_lines, level_of_effort=skipped)
+    lines = list(read_schedule_file(path))
+    assert [line.unique_id for line in lines] == [line.unique_id for line in schedule_lines
+                                                  if line.unique_id not in skipped]
+    for line in lines:
+        assert not skipped.intersection(linked_ids(line.unique_id_predecessors + line.unique_id_successors))
+
+
+def test_snapshot_cache(tmp_path, schedule_file):
+    pytest.importorskip('numpy')
+    from dcma_healthcheck.readers.snapshot_cache import SnapshotCache
+    cache = SnapshotCache(str(tmp_path / 'cache'))
+    analyzer = DCMAAnalyzer(cache=cache)
+    expected = DCMAAnalyzer().process_csv_file(schedule_file)
+    
+    assert analyzer.process_csv_file(schedule_file) == expected
+    assert analyzer.process_csv_file(schedule_file) == expected
+    stats = cache.stats()
+    assert (stats['misses'], stats['hits']) == (1, 1)
+
+
+def test_snapshot_store_and_load(tmp_path, schedule_lines):
+    pytest.importorskip('numpy')
+    from dcma_healthcheck.models.schedule_table import ScheduleTable
+    from dcma_healthcheck.readers.snapshot_cache import SnapshotCache
+    cache = SnapshotCache(str(tmp_path / 'cache'))
+    table = ScheduleTable.from_lines(schedule_lines)
+    cache.store('schedule', table)
+    loaded = cache.load('schedule')
+    assert list(loaded.iter_lines()) == list(table.iter_lines())
+    assert cache.load('missing') is None
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""Streaming text reports: same text as ``generate_report``, written section by section."""
+import io
+import pytest
+from dcma_healthcheck.analyzers.dcma_analyzer import DCMAAnalyzer
+from dcma_healthcheck.reports.report_writer import TITLE, ReportWriter, overall_line
+
+
+class FlushLog(io.StringIO):
+    """Text sink that records what was written before each flush."""
+    
+    def __init__(self):
+        super().__init__()
+        self.flushed = []
+    
+    def flush(self):
+        self.flushed.append(self.getvalue())
+
+
+@pytest.fixture
+def analysis(schedule_lines):
+    return DCMAAnalyzer(check_network=True).analyze_schedule(schedule_lines)
+
+
+def written(analysis, *args, **kwargs):
+    sink = io.StringIO()
+    ReportWriter(sink, *args, **kwargs).write(analysis)
+    return sink.getvalue()
+
+
+@pytest.mark.parametrize('max_failed', [None, 3])
+def test_matches_generate_report(analysis, max_failed):
+    assert written(analysis, max_failed) == DCMAAnalyzer().generate_report(analysis, max_failed) + "\n"
+
+
+def test_caps_list_the_most_severe_and_count_the_rest(analysis):
+    failing = next(result for result in analysis['results'] if len(result['failed_tasks']) > 2)
+    point, failed_tasks = failing['point'], failing['failed_tasks']
+    
+    lines = written(analysis, {point: 2}).splitlines()
+    section = lines[lines.index(f"Point {point}: {failing['description']} - FAIL"):]
+    listed = section[section.index("  Failed Tasks:") + 1:][:3]
+    assert listed == [f"    - {task}" for task in failed_tasks.top(2)] + [
+        f"    ... and {len(failed_tasks) - 2} more"]
+    
+    # Points without a cap of their own list every failure
+    other = next(result for result in analysis['results']
+                 if result['point'] != point and len(result['failed_tasks']) > 2)
+    assert f"    - {other['failed_tasks'][-1]}" in lines
+
+
+def test_flushes_after_each_section(analysis):
+    sink = FlushLog()
+    ReportWriter(sink).write(analysis)
+    assert len(sink.flushed) == len(analysis['results']) + 2
+    assert sink.flushed[0].startswith(TITLE) and "Point 1:" not in sink.flushed[0]
+    assert sink.flushed[1].endswith("\n\n") and "Point 2:" not in sink.flushed[1]
+    assert sink.flushed[-1] == sink.getvalue()
+
+
+def test_summary_last_counts_the_points_written(analysis):
+    sink = io.StringIO()
+    writer = ReportWriter(sink, summary_first=False)
+    writer.begin()
+    for result in analysis['results']:
+        writer.write_result(result)
+    writer.end()
+    summary = analysis['summary']
+    expected = overall_line(summary['passed_checks'], summary['total_checks'])
+    lines = sink.getvalue().splitlines()
+    assert lines[-2:] == [expected, ""]
+    assert expected not in lines[:-2]
+
+
+def test_summary_first_needs_the_summary():
+    with pytest.raises(ValueError):
+        ReportWriter(io.StringIO()).begin()
+
+
+def test_error_result():
+    assert written({'error': "File not found: plan.csv"}) == "Error: File not found: plan.csv\n"
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""Persistent LLM response cache: keys, expiry and least-recently-used eviction."""
+import os
+import pytest
+from dcma_healthcheck.agents import response_cache
+from dcma_healthcheck.agents.response_cache import ResponseCache
+
+pytest.importorskip('pydantic')
+from dcma_healthcheck.models.dcma_models import DCMAAnalysisResponse  # noqa: E402
+
+REQUEST = ('gpt-4o', "You are a scheduler.", "Analyze these results", 0.2, 1500)
+
+
+def response(summary="Logic is incomplete."):
+    return DCMAAnalysisResponse.model_validate({
+        'executive_summary': summary, 'overall_health_score': "62%", 'total_checks': 12, 'passed_checks': 8,
+        'failed_checks': 4, 'risk_assessment': "Finish date at risk.", 'implementation_plan': ["Link open ends"],
+        'recommendations': [{'point_number': 1, 'point_name': "Logic", 'status': "FAIL", 'threshold': "≤ 5%",
+                             'actual_value': "12%", 'recommendation': "Link open ends.", 'priority': "HIGH"}],
+    })
+
+
+class Clock:
+    """Stand-in for the ``time`` module with a settable ``time()``."""
+    
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+    
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache, 'time', clock)
+    return clock
+
+
+def test_key_covers_the_whole_request(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    key = cache.key(*REQUEST)
+    assert key == ResponseCache(str(tmp_path / 'other')).key(*REQUEST)
+    for position, changed in enumerate(['gpt-4o-mini', "Be brief.", "Analyze this", 0.3, 1000]):
+        request = list(REQUEST)
+        request[position] = changed
+        assert cache.key(*request) != key, position
+
+
+def test_store_and_load(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    key = cache.key(*REQUEST)
+    assert cache.load(key) is None
+    cache.store(key, response())
+    assert cache.load(key) == response()
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'expired': 0, 'hit_rate': 0.5}
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.tmp')] == []
+
+
+def test_expired_entries_are_misses_and_removed(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path), ttl=3600)
+    key = cache.key(*REQUEST)
+    cache.store(key, response())
+    clock.now += 3600
+    assert cache.load(key) == response()
+    clock.now += 1
+    assert cache.load(key) is None
+    assert not os.path.exists(cache._entry_path(key))
+    assert (cache.stats()['expired'], cache.stats()['misses']) == (1, 1)
+
+
+def test_unreadable_entries_are_misses_and_removed(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    key = cache.key(*REQUEST)
+    with open(cache._entry_path(key), 'w', encoding='utf-8') as file:
+        file.write('{"created": 1, "response": {"executive_summary": ')
+    assert cache.load(key) is None
+    assert not os.path.exists(cache._entry_path(key))
+    assert cache.stats()['expired'] == 0
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    keys = [cache.key(model, *REQUEST[1:]) for model in ('a', 'b', 'c')]
+    for key in keys[:2]:
+        cache.store(key, response())
+    for age, key in enumerate(keys[:2]):
+        os.utime(cache._entry_path(key), (1000 + age, 1000 + age))
+    
+    # Reading the older entry makes the other one the least recently used
+    assert cache.load(keys[0]) is not None
+    # Room for two entries, whatever digits their timestamps have
+    cache.max_bytes = sum(os.path.getsize(cache._entry_path(key)) for key in keys[:2]) + 100
+    cache.store(keys[2], response())
+    assert os.path.exists(cache._entry_path(keys[0]))
+    assert not os.path.exists(cache._entry_path(keys[1]))
+    assert cache.load(keys[2]) == response()
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""Streamed responses: the same events however the JSON text is split into deltas."""
+import json
+import random
+import pytest
+
+pytest.importorskip('pydantic')
+from dcma_healthcheck.agents.stream_parser import ResponseStreamParser, response_events  # noqa: E402
+from dcma_healthcheck.models.dcma_models import DCMAAnalysisResponse, DCMARecommendation  # noqa: E402
+
+# Strings full of JSON syntax, escapes and characters outside ASCII
+RESPONSE = DCMAAnalysisResponse(
+    executive_summary='Logic is incomplete: {"open ends": [1, 2]}, see "Point 1" \\ notes.',
+    overall_health_score="62%", total_checks=12, passed_checks=8, failed_checks=4,
+    recommendations=[
+        DCMARecommendation(point_number=1, point_name="Logic", status="FAIL", threshold="≤ 5%",
+                           actual_value="12%", recommendation="Link open ends, then re-run [all] checks.",
+                           priority="HIGH"),
+        DCMARecommendation(point_number=6, point_name="Hard Constraints", status="FAIL", threshold="≤ 5%",
+                           actual_value="8%", recommendation="Remove 'Must Start On' dates.", priority="MEDIUM",
+                           fallback=True),
+    ],
+    implementation_plan=["Review open ends, one by one", "Re-baseline\nwith sign-off", "Tab\there, quote \"there\""],
+    risk_assessment="Finish date at risk } ] ,")
+
+
+def parse(chunks):
+    parser = ResponseStreamParser()
+    return [event for chunk in chunks for event in parser.feed(chunk)]
+
+
+def split(text, sizes):
+    chunks, position = [], 0
+    while position < len(text):
+        size = next(sizes)
+        chunks.append(text[position:position + size])
+        position += size
+    return chunks
+
+
+@pytest.mark.parametrize('indent', [None, 2])
+def test_events_do_not_depend_on_the_split(indent):
+    text = json.dumps(RESPONSE.model_dump(), indent=indent, ensure_ascii=bool(indent))
+    expected = list(response_events(RESPONSE))
+    assert parse([text]) == expected
+    for size in (1, 2, 3, 7, 64):
+        assert parse(split(text, iter(lambda: size, None))) == expected, size
+    rng = random.Random(3)
+    for _ in range(20):
+        assert parse(split(text, iter(lambda: rng.randint(1, 12), None))) == expected
+
+
+def test_items_are_reported_as_soon_as_they_close():
+    text = RESPONSE.model_dump_json()
+    parser = ResponseStreamParser()
+    # The separator after the first recommendation completes it
+    first_end = text.index('"fallback":false},') + len('"fallback":false},')
+    events = parser.feed(text[:first_end - 1])
+    assert [field for field, _ in events] == ['executive_summary', 'overall_health_score', 'total_checks',
+                                             'passed_checks', 'failed_checks']
+    assert parser.feed(text[first_end - 1:first_end]) == [('recommendations', RESPONSE.recommendations[0])]
+    
+    steps = [event for event in parser.feed(text[first_end:text.index('"risk_assessment"')])
+             if event[0] == 'implementation_plan']
+    assert [step for _, step in steps] == RESPONSE.implementation_plan
+    assert parser.feed(text[text.index('"risk_assessment"'):]) == [('risk_assessment',
+                                                                     RESPONSE.risk_assessment)]
+
+
+def test_empty_lists_and_field_order():
+    response = RESPONSE.model_copy(update={'recommendations': [], 'implementation_plan': []})
+    fields = dict(reversed(list(response.model_dump().items())))
+    events = parse(split(json.dumps(fields), iter(lambda: 5, None)))
+    assert events == [(field, value) for field, value in fields.items()
+                      if field not in ('recommendations', 'implementation_plan')]
\ No newline at end of file